@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of simplex methods: **python -m src.benchmarks [options]**
+
+Every task of chosen families and sizes is solved by both methods in float and exact (fractional) modes.
+Each run is made in separate process (so it can be stopped by timeout and its memory is measured alone).
+Results (iterations, wall time, peak memory and statistics of solving) are written to JSON file,
+the file of previous run can be given by **--compare** to print how times changed"""
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+import tracemalloc
+from fractions import Fraction
+from src.benchmarks.families import FAMILIES, INFEASIBLE, OPTIMAL, UNBOUNDED
+from src.common.solver_stats import SolverStats
+from src.exceptions.exceptions import InfeasibleTaskError
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+
+METHODS = ["simplex", "artificial"]
+MODES = ["float", "fractional"]
+
+DEFAULT_SIZES = [5, 10, 20]
+DEFAULT_TIMEOUT = 60
+
+def to_json_value(value):
+    if isinstance(value, Fraction):
+        return float(value)
+
+    return value
+
+def create_method(task, method, fractional, stats = None):
+    matrix, func = task.convert(fractional)
+
+    if method == "simplex":
+        return SimplexMethod(matrix = matrix, func = func, fractional = fractional, point = task.point, stats = stats)
+
+    return ArtificialBasisMethod(matrix = matrix, func = func, fractional = fractional, stats = stats)
+
+def status(method):
+    """Returns status of solved task like **python -m src.simplex** does"""
+    return OPTIMAL if method.last_table().first_statement() else UNBOUNDED
+
+def run(task, method_name, fractional):
+    """Solves task twice: without instrumentation to measure time, then with **SolverStats** and **tracemalloc** to measure the rest"""
+    record = {}
+
+    try:
+        method = create_method(task, method_name, fractional)
+
+        start = time.perf_counter()
+        method.auto_solve()
+        record["time"] = time.perf_counter() - start
+
+        record["status"] = status(method)
+        record["p0"] = to_json_value(method.p0()) if record["status"] == OPTIMAL else None
+        record["iterations"] = method.current_iteration()
+
+        stats = SolverStats()
+        method = create_method(task, method_name, fractional, stats)
+
+        tracemalloc.start()
+
+        try:
+            method.auto_solve()
+            record["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        record["stats"] = stats.to_dict()
+        del record["stats"]["messages"]
+    except InfeasibleTaskError:
+        record["status"] = INFEASIBLE
+    except Exception as error:
+        record["status"] = "error"
+        record["error"] = getattr(error, "message", None) or repr(error)
+
+    return record
+
+def worker(connection, family, size, seed, method_name, fractional):
+    task = FAMILIES[family](size, seed)
+    connection.send(run(task, method_name, fractional))
+    connection.close()
+
+def run_with_timeout(family, size, seed, method_name, fractional, timeout):
+    """Runs benchmark in child process, returns its record or record with _timeout_ status"""
+    receiver, sender = multiprocessing.Pipe(duplex = False)
+    process = multiprocessing.Process(target = worker, args = (sender, family, size, seed, method_name, fractional))
+
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+
+    if receiver.poll(timeout):
+        try:
+            record = receiver.recv()
+        except EOFError:
+            record = {"status": "error", "error": "process exited with code {}".format(process.exitcode)}
+    else:
+        record = {"status": "timeout", "time": time.perf_counter() - start}
+
+    if process.is_alive():
+        process.terminate()
+
+    process.join()
+    receiver.close()
+
+    return record
+
+def benchmark(families, sizes, methods, modes, seed, timeout, log = None):
+    """Generator of records for every combination of family, size, method and mode"""
+    for family in families:
+        for size in sizes:
+            task = FAMILIES[family](size, seed)
+
+            for method_name in methods:
+                for mode in modes:
+                    record = {"family": family, "size": size, "shape": task.shape(), "method": method_name, "mode": mode, "expected": task.expected}
+                    record.update(run_with_timeout(family, size, seed, method_name, mode == "fractional", timeout))
+
+                    if log is not None:
+                        log(record)
+
+                    yield record
+
+def key(record):
+    return record["family"], record["size"], record["method"], record["mode"]
+
+def describe(record):
+    line = "{family:<11} {size:>4} {method:<10} {mode:<10} {status:<10}".format(**record)
+
+    if "time" in record:
+        line += " {:>10.4f}s".format(record["time"])
+
+    if "iterations" in record:
+        line += " {:>6} it".format(record["iterations"])
+
+    if record["status"] != record["expected"]:
+        line += "  expected " + record["expected"]
+
+    if "error" in record:
+        line += ": " + record["error"][:80]
+
+    return line
+
+def compare(records, baseline):
+    """Returns lines that compare times of **records** with times of **baseline** records (ratio < 1 - faster now)"""
+    previous = {key(record): record for record in baseline}
+    lines = []
+
+    for record in records:
+        old = previous.get(key(record))
+
+        if old is None or "time" not in old or "time" not in record or old["status"] != record["status"]:
+            continue
+
+        ratio = record["time"]/old["time"] if old["time"] > 0 else float("inf")
+        lines.append("{} {:>10.4f}s -> {:>10.4f}s  x{:.2f}".format(" ".join(str(item) for item in key(record)), old["time"], record["time"], ratio))
+
+    return lines
+
+def parse_list(value, convert = str):
+    return [convert(item) for item in value.split(",") if item]
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "python -m src.benchmarks", description = "Benchmarks of simplex methods on families of tasks")
+    parser.add_argument("--families", default = ",".join(FAMILIES), help = "comma separated families: " + ", ".join(FAMILIES))
+    parser.add_argument("--sizes", default = ",".join(str(size) for size in DEFAULT_SIZES), help = "comma separated sizes of tasks")
+    parser.add_argument("--methods", default = ",".join(METHODS))
+    parser.add_argument("--modes", default = ",".join(MODES))
+    parser.add_argument("--seed", type = int, default = 0, help = "seed of random families (the same seed gives the same tasks)")
+    parser.add_argument("--timeout", type = float, default = DEFAULT_TIMEOUT, help = "seconds for one run")
+    parser.add_argument("--output", default = "benchmark.json", help = "JSON file of results")
+    parser.add_argument("--compare", default = None, help = "JSON file of previous results")
+
+    args = parser.parse_args(argv)
+
+    families = parse_list(args.families)
+    methods = parse_list(args.methods)
+    modes = parse_list(args.modes)
+
+    for name, values, allowed in [("family", families, FAMILIES), ("method", methods, METHODS), ("mode", modes, MODES)]:
+        for value in values:
+            if value not in allowed:
+                parser.error("unknown {}: {}".format(name, value))
+
+    records = list(benchmark(families, parse_list(args.sizes, int), methods, modes, args.seed, args.timeout, log = lambda record: print(describe(record), flush = True)))
+
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "timeout": args.timeout,
+        "results": records,
+    }
+
+    with open(args.output, "w") as file:
+        json.dump(result, file, indent = 4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+        for line in compare(records, baseline):
+            print(line)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
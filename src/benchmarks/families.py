@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""Parameterized families of linear programming tasks for benchmarks.
+
+Every generator returns **BenchmarkTask**: matrix of equality constraints (free member is the last column, all free members are non-negative),
+goal function that is minimized, basis point for **SimplexMethod** (None if there is no obvious feasible basis) and expected status.
+Values are integers, they are converted to floats or fractions by **BenchmarkTask.convert**"""
+import random
+from fractions import Fraction
+
+OPTIMAL = "optimal"
+UNBOUNDED = "unbounded"
+INFEASIBLE = "infeasible"
+
+class BenchmarkTask:
+    def __init__(self, family, size, matrix, func, point = None, expected = OPTIMAL):
+        self.family = family
+        self.size = size
+        self.matrix = matrix
+        self.func = func
+        self.point = point
+        self.expected = expected
+
+    def shape(self):
+        """Returns **[rows, variables]** of the matrix"""
+        return [len(self.matrix), len(self.matrix[0]) - 1]
+
+    def convert(self, fractional):
+        """Returns copies of matrix and goal function with fractions (exact mode) or floats"""
+        convert = Fraction if fractional else float
+
+        return [[convert(item) for item in row] for row in self.matrix], [convert(item) for item in self.func]
+
+def with_slacks(rows, free_member):
+    """Returns matrix of constraints **rows*x <= free_member** with slack variables and basis point of slacks"""
+    row_number, variables_number = len(rows), len(rows[0])
+
+    matrix = [row + [1 if k == i else 0 for k in range(row_number)] + [free_value] for i, (row, free_value) in enumerate(zip(rows, free_member))]
+    point = [0 for _ in range(variables_number)] + [1 for _ in range(row_number)]
+
+    return matrix, point
+
+def dense(size, seed = 0):
+    """Random dense task **max c*x, A*x <= b** with **size** rows and **2*size** variables (positive **A**, so task is bounded)"""
+    generator = random.Random(seed)
+    rows = [[generator.randint(1, 9) for _ in range(2*size)] for _ in range(size)]
+    free_member = [generator.randint(10*size, 50*size) for _ in range(size)]
+
+    matrix, point = with_slacks(rows, free_member)
+    func = [-generator.randint(1, 9) for _ in range(2*size)] + [0 for _ in range(size)]
+
+    return BenchmarkTask("dense", size, matrix, func, point)
+
+def sparse(size, seed = 0, density = 0.05):
+    """Random sparse task like **dense** with **size** rows and **4*size** variables, about **density** of matrix values are not zero
+    (every variable has at least one positive coefficient, so task is bounded)"""
+    generator = random.Random(seed)
+    variables_number = 4*size
+    rows = [[0 for _ in range(variables_number)] for _ in range(size)]
+
+    for j in range(variables_number):
+        rows[generator.randrange(size)][j] = generator.randint(1, 9)
+
+        for i in range(size):
+            if generator.random() < density:
+                rows[i][j] = generator.randint(1, 9)
+
+    free_member = [generator.randint(10, 100) for _ in range(size)]
+
+    matrix, point = with_slacks(rows, free_member)
+    func = [-generator.randint(1, 9) for _ in range(variables_number)] + [0 for _ in range(size)]
+
+    return BenchmarkTask("sparse", size, matrix, func, point)
+
+def klee_minty(size, seed = 0):
+    """Klee-Minty cube of dimension **size**: **max sum(2^(n-j)*x[j])**, **2*sum(2^(i-j)*x[j], j < i) + x[i] <= 5^i**.
+    Dantzig's rule visits all **2^n** vertices"""
+    rows = [[2**(i - j + 1) if j < i else (1 if j == i else 0) for j in range(size)] for i in range(size)]
+    free_member = [5**(i + 1) for i in range(size)]
+
+    matrix, point = with_slacks(rows, free_member)
+    func = [-2**(size - j - 1) for j in range(size)] + [0 for _ in range(size)]
+
+    return BenchmarkTask("klee_minty", size, matrix, func, point)
+
+def assignment(size, seed = 0):
+    """Assignment task **size x size** with random costs: every basis has only **size** non-zero values of **2*size - 1**,
+    so the task is highly degenerate. The last column constraint is dropped because it follows from the others"""
+    generator = random.Random(seed)
+    variables_number = size*size
+
+    matrix = []
+
+    for i in range(size):
+        matrix.append([1 if k // size == i else 0 for k in range(variables_number)] + [1])
+
+    for j in range(size - 1):
+        matrix.append([1 if k % size == j else 0 for k in range(variables_number)] + [1])
+
+    func = [generator.randint(1, 20) for _ in range(variables_number)]
+
+    return BenchmarkTask("assignment", size, matrix, func)
+
+def transport(size, seed = 0):
+    """Balanced transportation task with **size** suppliers and **size + size//2** consumers.
+    Supplies are sums of groups of demands, so many bases are degenerate. The last demand constraint is dropped"""
+    generator = random.Random(seed)
+    consumers = size + size//2
+
+    demands = [generator.randint(1, 5)*10 for _ in range(consumers)]
+    bounds = sorted(generator.sample(range(1, consumers), size - 1)) if size > 1 else []
+    supplies = [sum(demands[start:end]) for start, end in zip([0] + bounds, bounds + [consumers])]
+
+    variables_number = size*consumers
+    matrix = []
+
+    for i, supply in enumerate(supplies):
+        matrix.append([1 if k // consumers == i else 0 for k in range(variables_number)] + [supply])
+
+    for j, demand in enumerate(demands[:-1]):
+        matrix.append([1 if k % consumers == j else 0 for k in range(variables_number)] + [demand])
+
+    func = [generator.randint(1, 20) for _ in range(variables_number)]
+
+    return BenchmarkTask("transport", size, matrix, func)
+
+def infeasible(size, seed = 0):
+    """Task with **size** constraints **x[j] <= 1** and constraint **sum(x) >= 2*size**, they can not hold together"""
+    rows = [[1 if j == i else 0 for j in range(size)] for i in range(size)]
+    matrix, point = with_slacks(rows, [1 for _ in range(size)])
+
+    # sum(x) - s = 2*size, избыточная переменная не может быть базисной: базиса из дополнительных переменных нет
+    matrix = [row[:-1] + [0] + row[-1:] for row in matrix]
+    matrix.append([1 for _ in range(size)] + [0 for _ in range(size)] + [-1, 2*size])
+
+    func = [-1 for _ in range(size)] + [0 for _ in range(size + 1)]
+
+    return BenchmarkTask("infeasible", size, matrix, func, expected = INFEASIBLE)
+
+def unbounded(size, seed = 0):
+    """Random dense task like **dense**, but the first variable has non-positive coefficients, so goal function is not bounded"""
+    generator = random.Random(seed)
+    rows = [[-generator.randint(0, 9) if j == 0 else generator.randint(1, 9) for j in range(2*size)] for _ in range(size)]
+    free_member = [generator.randint(10*size, 50*size) for _ in range(size)]
+
+    matrix, point = with_slacks(rows, free_member)
+    func = [-generator.randint(1, 9) for _ in range(2*size)] + [0 for _ in range(size)]
+
+    return BenchmarkTask("unbounded", size, matrix, func, point, expected = UNBOUNDED)
+
+FAMILIES = {
+    "dense": dense,
+    "sparse": sparse,
+    "klee_minty": klee_minty,
+    "assignment": assignment,
+    "transport": transport,
+    "infeasible": infeasible,
+    "unbounded": unbounded,
+}
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
-import pickle
+import gzip
+import os
+from src.common.lp_format import read_lp, write_lp
+from src.common.mps_format import read_mps, write_mps
+from src.common.task_file import dump_task, load_task
+
+MODEL_EXTENSIONS = {".mps": "mps", ".lp": "lp"}
 
 def read_matrix_from_file(file):
     try:
@@ -31,17 +37,19 @@ def read_func_from_file(file):
     except:
         return None
 
-def dump_task_to_file(file, task):
+def dump_task_to_file(file, task, compressed = False):
+    """Writes task to binary file (see **task_file**), **compressed** - records are compressed by zlib"""
     try:
-        pickle.dump(task, file)
+        dump_task(file, task, compressed)
 
         return True
     except:
         return False
 
 def load_task_from_file(file):
+    """Returns **StoredTask** that reads tables from binary file on demand (file must stay open)"""
     try:
-        data = pickle.load(file)
+        data = load_task(file)
 
         return data
     except:
@@ -62,3 +70,33 @@ def dump_func_to_file(file, func):
         return True
     except:
         return False
+
+def model_format(path):
+    """Returns _mps_ or _lp_ by extension of model file (**.gz** is allowed) or None"""
+    name = path[:-3] if path.endswith(".gz") else path
+
+    return MODEL_EXTENSIONS.get(os.path.splitext(name)[1].lower())
+
+def open_model_file(path, mode = "r"):
+    """Opens model file as text, **.gz** files are decompressed on the fly"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t")
+
+    return open(path, mode)
+
+def read_model_from_file(path, fractional = False, fixed = False):
+    """Reads **LinearProgram** from MPS (**fixed** - fixed MPS) or LP file line by line.
+    Errors of format are raised as **ModelFormatError** with line number"""
+    with open_model_file(path) as file:
+        if model_format(path) == "lp":
+            return read_lp(file, fractional)
+
+        return read_mps(file, fractional, fixed)
+
+def dump_model_to_file(path, program, fixed = False):
+    """Writes **LinearProgram** to MPS or LP file (by extension of **path**)"""
+    with open_model_file(path, "w") as file:
+        if model_format(path) == "lp":
+            write_lp(file, program)
+        else:
+            write_mps(file, program, fixed)
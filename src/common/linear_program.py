@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+from src.common.sparse_matrix import SparseMatrix, prepare_storage
+from src.simplex.bounds import Bounds
+
+EQUAL = "E"
+LESS = "L"
+GREATER = "G"
+
+SENSES = [EQUAL, LESS, GREATER]
+
+class LinearProgram:
+    """Linear program as it is written in model files (MPS, CPLEX LP):
+    **min (max) c*x + constant**, rows **a_i*x (=, <=, >=) rhs_i** with optional ranges, bounds of named variables.
+    Rows are stored sparse (dict **{column_index: value}** per row), None bound means infinite one"""
+
+    def __init__(self, name = None, fractional = False):
+        self.__name = name
+        self.__zero = 0 if fractional else 0.0
+        self.__fractional = fractional
+        self.__maximize = False
+        self.__objective_name = None
+        self.__constant = self.__zero
+
+        self.__variable_names = []
+        self.__variable_indices = {}
+        self.__costs = []
+        self.__lower = []
+        self.__upper = []
+
+        self.__row_names = []
+        self.__row_indices = {}
+        self.__rows = []
+        self.__senses = []
+        self.__rhs = []
+        self.__ranges = {}
+
+    def name(self):
+        return self.__name
+
+    def set_name(self, name):
+        self.__name = name
+
+    def is_fractional(self):
+        return self.__fractional
+
+    def is_maximize(self):
+        return self.__maximize
+
+    def set_maximize(self, maximize):
+        self.__maximize = maximize
+
+    def objective_name(self):
+        return self.__objective_name
+
+    def set_objective_name(self, name):
+        self.__objective_name = name
+
+    def constant(self):
+        """Returns constant term of goal function"""
+        return self.__constant
+
+    def set_constant(self, value):
+        self.__constant = value
+
+    def add_variable(self, name):
+        """Returns index of variable **name**, new variable (cost 0, bounds **0 <= x**) is added if there is no such variable"""
+        index = self.__variable_indices.get(name)
+
+        if index is None:
+            index = len(self.__variable_names)
+            self.__variable_indices[name] = index
+            self.__variable_names.append(name)
+            self.__costs.append(self.__zero)
+            self.__lower.append(self.__zero)
+            self.__upper.append(None)
+
+        return index
+
+    def variable_index(self, name):
+        """Returns index of variable **name** or None"""
+        return self.__variable_indices.get(name)
+
+    def variable_names(self):
+        return self.__variable_names
+
+    def variables_number(self):
+        return len(self.__variable_names)
+
+    def costs(self):
+        return self.__costs
+
+    def set_cost(self, column, value):
+        self.__costs[column] = value
+
+    def lower(self):
+        """Returns lower bounds of variables (None - not bounded below)"""
+        return self.__lower
+
+    def upper(self):
+        """Returns upper bounds of variables (None - not bounded above)"""
+        return self.__upper
+
+    def set_lower(self, column, value):
+        self.__lower[column] = value
+
+    def set_upper(self, column, value):
+        self.__upper[column] = value
+
+    def add_row(self, name, sense):
+        """Adds empty row **name** with sense _E_, _L_ or _G_ and zero right hand side. Returns its index"""
+        index = len(self.__row_names)
+        self.__row_indices[name] = index
+        self.__row_names.append(name)
+        self.__rows.append({})
+        self.__senses.append(sense)
+        self.__rhs.append(self.__zero)
+
+        return index
+
+    def row_index(self, name):
+        """Returns index of row **name** or None"""
+        return self.__row_indices.get(name)
+
+    def row_names(self):
+        return self.__row_names
+
+    def rows_number(self):
+        return len(self.__row_names)
+
+    def rows(self):
+        """Returns rows as dicts **{column_index: value}** (not copies)"""
+        return self.__rows
+
+    def senses(self):
+        return self.__senses
+
+    def rhs(self):
+        return self.__rhs
+
+    def set_coefficient(self, row, column, value):
+        if value == 0:
+            self.__rows[row].pop(column, None)
+        else:
+            self.__rows[row][column] = value
+
+    def set_rhs(self, row, value):
+        self.__rhs[row] = value
+
+    def ranges(self):
+        """Returns dict that maps index of row to its range (MPS **RANGES** value)"""
+        return self.__ranges
+
+    def set_range(self, row, value):
+        self.__ranges[row] = value
+
+    def row_bounds(self, row):
+        """Returns **(lower, upper)** of **a_i*x** for row (None - infinite bound)"""
+        sense, rhs = self.__senses[row], self.__rhs[row]
+        value = self.__ranges.get(row)
+
+        if value is None:
+            return {EQUAL: (rhs, rhs), LESS: (None, rhs), GREATER: (rhs, None)}[sense]
+
+        if sense == EQUAL:
+            return (rhs, rhs + value) if value >= 0 else (rhs + value, rhs)
+
+        if sense == LESS:
+            return rhs - abs(value), rhs
+
+        return rhs, rhs + abs(value)
+
+    def nonzeros(self):
+        return sum(len(row) for row in self.__rows)
+
+    def to_task(self, sparse = None):
+        """Returns **StandardForm** of the program and its matrix, goal function and bounds for simplex methods"""
+        standard_form = StandardForm(self)
+
+        return (standard_form,) + standard_form.transform(sparse)
+
+class StandardForm:
+    """Conversion of **LinearProgram** to the task **A*x = b, lower <= x <= upper, min c*x** of simplex methods:
+    - inequality rows get slack variables (**+s** for _L_, **-s** for _G_), ranged rows get slack bounded above by width of range;
+    - variables bounded only above are replaced by **y = -x**, free variables are split to **x = x' - x''**;
+    - goal function of maximization is negated.
+    Values of original variables and goal function are restored by **restore** and **objective**"""
+
+    def __init__(self, program):
+        self.__program = program
+        self.__columns = []
+        self.__variables_number = 0
+
+    def transform(self, sparse = None):
+        """Returns matrix (storage is chosen by density if **sparse** is None), goal function and bounds (None if they are trivial)"""
+        program = self.__program
+        one = 1 if program.is_fractional() else 1.0
+        zero = one - one
+        sign = -one if program.is_maximize() else one
+
+        # столбцы задачи: (индекс переменной модели, множитель), x = sum(множитель*столбец)
+        column_map = []
+        lower, upper, func = [], [], []
+
+        for j in range(program.variables_number()):
+            low, high, cost = program.lower()[j], program.upper()[j], program.costs()[j]*sign
+            indices = [len(column_map)]
+
+            if low is not None:
+                column_map.append((j, one))
+                lower.append(low)
+                upper.append(high)
+                func.append(cost)
+            elif high is not None:
+                column_map.append((j, -one))
+                lower.append(-high)
+                upper.append(None)
+                func.append(-cost)
+            else:
+                column_map.append((j, one))
+                column_map.append((j, -one))
+                lower += [zero, zero]
+                upper += [None, None]
+                func += [cost, -cost]
+                indices.append(indices[0] + 1)
+
+            self.__columns.append(indices)
+
+        self.__variables_number = len(column_map)
+        multipliers = {}
+
+        for index, (j, multiplier) in enumerate(column_map):
+            multipliers.setdefault(j, []).append((index, multiplier))
+
+        rows, free_member, slacks = [], [], []
+
+        for i, row in enumerate(program.rows()):
+            new_row = {}
+
+            for j, value in row.items():
+                for index, multiplier in multipliers[j]:
+                    new_row[index] = value*multiplier
+
+            row_lower, row_upper = program.row_bounds(i)
+
+            if row_lower is not None and row_upper is not None and row_lower != row_upper:
+                slacks.append((len(rows), one, row_upper - row_lower))
+                free_member.append(row_upper)
+            elif row_lower is None:
+                slacks.append((len(rows), one, None))
+                free_member.append(row_upper)
+            elif row_upper is None:
+                slacks.append((len(rows), -one, None))
+                free_member.append(row_lower)
+            else:
+                free_member.append(row_lower)
+
+            rows.append(new_row)
+
+        for row_index, coefficient, width in slacks:
+            rows[row_index][len(func)] = coefficient
+            lower.append(zero)
+            upper.append(width)
+            func.append(zero)
+
+        free_index = len(func)
+
+        for row, value in zip(rows, free_member):
+            if value != 0:
+                row[free_index] = value
+
+        matrix = prepare_storage(SparseMatrix(rows, free_index + 1), sparse)
+
+        bounds = Bounds(lower, upper)
+
+        if bounds.is_trivial():
+            bounds = None
+
+        return matrix, func, bounds
+
+    def variables_number(self):
+        """Returns the number of structural variables of the task (without slacks)"""
+        return self.__variables_number
+
+    def restore(self, values):
+        """Returns values of variables of the program by values of task variables (like **solution()** of simplex methods)"""
+        result = []
+
+        for indices in self.__columns:
+            value = values[indices[0]]
+
+            if len(indices) == 2:
+                value -= values[indices[1]]
+            elif self.__program.lower()[len(result)] is None:
+                value = -value
+
+            result.append(value)
+
+        return result
+
+    def objective(self, p0):
+        """Returns value of goal function of the program by minimum **p0** of the task"""
+        value = -p0 if self.__program.is_maximize() else p0
+
+        return value + self.__program.constant()
@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+"""Reading and writing of linear programs in CPLEX LP format.
+
+File is read line by line, expressions may continue on next lines. Sections: _Minimize/Maximize_, _Subject To_, _Bounds_,
+_General/Integer_ (variables are only registered: integrality is not supported by simplex methods), _Binary_ (bounds **0 <= x <= 1**), _End_.
+Ranged constraints are written as **name: lower <= expression <= upper**. Quadratic terms, semi-continuous variables and SOS are not supported"""
+import re
+from fractions import Fraction
+from src.common.linear_program import LinearProgram, EQUAL, LESS, GREATER
+from src.common.mps_format import INFINITY, format_number
+from src.exceptions.exceptions import ModelFormatError
+
+OBJECTIVE = "objective"
+CONSTRAINTS = "constraints"
+BOUNDS = "bounds"
+GENERALS = "generals"
+BINARIES = "binaries"
+END = "end"
+
+SECTION_KEYWORDS = [
+    (re.compile(r"(maximize|maximise|maximum|max)\b", re.IGNORECASE), OBJECTIVE, True),
+    (re.compile(r"(minimize|minimise|minimum|min)\b", re.IGNORECASE), OBJECTIVE, False),
+    (re.compile(r"(subject\s+to|such\s+that|s\.t\.|st\.|st)(?=\s|$)", re.IGNORECASE), CONSTRAINTS, None),
+    (re.compile(r"(bounds|bound)\b", re.IGNORECASE), BOUNDS, None),
+    (re.compile(r"(generals|general|gen|integers|integer)\b", re.IGNORECASE), GENERALS, None),
+    (re.compile(r"(binaries|binary|bin)\b", re.IGNORECASE), BINARIES, None),
+    (re.compile(r"(semi-continuous|semis|semi|sos)\b", re.IGNORECASE), None, None),
+    (re.compile(r"end\b", re.IGNORECASE), END, None),
+]
+
+TOKEN = re.compile(r"""\s*(?:
+    (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|
+    (?P<operator><=|=<|>=|=>|<|>|=)|
+    (?P<sign>[+-])|
+    (?P<colon>:)|
+    (?P<name>[A-Za-z_!"\#$%&()/,.;?@'`{}|~][A-Za-z0-9_!"\#$%&()/,.;?@'`{}|~\[\]^]*)|
+    (?P<other>\S))""", re.VERBOSE)
+
+OPERATORS = {"<=": LESS, "=<": LESS, "<": LESS, ">=": GREATER, "=>": GREATER, ">": GREATER, "=": EQUAL}
+
+INFINITE_NAMES = ["inf", "infinity"]
+
+# длина строки записываемого файла ограничена, как того требуют некоторые решатели
+LINE_LENGTH = 255
+
+def tokenize(text, line_number):
+    """Returns list of **(kind, text)** tokens of line"""
+    tokens = []
+    position = 0
+    text = text.rstrip()
+
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        kind = match.lastgroup
+
+        if kind == "other":
+            raise ModelFormatError(line_number, match.group(kind))
+
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+
+    return tokens
+
+class Statement:
+    """Linear expression (objective or constraint) that is filled token by token: **[name:] [value op] terms [op value]**"""
+
+    def __init__(self, one):
+        self.label = None
+        self.terms = []
+        self.constant = one - one
+        self.operators = []
+        self.values = []
+        self.__one = one
+        self.__sign = one
+        self.__coefficient = None
+        self.__tokens = 0
+        self.__after_operator = False
+
+    def __flush(self):
+        """Pending number without variable is constant term (or value of constraint after operator)"""
+        if self.__coefficient is None:
+            return
+
+        value = self.__coefficient*self.__sign
+
+        if self.__after_operator:
+            self.values.append(value)
+        else:
+            self.constant += value
+
+        self.__coefficient = None
+        self.__sign = self.__one
+
+    def add(self, kind, text, value, line_number):
+        """Adds token, **value** is number of _number_ token"""
+        self.__tokens += 1
+
+        if kind == "colon":
+            # метка - имя перед двоеточием в начале выражения
+            if self.__tokens != 2 or len(self.terms) != 1 or self.label is not None:
+                raise ModelFormatError(line_number, text)
+
+            self.label = self.terms.pop()[0]
+            self.__tokens = 0
+        elif kind == "sign":
+            self.__flush()
+
+            if text == "-":
+                self.__sign = -self.__sign
+        elif kind == "number":
+            if self.__coefficient is not None:
+                raise ModelFormatError(line_number, text)
+
+            self.__coefficient = value
+        elif kind == "name":
+            if self.__after_operator:
+                raise ModelFormatError(line_number, text)
+
+            self.terms.append((text, (self.__coefficient if self.__coefficient is not None else self.__one)*self.__sign))
+            self.__coefficient = None
+            self.__sign = self.__one
+        else:
+            self.__flush()
+
+            # "value op" перед выражением - нижняя часть двойного неравенства
+            if len(self.terms) == 0 and len(self.operators) == 0:
+                if self.__tokens == 1:
+                    raise ModelFormatError(line_number, text)
+
+                self.values.append(self.constant)
+                self.constant = self.__one - self.__one
+            else:
+                if self.__after_operator:
+                    raise ModelFormatError(line_number, text)
+
+                self.__after_operator = True
+
+            self.operators.append(OPERATORS[text])
+
+    def is_constraint_complete(self):
+        """Returns **True** when the last operator got its value (the value after operator is the end of constraint)"""
+        if self.__after_operator and self.__coefficient is not None:
+            self.__flush()
+
+        return len(self.terms) > 0 and self.__after_operator and len(self.values) == len(self.operators)
+
+    def finish(self, line_number):
+        self.__flush()
+
+        if self.__tokens > 0 and self.__sign != self.__one:
+            raise ModelFormatError(line_number, "-")
+
+class LpReader:
+    """One pass reader of CPLEX LP file into **LinearProgram**"""
+
+    def __init__(self, fractional = False):
+        self.__fractional = fractional
+        self.__one = 1 if fractional else 1.0
+        self.__program = LinearProgram(fractional = fractional)
+        self.__section = None
+        self.__statement = None
+        self.__has_objective = False
+
+    def read(self, file):
+        """Reads lines of **file** (any iterable of lines) and returns **LinearProgram**"""
+        line_number = 0
+
+        for line_number, line in enumerate(file, 1):
+            line = line.split("\\", 1)[0]
+
+            if line.strip() == "":
+                continue
+
+            line = self.__read_keyword(line.strip(), line_number)
+
+            if self.__section == END:
+                break
+
+            if line.strip() != "":
+                self.__read_line(line, line_number)
+
+        self.__end_section(line_number)
+
+        return self.__program
+
+    def __read_keyword(self, line, line_number):
+        """Switches section if line starts with its keyword. Returns the rest of line"""
+        for pattern, section, maximize in SECTION_KEYWORDS:
+            match = pattern.match(line)
+
+            if match is None:
+                continue
+
+            rest = line[match.end():]
+
+            # имя, совпадающее с ключевым словом, допустимо в начале выражения: за ним следует метка или знак
+            if rest.strip()[:1] in [":", "<", ">", "=", "+", "-"]:
+                continue
+
+            if section is None:
+                raise ModelFormatError(line_number, match.group(0))
+
+            self.__end_section(line_number)
+            self.__section = section
+
+            if section == OBJECTIVE:
+                self.__program.set_maximize(maximize)
+                self.__statement = Statement(self.__one)
+            elif section == CONSTRAINTS:
+                self.__statement = Statement(self.__one)
+
+            return rest
+
+        return line
+
+    def __read_line(self, line, line_number):
+        if self.__section is None:
+            raise ModelFormatError(line_number, line)
+
+        tokens = tokenize(line, line_number)
+
+        if self.__section == BOUNDS:
+            self.__read_bound(tokens, line_number)
+        elif self.__section in [GENERALS, BINARIES]:
+            self.__read_names(tokens, line_number)
+        else:
+            for kind, text in tokens:
+                self.__add_token(kind, text, line_number)
+
+    def __number(self, kind, text, line_number):
+        """Returns value of _number_ token or infinite name, None for other tokens"""
+        if kind == "number":
+            return Fraction(text) if self.__fractional else float(text)
+
+        if kind == "name" and text.lower() in INFINITE_NAMES:
+            return float("inf")
+
+        return None
+
+    def __add_token(self, kind, text, line_number):
+        value = self.__number(kind, text, line_number)
+
+        if value is not None:
+            kind = "number"
+
+        self.__statement.add(kind, text, value, line_number)
+
+        if self.__section == CONSTRAINTS and self.__statement.is_constraint_complete():
+            self.__add_constraint(self.__statement, line_number)
+            self.__statement = Statement(self.__one)
+
+    def __end_section(self, line_number):
+        """Finishes the objective (it ends with section) or checks that the last constraint is complete"""
+        statement = self.__statement
+        self.__statement = None
+
+        if statement is None:
+            return
+
+        statement.finish(line_number)
+
+        if self.__section == OBJECTIVE:
+            self.__add_objective(statement, line_number)
+        elif statement.terms or statement.operators or statement.label is not None:
+            raise ModelFormatError(line_number, statement.label or "")
+
+    def __add_objective(self, statement, line_number):
+        program = self.__program
+
+        if self.__has_objective or statement.operators:
+            raise ModelFormatError(line_number, statement.label or "")
+
+        self.__has_objective = True
+        program.set_objective_name(statement.label)
+        program.set_constant(statement.constant)
+
+        for name, value in statement.terms:
+            column = program.add_variable(name)
+            program.set_cost(column, program.costs()[column] + value)
+
+    def __add_constraint(self, statement, line_number):
+        program = self.__program
+        name = statement.label or "R{}".format(program.rows_number() + 1)
+
+        if len(statement.operators) == 1:
+            sense, rhs, range_value = statement.operators[0], statement.values[0] - statement.constant, None
+        else:
+            # lower <= expression <= upper (или с >=) - ограничение с диапазоном
+            first, second = statement.operators
+
+            if first != second or first == EQUAL:
+                raise ModelFormatError(line_number, name)
+
+            left, right = statement.values[0] - statement.constant, statement.values[1] - statement.constant
+            lower, upper = (left, right) if first == LESS else (right, left)
+            sense, rhs, range_value = GREATER, lower, upper - lower
+
+            if range_value < 0:
+                raise ModelFormatError(line_number, name)
+
+        row = program.add_row(name, sense)
+        program.set_rhs(row, rhs)
+
+        if range_value is not None:
+            program.set_range(row, range_value)
+
+        values = program.rows()[row]
+
+        for variable, value in statement.terms:
+            column = program.add_variable(variable)
+            program.set_coefficient(row, column, values.get(column, 0) + value)
+
+    def __read_bound(self, tokens, line_number):
+        """Reads bound like _x free_, _x >= l_, _x <= u_, _x = v_, _l <= x_, _l <= x <= u_"""
+        program = self.__program
+        items = []
+        sign = 1
+
+        for kind, text in tokens:
+            value = self.__number(kind, text, line_number)
+
+            if kind == "sign":
+                sign = -sign if text == "-" else sign
+            elif value is not None:
+                items.append(("value", value*sign))
+                sign = 1
+            elif kind == "name" or kind == "operator":
+                items.append((kind, text))
+            else:
+                raise ModelFormatError(line_number, text)
+
+        kinds = [kind for kind, _ in items]
+
+        if kinds == ["name", "name"] and items[1][1].lower() == "free":
+            column = program.add_variable(items[0][1])
+            program.set_lower(column, None)
+            program.set_upper(column, None)
+            return
+
+        if kinds == ["name", "operator", "value"]:
+            parts = [(items[0][1], OPERATORS[items[1][1]], items[2][1])]
+        elif kinds == ["value", "operator", "name"]:
+            parts = [(items[2][1], {LESS: GREATER, GREATER: LESS, EQUAL: EQUAL}[OPERATORS[items[1][1]]], items[0][1])]
+        elif kinds == ["value", "operator", "name", "operator", "value"]:
+            reverse = {LESS: GREATER, GREATER: LESS, EQUAL: EQUAL}[OPERATORS[items[1][1]]]
+            parts = [(items[2][1], reverse, items[0][1]), (items[2][1], OPERATORS[items[3][1]], items[4][1])]
+        else:
+            raise ModelFormatError(line_number, " ".join(str(text) for _, text in items))
+
+        for name, sense, value in parts:
+            column = program.add_variable(name)
+            infinite = abs(value) >= INFINITY
+
+            if sense in [GREATER, EQUAL]:
+                program.set_lower(column, None if infinite else value)
+
+            if sense in [LESS, EQUAL]:
+                program.set_upper(column, None if infinite else value)
+
+    def __read_names(self, tokens, line_number):
+        program = self.__program
+        one = self.__one
+
+        for kind, text in tokens:
+            if kind != "name":
+                raise ModelFormatError(line_number, text)
+
+            column = program.add_variable(text)
+
+            if self.__section == BINARIES:
+                program.set_lower(column, one - one)
+                program.set_upper(column, one)
+
+def read_lp(file, fractional = False):
+    """Reads linear program from CPLEX LP **file**"""
+    return LpReader(fractional).read(file)
+
+class LpWriter:
+    """Writer of **LinearProgram** to CPLEX LP file, long expressions are wrapped to lines of **LINE_LENGTH** characters"""
+
+    def __init__(self, file):
+        self.__file = file
+
+    def __write_expression(self, head, terms, tail = ""):
+        if terms and terms[0].startswith("+ "):
+            terms = [terms[0][2:]] + terms[1:]
+
+        line = head
+
+        for term in terms:
+            if len(line) + len(term) + 1 > LINE_LENGTH:
+                self.__file.write(line + "\n")
+                line = "  "
+
+            line += " " + term
+
+        if tail and len(line) + len(tail) + 1 > LINE_LENGTH:
+            self.__file.write(line + "\n")
+            line = "  "
+
+        self.__file.write(line + (" " + tail if tail else "") + "\n")
+
+    @staticmethod
+    def __terms(names, items):
+        terms = []
+
+        for j, value in items:
+            if value == 0:
+                continue
+
+            sign = "-" if value < 0 else "+"
+            value = abs(value)
+            terms.append("{} {}".format(sign, names[j]) if value == 1 else "{} {} {}".format(sign, format_number(value), names[j]))
+
+        return terms
+
+    def write(self, program):
+        file = self.__file
+        names = program.variable_names()
+
+        if program.name():
+            file.write("\\ {}\n".format(program.name()))
+
+        file.write("Maximize\n" if program.is_maximize() else "Minimize\n")
+
+        terms = self.__terms(names, enumerate(program.costs()))
+
+        if program.constant() != 0:
+            terms.append("{} {}".format("-" if program.constant() < 0 else "+", format_number(abs(program.constant()))))
+
+        if not terms and names:
+            terms = ["0 " + names[0]]
+
+        self.__write_expression(" {}:".format(program.objective_name() or "obj"), terms)
+
+        file.write("Subject To\n")
+        written = set(j for j, value in enumerate(program.costs()) if value != 0)
+
+        for i, (name, row) in enumerate(zip(program.row_names(), program.rows())):
+            terms = self.__terms(names, sorted(row.items()))
+            written.update(row)
+
+            if not terms and names:
+                terms = ["0 " + names[0]]
+
+            lower, upper = program.row_bounds(i)
+
+            if lower is not None and upper is not None and lower != upper:
+                self.__write_expression(" {}: {} <=".format(name, format_number(lower)), terms, "<= " + format_number(upper))
+            elif lower is None:
+                self.__write_expression(" {}:".format(name), terms, "<= " + format_number(upper))
+            else:
+                self.__write_expression(" {}:".format(name), terms, "{} {}".format("=" if lower == upper else ">=", format_number(lower)))
+
+        file.write("Bounds\n")
+
+        for j, (name, lower, upper) in enumerate(zip(names, program.lower(), program.upper())):
+            if lower is None and upper is None:
+                file.write(" {} free\n".format(name))
+            elif lower is not None and lower == upper:
+                file.write(" {} = {}\n".format(name, format_number(lower)))
+            elif upper is not None:
+                file.write(" {} <= {} <= {}\n".format("-inf" if lower is None else format_number(lower), name, format_number(upper)))
+            elif lower != 0 or j not in written:
+                # переменная без коэффициентов записывается с границей, чтобы не потеряться
+                file.write(" {} >= {}\n".format(name, format_number(lower)))
+
+        file.write("End\n")
+
+def write_lp(file, program):
+    """Writes **program** to CPLEX LP **file** (names of variables and rows must be valid names of LP format)"""
+    LpWriter(file).write(program)
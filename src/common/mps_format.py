@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""Reading and writing of linear programs in MPS format (free and fixed).
+
+File is read line by line: rows, costs, right hand sides, ranges and bounds are put into **LinearProgram** as they come,
+so the text of file is never kept in memory. Integer markers are skipped (integrality is not supported by simplex methods),
+the first _N_ row is goal function, other _N_ rows are ignored, only the first set of RHS, RANGES and BOUNDS is used"""
+from fractions import Fraction
+from src.common.linear_program import LinearProgram, SENSES
+from src.exceptions.exceptions import ModelFormatError
+
+SECTIONS = ["NAME", "OBJSENSE", "OBJSENS", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"]
+
+# значения с модулем не меньше 1e30 считаются бесконечными, как в большинстве решателей
+INFINITY = 1e30
+
+# границы столбцов полей фиксированного формата MPS
+FIXED_FIELDS = [(1, 3), (4, 12), (14, 22), (24, 36), (39, 47), (49, 61)]
+FIXED_WIDTHS = [2, 8, 8, 12, 8, 12]
+
+BOUNDS_WITH_VALUE = ["UP", "LO", "FX", "LI", "UI"]
+BOUNDS_WITHOUT_VALUE = ["FR", "MI", "PL", "BV"]
+
+def parse_number(text, fractional, line_number):
+    try:
+        return Fraction(text) if fractional else float(text)
+    except (ValueError, ZeroDivisionError):
+        raise ModelFormatError(line_number, text)
+
+def split_fields(line, fixed):
+    """Returns fields of data line: separated by spaces or taken from columns of fixed format (empty fields are kept)"""
+    if not fixed:
+        return line.split()
+
+    return [line[start:end].strip() for start, end in FIXED_FIELDS]
+
+def pairs(fields, line_number):
+    """Returns **(name, value)** pairs of the rest of line like _row value [row value]_"""
+    fields = [field for field in fields if field != ""]
+
+    if len(fields) not in [2, 4]:
+        raise ModelFormatError(line_number, " ".join(fields))
+
+    return [(fields[index], fields[index + 1]) for index in range(0, len(fields), 2)]
+
+class MpsReader:
+    """One pass reader of MPS file into **LinearProgram**"""
+
+    def __init__(self, fractional = False, fixed = False):
+        self.__fractional = fractional
+        self.__fixed = fixed
+        self.__program = LinearProgram(fractional = fractional)
+        self.__section = None
+        self.__rows = {}
+        self.__sets = {}
+        self.__column_name = None
+        self.__column = None
+
+    def read(self, file):
+        """Reads lines of **file** (any iterable of lines) and returns **LinearProgram**"""
+        for line_number, line in enumerate(file, 1):
+            line = line.rstrip("\r\n")
+
+            if line.strip() == "" or line.startswith("*"):
+                continue
+
+            if not line[0].isspace():
+                self.__read_header(line, line_number)
+
+                if self.__section == "ENDATA":
+                    break
+            else:
+                self.__read_data(line, line_number)
+
+        return self.__program
+
+    def __read_header(self, line, line_number):
+        fields = line.split()
+        section = fields[0].upper()
+
+        if section not in SECTIONS:
+            raise ModelFormatError(line_number, line)
+
+        self.__section = section
+
+        if section == "NAME":
+            self.__program.set_name(line[4:].strip() or None)
+        elif section in ["OBJSENSE", "OBJSENS"] and len(fields) > 1:
+            self.__read_sense(fields[1], line_number)
+
+    def __read_sense(self, value, line_number):
+        value = value.upper()
+
+        if value not in ["MAX", "MAXIMIZE", "MIN", "MINIMIZE"]:
+            raise ModelFormatError(line_number, value)
+
+        self.__program.set_maximize(value.startswith("MAX"))
+
+    def __read_data(self, line, line_number):
+        fields = split_fields(line, self.__fixed)
+
+        if self.__section in ["OBJSENSE", "OBJSENS"]:
+            self.__read_sense(line.strip(), line_number)
+        elif self.__section == "ROWS":
+            if len(fields) < 2 or fields[1] == "":
+                raise ModelFormatError(line_number, line)
+
+            self.__read_row(fields[0], fields[1], line_number)
+        elif self.__section == "COLUMNS":
+            self.__read_column(fields, line_number)
+        elif self.__section in ["RHS", "RANGES"]:
+            self.__read_values(fields, line_number)
+        elif self.__section == "BOUNDS":
+            self.__read_bound(fields, line_number)
+        else:
+            raise ModelFormatError(line_number, line)
+
+    def __read_row(self, sense, name, line_number):
+        sense = sense.upper()
+        program = self.__program
+
+        if sense == "N":
+            if program.objective_name() is None:
+                program.set_objective_name(name)
+                self.__rows[name] = -1
+            else:
+                self.__rows[name] = None
+        elif sense in SENSES:
+            self.__rows[name] = program.add_row(name, sense)
+        else:
+            raise ModelFormatError(line_number, sense)
+
+    def __row(self, name, line_number):
+        """Returns index of row **name**, -1 for goal function, None for ignored rows"""
+        try:
+            return self.__rows[name]
+        except KeyError:
+            raise ModelFormatError(line_number, name)
+
+    def __read_column(self, fields, line_number):
+        if self.__fixed:
+            fields = fields[1:]
+
+        # маркеры целочисленных переменных пропускаются
+        if len(fields) > 1 and fields[1].strip("'").upper() == "MARKER":
+            return
+
+        program = self.__program
+
+        # строки одного столбца идут подряд
+        if fields[0] != self.__column_name:
+            self.__column_name = fields[0]
+            self.__column = program.add_variable(fields[0])
+
+        column = self.__column
+        entries = [(fields[1], fields[2])] if len(fields) == 3 else pairs(fields[1:], line_number)
+
+        for name, text in entries:
+            row = self.__row(name, line_number)
+            value = parse_number(text, self.__fractional, line_number)
+
+            if row == -1:
+                program.set_cost(column, value)
+            elif row is not None:
+                program.set_coefficient(row, column, value)
+
+    def __is_first_set(self, name):
+        """Returns **True** if **name** is the first set of values of current section (omitted name fits any set)"""
+        if name is None or name == "":
+            return True
+
+        return self.__sets.setdefault(self.__section, name) == name
+
+    def __read_values(self, fields, line_number):
+        if self.__fixed:
+            name, fields = fields[1], fields[2:]
+        elif len(fields) % 2 == 1:
+            name, fields = fields[0], fields[1:]
+        else:
+            name = None
+
+        if not self.__is_first_set(name):
+            return
+
+        program = self.__program
+
+        for row_name, text in pairs(fields, line_number):
+            row = self.__row(row_name, line_number)
+            value = parse_number(text, self.__fractional, line_number)
+
+            if row == -1:
+                # RHS строки цели - константа с обратным знаком
+                if self.__section == "RHS":
+                    program.set_constant(-value)
+            elif row is not None:
+                if self.__section == "RHS":
+                    program.set_rhs(row, value)
+                else:
+                    program.set_range(row, value)
+
+    def __read_bound(self, fields, line_number):
+        kind = fields[0].upper()
+
+        if kind not in BOUNDS_WITH_VALUE and kind not in BOUNDS_WITHOUT_VALUE:
+            raise ModelFormatError(line_number, kind)
+
+        if self.__fixed:
+            name, column_name, text = fields[1], fields[2], fields[3]
+        else:
+            length = 4 if kind in BOUNDS_WITH_VALUE else 3
+
+            if len(fields) >= length:
+                name, column_name = fields[1], fields[2]
+                text = fields[3] if len(fields) > 3 else ""
+            elif len(fields) == length - 1:
+                name, column_name = None, fields[1]
+                text = fields[2] if len(fields) > 2 else ""
+            else:
+                raise ModelFormatError(line_number, " ".join(fields))
+
+        if not self.__is_first_set(name):
+            return
+
+        program = self.__program
+        column = program.add_variable(column_name)
+        one = 1 if self.__fractional else 1.0
+
+        if kind in BOUNDS_WITHOUT_VALUE:
+            lower, upper = {"FR": (None, None), "MI": (None, program.upper()[column]), "PL": (program.lower()[column], None), "BV": (one - one, one)}[kind]
+            program.set_lower(column, lower)
+            program.set_upper(column, upper)
+            return
+
+        value = parse_number(text, self.__fractional, line_number)
+        infinite = abs(value) >= INFINITY
+
+        if kind in ["UP", "UI"]:
+            # отрицательная верхняя граница при нулевой нижней делает переменную неограниченной снизу
+            if value < 0 and program.lower()[column] == 0:
+                program.set_lower(column, None)
+
+            program.set_upper(column, None if infinite and value > 0 else value)
+        elif kind in ["LO", "LI"]:
+            program.set_lower(column, None if infinite and value < 0 else value)
+        else:
+            program.set_lower(column, value)
+            program.set_upper(column, value)
+
+def read_mps(file, fractional = False, fixed = False):
+    """Reads linear program from MPS **file** (free format by default, **fixed** - columns of fixed format, names may contain spaces)"""
+    return MpsReader(fractional, fixed).read(file)
+
+def format_number(value):
+    """Returns text of value for model files: integers without point, fractions are written as floats"""
+    if isinstance(value, Fraction):
+        if value.denominator == 1:
+            return str(value.numerator)
+
+        value = float(value)
+
+    if isinstance(value, float) and value.is_integer() and abs(value) < INFINITY:
+        return str(int(value))
+
+    return repr(value)
+
+def format_fixed_number(value):
+    """Returns text of value that fits 12 characters of fixed format (precision is reduced if needed)"""
+    text = format_number(value)
+    precision = 12
+
+    while len(text) > 12 and precision > 1:
+        precision -= 1
+        text = "{:.{}g}".format(float(value), precision)
+
+    return text
+
+class MpsWriter:
+    """Writer of **LinearProgram** to MPS file"""
+
+    def __init__(self, file, fixed = False):
+        self.__file = file
+        self.__fixed = fixed
+        self.__line_number = 0
+
+    def __write_header(self, text):
+        self.__line_number += len(text.split("\n"))
+        self.__file.write(text.rstrip() + "\n")
+
+    def __write_line(self, *fields):
+        """Writes data line, **fields** are _code name name value [name value]_"""
+        self.__line_number += 1
+
+        if self.__fixed:
+            for field, width in zip(fields, FIXED_WIDTHS):
+                if len(field) > width:
+                    raise ModelFormatError(self.__line_number, field)
+
+            line = " {:<2} {:<8}  {:<8}  {:<12}   {:<8}  {:<12}".format(*(list(fields) + ["" for _ in range(6 - len(fields))]))
+        else:
+            line = " " + " ".join(field for field in fields if field != "")
+
+        self.__file.write(line.rstrip() + "\n")
+
+    def __number(self, value):
+        return format_fixed_number(value) if self.__fixed else format_number(value)
+
+    def write(self, program):
+        objective = program.objective_name() or "OBJ"
+        names = program.variable_names()
+
+        self.__write_header("NAME          {}".format(program.name() or ""))
+
+        if program.is_maximize():
+            self.__write_header("OBJSENSE\n    MAX")
+
+        self.__write_header("ROWS")
+        self.__write_line("N", objective)
+
+        for name, sense in zip(program.row_names(), program.senses()):
+            self.__write_line(sense, name)
+
+        # матрица записывается по столбцам
+        columns = [[] for _ in names]
+
+        for i, row in enumerate(program.rows()):
+            for j, value in row.items():
+                columns[j].append((i, value))
+
+        self.__write_header("COLUMNS")
+
+        for j, name in enumerate(names):
+            entries = sorted(columns[j])
+
+            if program.costs()[j] != 0:
+                self.__write_line("", name, objective, self.__number(program.costs()[j]))
+            elif len(entries) == 0:
+                self.__write_line("", name, objective, "0")
+
+            for i, value in entries:
+                self.__write_line("", name, program.row_names()[i], self.__number(value))
+
+        self.__write_header("RHS")
+
+        if program.constant() != 0:
+            self.__write_line("", "RHS", objective, self.__number(-program.constant()))
+
+        for name, value in zip(program.row_names(), program.rhs()):
+            if value != 0:
+                self.__write_line("", "RHS", name, self.__number(value))
+
+        if program.ranges():
+            self.__write_header("RANGES")
+
+            for i in sorted(program.ranges()):
+                self.__write_line("", "RNG", program.row_names()[i], self.__number(program.ranges()[i]))
+
+        self.__write_header("BOUNDS")
+
+        for name, lower, upper in zip(names, program.lower(), program.upper()):
+            self.__write_bound(name, lower, upper)
+
+        self.__write_header("ENDATA")
+
+    def __write_bound(self, name, lower, upper):
+        if lower is None and upper is None:
+            self.__write_line("FR", "BND", name)
+            return
+
+        if lower is not None and lower == upper:
+            self.__write_line("FX", "BND", name, self.__number(lower))
+            return
+
+        if lower is None:
+            self.__write_line("MI", "BND", name)
+        elif lower != 0 or (upper is not None and upper < 0):
+            # нулевая нижняя граница записывается явно, иначе отрицательная верхняя граница сделает переменную неограниченной снизу
+            self.__write_line("LO", "BND", name, self.__number(lower))
+
+        if upper is not None:
+            self.__write_line("UP", "BND", name, self.__number(upper))
+
+def write_mps(file, program, fixed = False):
+    """Writes **program** to MPS **file** (free format by default, names must not contain spaces).
+    Fixed format requires names not longer than 8 characters, values are rounded to 12 characters"""
+    MpsWriter(file, fixed).write(program)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import json
+import sys
+import time
+from fractions import Fraction
+
+class SolverStats:
+    """Opt-in instrumentation of solving: time of phases (_gauss_, _artificial_, _main_), counters of events
+    (pivots, bound flips, ties in ratio test), the largest numerator/denominator bit length in exact mode and peak memory of tableau.
+    Messages of methods (like steps of Gauss method) are collected here instead of printing"""
+
+    def __init__(self, echo = False):
+        """Constructor. **echo** - print messages too, as methods did before"""
+        self.__echo = echo
+        self.__times = {}
+        self.__counters = {}
+        self.__values = {}
+        self.__messages = []
+        self.__numerator_bits = 0
+        self.__denominator_bits = 0
+        self.__peak_memory = 0
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Context manager that adds time of its block to phase **name**"""
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.__times[name] = self.__times.get(name, 0) + time.perf_counter() - start
+
+    def count(self, name, number = 1):
+        self.__counters[name] = self.__counters.get(name, 0) + number
+
+    def set_value(self, name, value):
+        """Keeps any other JSON-compatible **value** (like name of pricing rule)"""
+        self.__values[name] = value
+
+    def log(self, message):
+        self.__messages.append(message)
+
+        if self.__echo:
+            print(message)
+
+    def observe_table(self, backend):
+        """Updates sizes of numbers and peak memory by tableau **backend** (called after pivots)"""
+        bits = backend.number_bits()
+
+        if bits is not None:
+            self.__numerator_bits = max(self.__numerator_bits, bits[0])
+            self.__denominator_bits = max(self.__denominator_bits, bits[1])
+
+        self.__peak_memory = max(self.__peak_memory, backend.memory_size())
+
+    def observe_ratio_test(self, backend, row_index, column_index):
+        """Counts choice of pivot row **row_index** in column **column_index** if other rows give the same minimal ratio"""
+        column = backend.column(column_index)
+        free_member = backend.free_member()
+
+        ratio = free_member[row_index]/column[row_index]
+        ties = sum(1 for value, free_value in zip(column, free_member) if value > 0 and free_value/value == ratio)
+
+        if ties > 1:
+            self.count("ratio_test_ties")
+
+    def times(self):
+        """Returns dict of phases times in seconds"""
+        return self.__times
+
+    def counters(self):
+        return self.__counters
+
+    def values(self):
+        return self.__values
+
+    def messages(self):
+        return self.__messages
+
+    def numerator_bits(self):
+        return self.__numerator_bits
+
+    def denominator_bits(self):
+        return self.__denominator_bits
+
+    def peak_memory(self):
+        """Returns the largest size of tableau in bytes"""
+        return self.__peak_memory
+
+    def to_dict(self):
+        return {
+            "times": dict(self.__times),
+            "counters": dict(self.__counters),
+            "values": dict(self.__values),
+            "numerator_bits": self.__numerator_bits,
+            "denominator_bits": self.__denominator_bits,
+            "peak_memory": self.__peak_memory,
+            "messages": list(self.__messages),
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def save(self, path):
+        """Writes statistics to JSON file at **path**"""
+        with open(path, "w") as file:
+            file.write(self.to_json(ensure_ascii = False, indent = 4))
+
+def phase(stats, name):
+    """Returns **stats.phase(name)** or empty context if instrumentation is off (**stats** is None)"""
+    if stats is None:
+        return contextlib.nullcontext()
+
+    return stats.phase(name)
+
+def value_size(value):
+    """Returns size of number in bytes (numerator and denominator of fraction are included)"""
+    if isinstance(value, Fraction):
+        return sys.getsizeof(value) + sys.getsizeof(value.numerator) + sys.getsizeof(value.denominator)
+
+    return sys.getsizeof(value)
+
+def fraction_bits(values):
+    """Returns the largest bit lengths of numerators and denominators of **values**"""
+    numerator_bits, denominator_bits = 0, 0
+
+    for value in values:
+        numerator_bits = max(numerator_bits, abs(value.numerator).bit_length())
+        denominator_bits = max(denominator_bits, value.denominator.bit_length())
+
+    return numerator_bits, denominator_bits
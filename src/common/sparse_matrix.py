@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# матрицы с меньшей долей ненулевых элементов хранятся разреженно
+SPARSE_DENSITY_THRESHOLD = 0.1
+# маленькие матрицы всегда хранятся плотно
+SPARSE_MIN_SIZE = 1000
+
+class SparseMatrix:
+    """Sparse matrix stored as list of rows, each row is dict like **{column_index: nonzero_value}**"""
+
+    def __init__(self, rows = None, column_number = 0):
+        """Constructor. **rows** - list of dicts, **column_number** - width of matrix"""
+        self.__rows = [dict(row) for row in rows] if rows is not None else []
+        self.__column_number = column_number
+
+    @staticmethod
+    def from_dense(matrix):
+        """Creates sparse matrix from list of lists, zeros are skipped"""
+        rows = [{index: value for index, value in enumerate(row) if value != 0} for row in matrix]
+
+        return SparseMatrix(rows, len(matrix[0]) if len(matrix) > 0 else 0)
+
+    def to_dense(self):
+        """Returns matrix as list of lists"""
+        return [self.dense_row(index) for index in range(len(self.__rows))]
+
+    def copy(self):
+        return SparseMatrix(self.__rows, self.__column_number)
+
+    def row_number(self):
+        return len(self.__rows)
+
+    def column_number(self):
+        return self.__column_number
+
+    def nonzeros(self):
+        """Returns the number of stored (nonzero) values"""
+        return sum(len(row) for row in self.__rows)
+
+    def density(self):
+        """Returns the share of nonzero values in matrix"""
+        size = len(self.__rows)*self.__column_number
+
+        return self.nonzeros()/size if size else 0
+
+    def rows(self):
+        """Returns list of rows as dicts (not copies)"""
+        return self.__rows
+
+    def row(self, index):
+        """Returns row at **index** as dict (not copy)"""
+        return self.__rows[index]
+
+    def dense_row(self, index):
+        row = self.__rows[index]
+        return [row.get(column_index, 0) for column_index in range(self.__column_number)]
+
+    def column(self, index):
+        """Returns column at **index** as dict like **{row_index: nonzero_value}**"""
+        return {row_index: row[index] for row_index, row in enumerate(self.__rows) if index in row}
+
+    def value(self, i, j):
+        return self.__rows[i].get(j, 0)
+
+    def set_value(self, i, j, value):
+        if value == 0:
+            self.__rows[i].pop(j, None)
+        else:
+            self.__rows[i][j] = value
+
+    def append_row(self, row):
+        """Appends row given as dict"""
+        self.__rows.append(dict(row))
+
+    def append_column(self, values):
+        """Appends column given as list of values (one per row)"""
+        for row, value in zip(self.__rows, values):
+            if value != 0:
+                row[self.__column_number] = value
+
+        self.__column_number += 1
+
+    def map_values(self, function):
+        """Applies **function** to every stored value"""
+        for row in self.__rows:
+            for key in row:
+                row[key] = function(row[key])
+
+    def __len__(self):
+        return len(self.__rows)
+
+def density(matrix):
+    """Returns the share of nonzero values in matrix given as list of lists or **SparseMatrix**"""
+    if isinstance(matrix, SparseMatrix):
+        return matrix.density()
+
+    size = sum(len(row) for row in matrix)
+
+    return sum(1 for row in matrix for value in row if value != 0)/size if size else 0
+
+def is_sparse_enough(matrix):
+    """Returns **True** if matrix is big and sparse enough to be stored sparse"""
+    if isinstance(matrix, SparseMatrix):
+        size = matrix.row_number()*matrix.column_number()
+    else:
+        size = sum(len(row) for row in matrix)
+
+    return size >= SPARSE_MIN_SIZE and density(matrix) < SPARSE_DENSITY_THRESHOLD
+
+def prepare_storage(matrix, sparse = None):
+    """Returns matrix converted to chosen storage. If **sparse** is None storage is chosen by measured density"""
+    if sparse is None:
+        sparse = is_sparse_enough(matrix)
+
+    if sparse and not isinstance(matrix, SparseMatrix):
+        return SparseMatrix.from_dense(matrix)
+
+    if not sparse and isinstance(matrix, SparseMatrix):
+        return matrix.to_dense()
+
+    return matrix
@@ -0,0 +1,576 @@
+# -*- coding: utf-8 -*-
+"""Binary file of task: header, problem, record of every table (iteration), result and index of records.
+
+Layout (little-endian):
+- header: magic **SMTF**, version, flags (_compressed_), offset of index and the number of tables;
+- records: kind (1 byte), length of payload (4 bytes) and payload (compressed by zlib if flag is set);
+- index - the last record: offsets of problem, result and every table.
+Records are written as tables appear, header is rewritten on close. If file was not closed (there is no index),
+records are found by skipping over them. Numbers are stored exactly: integers and fractions as integers of variable length, floats as 8 bytes"""
+import numbers
+import struct
+import zlib
+from fractions import Fraction
+from src.common.sparse_matrix import SparseMatrix
+from src.exceptions.exceptions import TaskFileError
+from src.simplex.artificial_basis.artificial_basis_table import ArtificialBasisTable
+from src.simplex.backends.sparse_backend import SparseBackend
+from src.simplex.simplex_method.simplex_table import SimplexTable
+
+MAGIC = b"SMTF"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHQQ")
+RECORD = struct.Struct("<BI")
+FLOAT = struct.Struct("<d")
+
+COMPRESSED = 1
+
+PROBLEM = 1
+TABLE = 2
+RESULT = 3
+INDEX = 4
+
+# метки чисел
+NONE_VALUE = 0
+INTEGER_VALUE = 1
+FRACTION_VALUE = 2
+FLOAT_VALUE = 3
+FLOAT_ZERO = 4
+
+TABLE_CLASSES = [SimplexTable, ArtificialBasisTable]
+
+class Encoder:
+    """Writer of values to bytes"""
+
+    def __init__(self):
+        self.__data = bytearray()
+
+    def data(self):
+        return bytes(self.__data)
+
+    def unsigned(self, value):
+        """Writes non-negative integer of any size by 7 bits per byte"""
+        if value < 0x80:
+            self.__data.append(value)
+            return
+
+        while value >= 0x80:
+            self.__data.append((value & 0x7f) | 0x80)
+            value >>= 7
+
+        self.__data.append(value)
+
+    def signed(self, value):
+        self.unsigned(value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+    def boolean(self, value):
+        self.__data.append(1 if value else 0)
+
+    def string(self, value):
+        data = value.encode("utf-8")
+        self.unsigned(len(data))
+        self.__data += data
+
+    def number(self, value):
+        kind = type(value)
+
+        # точные проверки типов быстрее isinstance для самых частых значений
+        if kind is float:
+            if value == 0:
+                self.__data.append(FLOAT_ZERO)
+            else:
+                self.__data.append(FLOAT_VALUE)
+                self.__data += FLOAT.pack(value)
+        elif kind is int or (kind is Fraction and value.denominator == 1):
+            self.__data.append(INTEGER_VALUE)
+            self.signed(int(value))
+        elif kind is Fraction:
+            self.__data.append(FRACTION_VALUE)
+            self.signed(value.numerator)
+            self.unsigned(value.denominator)
+        elif value is None:
+            self.__data.append(NONE_VALUE)
+        elif isinstance(value, (numbers.Integral, Fraction)):
+            self.number(Fraction(value))
+        else:
+            self.number(float(value))
+
+    def numbers(self, values):
+        """Writes list of numbers or None"""
+        self.boolean(values is not None)
+
+        if values is None:
+            return
+
+        self.unsigned(len(values))
+
+        for value in values:
+            self.number(value)
+
+    def indices(self, values):
+        self.unsigned(len(values))
+
+        for value in values:
+            self.unsigned(value)
+
+    def flags(self, values):
+        self.unsigned(len(values))
+        self.__data += bytes(1 if value else 0 for value in values)
+
+    def matrix(self, rows, column_number):
+        """Writes matrix (list of lists or list of dicts of **SparseMatrix**) by nonzero values of rows"""
+        self.unsigned(len(rows))
+        self.unsigned(column_number)
+
+        for row in rows:
+            items = sorted(row.items()) if isinstance(row, dict) else [(index, value) for index, value in enumerate(row) if value != 0]
+            self.unsigned(len(items))
+            previous = -1
+
+            # номера столбцов записываются разностями с предыдущим
+            for index, value in items:
+                self.unsigned(index - previous - 1)
+                self.number(value)
+                previous = index
+
+class Decoder:
+    """Reader of values written by **Encoder**"""
+
+    def __init__(self, data):
+        self.__data = memoryview(data)
+        self.__position = 0
+
+    def unsigned(self):
+        value, shift = 0, 0
+
+        while True:
+            byte = self.__data[self.__position]
+            self.__position += 1
+            value |= (byte & 0x7f) << shift
+            shift += 7
+
+            if byte < 0x80:
+                return value
+
+    def signed(self):
+        value = self.unsigned()
+
+        return value >> 1 if value & 1 == 0 else -((value + 1) >> 1)
+
+    def boolean(self):
+        value = self.__data[self.__position]
+        self.__position += 1
+
+        return value != 0
+
+    def string(self):
+        length = self.unsigned()
+        value = bytes(self.__data[self.__position:self.__position + length]).decode("utf-8")
+        self.__position += length
+
+        return value
+
+    def number(self):
+        tag = self.__data[self.__position]
+        self.__position += 1
+
+        if tag == NONE_VALUE:
+            return None
+
+        if tag == INTEGER_VALUE:
+            return self.signed()
+
+        if tag == FRACTION_VALUE:
+            numerator = self.signed()
+            return Fraction(numerator, self.unsigned())
+
+        if tag == FLOAT_ZERO:
+            return 0.0
+
+        if tag == FLOAT_VALUE:
+            value = FLOAT.unpack_from(self.__data, self.__position)[0]
+            self.__position += FLOAT.size
+            return value
+
+        raise TaskFileError()
+
+    def numbers(self):
+        if not self.boolean():
+            return None
+
+        return [self.number() for _ in range(self.unsigned())]
+
+    def indices(self):
+        return [self.unsigned() for _ in range(self.unsigned())]
+
+    def flags(self):
+        length = self.unsigned()
+        values = [value != 0 for value in self.__data[self.__position:self.__position + length]]
+        self.__position += length
+
+        return values
+
+    def matrix(self, zero = 0, sparse = False):
+        """Reads matrix as list of lists (zeros are **zero**) or as **SparseMatrix**"""
+        row_number, column_number = self.unsigned(), self.unsigned()
+        rows = []
+
+        for _ in range(row_number):
+            row = {} if sparse else [zero for _ in range(column_number)]
+            index = -1
+
+            for _ in range(self.unsigned()):
+                index += self.unsigned() + 1
+                row[index] = self.number()
+
+            rows.append(row)
+
+        return SparseMatrix(rows, column_number) if sparse else rows
+
+def standard_names(variables):
+    """Returns **True** if names are **["x1", ..., "xN", "b"]** (they are not written to file)"""
+    return variables[-1] == "b" and all(name == "x{}".format(index + 1) for index, name in enumerate(variables[:-1]))
+
+def encode_table(table):
+    state = table.state()
+    encoder = Encoder()
+
+    encoder.unsigned(TABLE_CLASSES.index(type(table)))
+    encoder.unsigned(state["iteration_number"])
+
+    variables = state["variables"]
+    encoder.boolean(standard_names(variables))
+
+    if standard_names(variables):
+        encoder.unsigned(len(variables) - 1)
+    else:
+        encoder.unsigned(len(variables))
+
+        for name in variables:
+            encoder.string(name)
+
+    encoder.unsigned(state["variables_number"])
+    encoder.indices(state["basis"])
+    encoder.indices(state["non_basis"])
+    encoder.numbers(state["bounds"])
+    encoder.flags(state["complemented"])
+    encoder.string(state["pricing"])
+    encoder.string(state["backend"])
+    encoder.boolean(state["fractional"])
+
+    pivot = state["pivot"]
+    encoder.boolean(pivot is not None)
+
+    if pivot is not None:
+        encoder.signed(pivot[0])
+        encoder.unsigned(pivot[1])
+
+    rows = state["rows"]
+    encoder.matrix(rows, len(rows[0]) if rows else 0)
+
+    return encoder.data()
+
+def decode_table(data):
+    decoder = Decoder(data)
+    table_class = TABLE_CLASSES[decoder.unsigned()]
+    state = {"iteration_number": decoder.unsigned()}
+
+    if decoder.boolean():
+        state["variables"] = ["x{}".format(index + 1) for index in range(decoder.unsigned())] + ["b"]
+    else:
+        state["variables"] = [decoder.string() for _ in range(decoder.unsigned())]
+
+    state["variables_number"] = decoder.unsigned()
+    state["basis"] = decoder.indices()
+    state["non_basis"] = decoder.indices()
+    state["bounds"] = decoder.numbers()
+    state["complemented"] = decoder.flags()
+    state["pricing"] = decoder.string()
+    state["backend"] = decoder.string()
+    state["fractional"] = decoder.boolean()
+    state["pivot"] = [decoder.signed(), decoder.unsigned()] if decoder.boolean() else None
+    state["rows"] = decoder.matrix(0 if state["fractional"] else 0.0, sparse = state["backend"] == SparseBackend.NAME)
+
+    return table_class.from_state(state)
+
+class TaskWriter:
+    """Writes task of **method** to binary **file** (opened for writing in binary mode and seekable) table by table:
+    **append** writes the next table as soon as it is made, **close** writes result of method and index.
+    Simplex methods create it themselves when they are given **task_file**"""
+
+    def __init__(self, file, method, compressed = False):
+        self.__file = file
+        self.__method = method
+        self.__flags = COMPRESSED if compressed else 0
+        self.__start = file.tell()
+        self.__problem_offset = 0
+        self.__table_offsets = []
+
+        file.write(HEADER.pack(MAGIC, VERSION, self.__flags, 0, 0))
+
+    def __write_problem(self):
+        """Problem is written before the first table: matrix of method is transformed (presolve, scaling) when solving is started"""
+        if self.__problem_offset == 0:
+            self.__problem_offset = self.__write_record(PROBLEM, self.__encode_problem(self.__method))
+
+    def __write_record(self, kind, payload):
+        """Writes record, returns its offset from the beginning of task"""
+        if self.__flags & COMPRESSED:
+            payload = zlib.compress(payload)
+
+        offset = self.__file.tell() - self.__start
+        self.__file.write(RECORD.pack(kind, len(payload)))
+        self.__file.write(payload)
+
+        return offset
+
+    @staticmethod
+    def __encode_problem(method):
+        encoder = Encoder()
+        encoder.string(method.method_name())
+
+        matrix = method.matrix()
+        sparse = isinstance(matrix, SparseMatrix)
+
+        if method.tables_number() > 0:
+            fractional = method.get_table(0).is_fractional()
+        else:
+            fractional = any(isinstance(value, Fraction) for value in method.func())
+
+        encoder.boolean(fractional)
+        encoder.numbers(method.func())
+        encoder.boolean(sparse)
+
+        if sparse:
+            encoder.matrix(matrix.rows(), matrix.column_number())
+        else:
+            encoder.matrix(matrix, len(matrix[0]) if matrix else 0)
+
+        return encoder.data()
+
+    def append(self, table):
+        """Writes the next table"""
+        self.__write_problem()
+        self.__table_offsets.append(self.__write_record(TABLE, encode_table(table)))
+        self.__file.flush()
+
+    def tables_number(self):
+        return len(self.__table_offsets)
+
+    def close(self, method = None):
+        """Writes result of **method** (iteration, p0, solution) if it is given, index and header. File itself is not closed"""
+        self.__write_problem()
+        result_offset = 0
+
+        if method is not None:
+            encoder = Encoder()
+            encoder.signed(method.current_iteration())
+            encoder.boolean(method.can_continue())
+            encoder.number(method.p0())
+            encoder.numbers(method.solution() if method.tables_number() > 0 else None)
+            encoder.string(method.pricing_rule())
+            result_offset = self.__write_record(RESULT, encoder.data())
+
+        encoder = Encoder()
+        encoder.unsigned(self.__problem_offset)
+        encoder.unsigned(result_offset)
+        encoder.indices(self.__table_offsets)
+        index_offset = self.__write_record(INDEX, encoder.data())
+
+        end = self.__file.tell()
+        self.__file.seek(self.__start)
+        self.__file.write(HEADER.pack(MAGIC, VERSION, self.__flags, index_offset, len(self.__table_offsets)))
+        self.__file.seek(end)
+        self.__file.flush()
+
+def dump_task(file, method, compressed = False):
+    """Writes all tables of **method** and its result to binary **file**"""
+    writer = TaskWriter(file, method, compressed)
+
+    for index in range(method.tables_number()):
+        writer.append(method.get_table(index))
+
+    writer.close(method)
+
+class StoredTables:
+    """Sequence of tables of **StoredTask** (tables are read on access)"""
+
+    def __init__(self, task):
+        self.__task = task
+
+    def __len__(self):
+        return self.__task.tables_number()
+
+    def __getitem__(self, index):
+        return self.__task.get_table(index)
+
+class StoredTask:
+    """Task read from binary file. Only header and index are read on opening, tables are read on demand,
+    so the last table of long solving is shown at once. It has methods of simplex methods that are needed to show tables,
+    solving of stored task can not be continued"""
+
+    def __init__(self, file):
+        """Constructor. **file** - binary file opened for reading, it must stay open while tables are read"""
+        self.__file = file
+        self.__start = file.tell()
+
+        data = file.read(HEADER.size)
+
+        if len(data) < HEADER.size:
+            raise TaskFileError()
+
+        magic, version, self.__flags, index_offset, _ = HEADER.unpack(data)
+
+        if magic != MAGIC or version > VERSION:
+            raise TaskFileError()
+
+        self.__cached = None
+        self.__result = None
+
+        if index_offset != 0:
+            kind, payload = self.__read_record(index_offset)
+
+            if kind != INDEX:
+                raise TaskFileError()
+
+            decoder = Decoder(payload)
+            self.__problem_offset = decoder.unsigned()
+            self.__result_offset = decoder.unsigned()
+            self.__table_offsets = decoder.indices()
+        else:
+            self.__scan()
+
+    def __scan(self):
+        """Finds records of file that was not closed by their headers"""
+        self.__problem_offset, self.__result_offset, self.__table_offsets = 0, 0, []
+        offset = HEADER.size
+
+        while True:
+            self.__file.seek(self.__start + offset)
+            data = self.__file.read(RECORD.size)
+
+            if len(data) < RECORD.size:
+                break
+
+            kind, length = RECORD.unpack(data)
+
+            # запись, оборванная на середине, не учитывается
+            if len(self.__file.read(length)) < length:
+                break
+
+            if kind == PROBLEM:
+                self.__problem_offset = offset
+            elif kind == TABLE:
+                self.__table_offsets.append(offset)
+            elif kind == RESULT:
+                self.__result_offset = offset
+
+            offset += RECORD.size + length
+
+    def __read_record(self, offset):
+        self.__file.seek(self.__start + offset)
+        data = self.__file.read(RECORD.size)
+
+        if len(data) < RECORD.size:
+            raise TaskFileError()
+
+        kind, length = RECORD.unpack(data)
+        payload = self.__file.read(length)
+
+        if len(payload) < length:
+            raise TaskFileError()
+
+        if self.__flags & COMPRESSED:
+            payload = zlib.decompress(payload)
+
+        return kind, payload
+
+    def close(self):
+        self.__file.close()
+
+    def problem(self):
+        """Returns **(method_name, fractional, matrix, func)** of stored task"""
+        _, payload = self.__read_record(self.__problem_offset)
+        decoder = Decoder(payload)
+
+        name = decoder.string()
+        fractional = decoder.boolean()
+        func = decoder.numbers()
+        sparse = decoder.boolean()
+        matrix = decoder.matrix(0 if fractional else 0.0, sparse)
+
+        return name, fractional, matrix, func
+
+    def method_name(self):
+        """Returns _simplex_ or _artificial_"""
+        return self.problem()[0]
+
+    def matrix(self):
+        return self.problem()[2]
+
+    def func(self):
+        return self.problem()[3]
+
+    def __read_result(self):
+        """Returns **(iteration, can_continue, p0, solution, pricing)** or None if result is not written"""
+        if self.__result is None and self.__result_offset != 0:
+            _, payload = self.__read_record(self.__result_offset)
+            decoder = Decoder(payload)
+            self.__result = (decoder.signed(), decoder.boolean(), decoder.number(), decoder.numbers(), decoder.string())
+
+        return self.__result
+
+    def tables_number(self):
+        return len(self.__table_offsets)
+
+    def get_table(self, index = 0):
+        if index < 0:
+            index += len(self.__table_offsets)
+
+        if index < 0 or index >= len(self.__table_offsets):
+            raise IndexError(index)
+
+        # последняя прочитанная таблица запоминается: интерфейс часто запрашивает её повторно
+        if self.__cached is None or self.__cached[0] != index:
+            kind, payload = self.__read_record(self.__table_offsets[index])
+
+            if kind != TABLE:
+                raise TaskFileError()
+
+            self.__cached = (index, decode_table(payload))
+
+        return self.__cached[1]
+
+    def last_table(self):
+        return self.get_table(-1)
+
+    def get_tables(self):
+        return StoredTables(self)
+
+    def current_iteration(self):
+        result = self.__read_result()
+
+        return result[0] if result is not None else len(self.__table_offsets) - 1
+
+    def can_continue(self):
+        return False
+
+    def p0(self):
+        result = self.__read_result()
+
+        return result[2] if result is not None else None
+
+    def solution(self):
+        result = self.__read_result()
+
+        return result[3] if result is not None else None
+
+    def pricing_rule(self):
+        result = self.__read_result()
+
+        return result[4] if result is not None else None
+
+def load_task(file):
+    """Opens task written to binary **file** by **dump_task** or **TaskWriter**"""
+    return StoredTask(file)
@@ -172,7 +172,10 @@ class Controller:
         if data is None:
             self.__view.show_error_box("Загрузка...", "В ходе загрузки произошла ошибка...")
         else:
+            # сохранённая задача только просматривается по таблицам
             self.__current_task = data
+            self.__manual = False
+            self.__current_iteration = data.tables_number() - 1
             self.__show_last_table()
             self.__view.disable_forward_button()
 
@@ -19,3 +19,35 @@ class MatrixSizeError(Exception):
 class ParsingValueError(Exception):
     def __init__(self, error_object):
         self.message = "Произошла ошибка при обработке значений " + error_object
+
+class BackendError(Exception):
+    def __init__(self):
+        self.message = "Выбранный вычислительный модуль недоступен для данной задачи"
+
+class InfeasibleTaskError(Exception):
+    def __init__(self):
+        self.message = "Система ограничений задачи несовместна"
+
+class UnsolvedTaskError(Exception):
+    def __init__(self):
+        self.message = "Задача ещё не решена"
+
+class PricingError(Exception):
+    def __init__(self):
+        self.message = "Выбрано неизвестное правило выбора ведущего столбца"
+
+class PresolveError(Exception):
+    def __init__(self):
+        self.message = "Ограничения задачи, сокращённой предварительной обработкой, нельзя изменить"
+
+class ScalingError(Exception):
+    def __init__(self):
+        self.message = "Выбран неизвестный способ масштабирования матрицы"
+
+class ModelFormatError(Exception):
+    def __init__(self, line_number, error_object):
+        self.message = "Ошибка в файле модели в строке {}: {}".format(line_number, error_object)
+
+class TaskFileError(Exception):
+    def __init__(self):
+        self.message = "Файл не является файлом задачи или записан неподдерживаемой версией программы"
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+class ColumnOrder:
+    """Logical order of matrix columns (free member is not included) kept as array of slots.
+    Moving column to the back empties its slot and appends new one, so it costs O(1). Columns are read by logical index
+    through cursor that walks from the previously read position: elimination reads neighbouring positions, so reading is O(1) on average too"""
+
+    def __init__(self, columns, columns_number):
+        """Constructor. **columns** - indices of columns in logical order, **columns_number** - number of all columns"""
+        self.__slots = list(columns)
+        self.__alive = [True for _ in self.__slots]
+        self.__size = len(self.__slots)
+        self.__back = len(self.__slots)
+
+        self.__slot_of = [-1 for _ in range(columns_number)]
+
+        for slot, column in enumerate(self.__slots):
+            self.__slot_of[column] = slot
+
+        # курсор: слот и число непустых слотов перед ним
+        self.__cursor_slot = 0
+        self.__cursor_index = 0
+
+    def __len__(self):
+        return self.__size
+
+    def __getitem__(self, index):
+        """Returns column at logical **index**"""
+        if index < 0 or index >= self.__size:
+            raise IndexError(index)
+
+        slot, position = self.__cursor_slot, self.__cursor_index
+
+        while position > index:
+            slot -= 1
+
+            if self.__alive[slot]:
+                position -= 1
+
+        while position < index or not self.__alive[slot]:
+            if self.__alive[slot]:
+                position += 1
+
+            slot += 1
+
+        self.__cursor_slot, self.__cursor_index = slot, position
+
+        return self.__slots[slot]
+
+    def to_list(self):
+        """Returns columns in logical order as list"""
+        return [column for column, alive in zip(self.__slots, self.__alive) if alive]
+
+    def order_key(self, column):
+        """Returns key that sorts columns in their logical order"""
+        return self.__slot_of[column]
+
+    def is_moved(self, column):
+        """Returns **True** if column was moved to the back"""
+        return self.__slot_of[column] >= self.__back
+
+    def move_back(self, index):
+        """Moves column at logical **index** to the back"""
+        self.move_column_back(self[index])
+
+    def move_column_back(self, column):
+        """Moves **column** to the back"""
+        slot = self.__slot_of[column]
+        self.__alive[slot] = False
+
+        if slot < self.__cursor_slot:
+            self.__cursor_index -= 1
+
+        self.__slot_of[column] = len(self.__slots)
+        self.__slots.append(column)
+        self.__alive.append(True)
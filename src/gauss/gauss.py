@@ -1,18 +1,52 @@
 # -*- coding: utf-8 -*-
 from fractions import Fraction
+import math
+from src.common.sparse_matrix import SparseMatrix
+from src.common.solver_stats import phase
+from .column_order import ColumnOrder
 import time
 import random
 
-class Gauss:
-    """Class that implement Gauss method for solving matrices"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ведущий элемент меньше этой доли от наибольшего по модулю значения матрицы считается нулём
+PIVOT_TOLERANCE = 1e-9
+# остатки округления меньше этой доли в решённой матрице заменяются нулями
+ZERO_TOLERANCE = 1e-12
 
-    def __init__(self, matrix, fractional = False, point = None):
-        """Constructor. Defines attributes: matrix, variables names, _'fractional'_ flag that uses for indicate using fractions (else, floats with rounding)"""
-        self.__matrix = matrix
-        self.__variables = ["x{0}".format(i + 1) for i in range(len(self.__matrix[0]) - 1)]
+class Gauss:
+    """Class that implement Gauss method for solving matrices.
+    Columns are not moved in memory: logical order of columns is kept by **ColumnOrder**.
+    Numbers of nonzero values of columns are updated with rows, columns which number drops to zero are queued and moved to the back"""
+
+    def __init__(self, matrix, fractional = False, point = None, stats = None):
+        """Constructor. Defines attributes: matrix, variables names, _'fractional'_ flag that uses for indicate using fractions (else, floats).
+        If **matrix** is **SparseMatrix** its rows are kept as dicts and elimination skips zero values.
+        **stats** - **SolverStats** that gets time of _gauss_ phase and messages about steps (they are not printed)"""
+        self.__sparse = isinstance(matrix, SparseMatrix)
+
+        if self.__sparse:
+            self.__width = matrix.column_number()
+            self.__matrix = matrix.rows()
+        else:
+            self.__width = len(matrix[0])
+            self.__matrix = matrix
+
+        self.__variables = ["x{0}".format(i + 1) for i in range(self.__width - 1)]
         self.__variables += "b"
         self.__fractional = fractional
         self.__point = point
+        self.__stats = stats
+        self.__lu_factors = None
+
+        # логический порядок столбцов без свободного члена (он всегда последний), число ненулевых значений в каждом столбце
+        # и столбцы, ставшие нулевыми после последнего перемещения
+        self.__columns = ColumnOrder(range(self.__width - 1), self.__width - 1)
+        self.__nonzeros = None
+        self.__zero_columns = []
 
     def __del__(self):
         """Destrcutor"""
@@ -21,51 +55,259 @@ class Gauss:
         del self.__fractional
 
     def free_part(self):
-        """Returns free part of matrix as list of lists(list of rows) exclude _free member_"""
-        return [row[len(self.__matrix):-1] for row in self.__matrix]
+        """Returns free part of matrix as list of lists(list of rows) exclude _free member_ (**SparseMatrix** for sparse matrix)"""
+        offset = len(self.__matrix)
+        columns = self.__columns.to_list()[offset:]
+
+        if self.__sparse:
+            position = {column: index for index, column in enumerate(columns)}
+            rows = [{position[key]: value for key, value in row.items() if key in position} for row in self.__matrix]
+            return SparseMatrix(rows, len(columns))
+
+        return [[row[column] for column in columns] for row in self.__matrix]
+
+    def is_sparse(self):
+        return self.__sparse
+
+    def lu_factors(self):
+        """Returns **(permutation, lower, upper)** of basis matrix **B** (rows of **B** permuted by _permutation_ = **LU**) found in float mode
+        or None if they were not computed (exact mode, sparse matrix or no **numpy**)"""
+        return self.__lu_factors
 
     def variables(self):
         """Returns variables names as list like ["x1", "x2", ..., "xN", "b"] where 'b' is a _free member_"""
-        return self.__variables
+        return [self.__variables[column] for column in self.__columns.to_list()] + ["b"]
 
     def free_member(self):
         """Returns _free member_ as list of values"""
+        if self.__sparse:
+            return [row.get(self.__width - 1, 0) for row in self.__matrix]
+
         return [row[-1] for row in self.__matrix]
 
-    def __convert_to_fractions(self):
-        """Converter of matrix values to fractions"""
+    def __convert_to_integers(self):
+        """Converter of matrix values to integers: every row is multiplied by the least common multiple of its denominators"""
+        for index, row in enumerate(self.__matrix):
+            values = [Fraction(item) for item in (row.values() if self.__sparse else row)]
+            multiplier = 1
+
+            for value in values:
+                multiplier = multiplier*value.denominator//math.gcd(multiplier, value.denominator)
+
+            if self.__sparse:
+                self.__matrix[index] = {key: int(Fraction(value)*multiplier) for key, value in row.items()}
+            else:
+                row[:] = [int(value*multiplier) for value in values]
+
+    def __count_nonzeros(self):
+        """Counts nonzero values of every column (further they are updated by **__replace_row**)"""
+        self.__nonzeros = [0 for _ in range(self.__width)]
+
         for row in self.__matrix:
-            row[:] = [Fraction(item) for item in row]
+            for key, value in (row.items() if self.__sparse else enumerate(row)):
+                if value != 0:
+                    self.__nonzeros[key] += 1
+
+        self.__zero_columns = [column for column in range(self.__width - 1) if self.__nonzeros[column] == 0]
+
+    def __log(self, message):
+        if self.__stats is not None:
+            self.__stats.log(message)
 
     def solve(self):
         """Method that starts solving"""
-        print("Start Gauss method")
+        with phase(self.__stats, "gauss"):
+            return self.__solve()
+
+    def __solve(self):
+        self.__log("Start Gauss method")
 
         if self.__fractional:
-            self.__convert_to_fractions()
-        
+            self.__convert_to_integers()
+
+        # базисные столбцы ставятся первыми с сохранением порядка
         if self.__point is not None:
-            for i in range(len(self.__variables) - 1):
-                for j in range(i, len(self.__variables) - 1):
-                    if self.__point[j] > self.__point[i]:
-                        self.__point[i], self.__point[j] = self.__point[j], self.__point[i]
-                        self.__swap_columns(i, j)
+            columns = range(self.__width - 1)
+            self.__columns = ColumnOrder([column for column in columns if self.__point[column]] + [column for column in columns if not self.__point[column]], self.__width - 1)
 
+        self.__count_nonzeros()
         self.__find_zero_columns()
-        self.__straight_way()
-        self.__reversal_way()
 
-        print("End Gauss method")
+        # разреженная матрица не разворачивается в плотную: исключение идёт по строкам-словарям
+        if self.__fractional:
+            self.__bareiss_way()
+        elif np is not None and not self.__sparse:
+            if not self.__lu_way():
+                self.__log("End Gauss method")
+                return False
+        else:
+            self.__straight_way()
+            self.__reversal_way()
+
+        self.__log("End Gauss method")
         return self.__is_not_singular()
 
+    def __bareiss_way(self):
+        """Method that performs fraction-free Gauss-Jordan elimination (Bareiss) on integer matrix.
+        Every step divides rows exactly by the previous pivot, so values stay minors of the matrix; fractions appear only on the final normalization"""
+        self.__log("Bareiss way...")
+        steps = len(self.__matrix)
+        previous_pivot = 1
+
+        for step in range(steps):
+            # столбец без ненулевых значений в необработанных строках уходит в конец, как и в прямом ходе
+            row_index = None
+
+            for _ in range(self.__width - 1 - step):
+                row_index = next((index for index, value in enumerate(self.__column(step)) if index >= step and value != 0), None)
+
+                if row_index is not None:
+                    break
+
+                self.__move_column_back(step)
+
+            if row_index is None:
+                return
+
+            self.__swap_rows(step, row_index)
+
+            for k in range(steps):
+                if k != step:
+                    self.__bareiss_subtract(i = step, j = k, divisor = previous_pivot)
+
+            previous_pivot = self.__value(step, step)
+
+        if self.__stats is not None:
+            self.__stats.set_value("gauss_determinant_bits", abs(previous_pivot).bit_length())
+
+        for row_index in range(steps):
+            self.__divide(row_index, previous_pivot)
+
+    def __lu_way(self):
+        """Method that performs LU factorization with partial pivoting of basis columns (**numpy**) of dense matrix and then solves for free part.
+        Column without acceptable pivot goes to the back, as in straight way. Returns **False** if matrix is singular"""
+        self.__log("LU way...")
+        table = np.array(self.__matrix, dtype = np.float64)[:, self.__columns.to_list() + [self.__width - 1]]
+        names = self.variables()
+
+        row_number, variables_number = table.shape[0], table.shape[1] - 1
+
+        scale = max(1.0, np.abs(table[:, :-1]).max(initial = 0.0))
+        tolerance = PIVOT_TOLERANCE*scale
+
+        lower = np.zeros((row_number, row_number))
+        permutation = list(range(row_number))
+        candidates = list(range(variables_number))
+        basis, rejected = [], []
+
+        while len(basis) < row_number and candidates:
+            column = candidates.pop(0)
+            step = len(basis)
+
+            pivot_row = step + int(np.argmax(np.abs(table[step:, column])))
+
+            if abs(table[pivot_row, column]) <= tolerance:
+                rejected.append(column)
+                continue
+
+            if pivot_row != step:
+                table[[step, pivot_row]] = table[[pivot_row, step]]
+                lower[[step, pivot_row], :step] = lower[[pivot_row, step], :step]
+                permutation[step], permutation[pivot_row] = permutation[pivot_row], permutation[step]
+
+            multipliers = table[step + 1:, column]/table[step, column]
+            lower[step + 1:, step] = multipliers
+            table[step + 1:] -= np.outer(multipliers, table[step])
+
+            basis.append(column)
+
+        if len(basis) < row_number:
+            return False
+
+        non_basis = candidates + rejected
+        upper = table[:, basis]
+
+        # после исключения строки уже приведены к U, остаётся обратная подстановка
+        free_part = table[:, non_basis + [variables_number]]
+
+        for step in reversed(range(row_number)):
+            free_part[step] -= upper[step, step + 1:] @ free_part[step + 1:]
+            free_part[step] /= upper[step, step]
+
+        free_part[np.abs(free_part) <= ZERO_TOLERANCE*scale] = 0.0
+
+        self.__matrix = np.hstack([np.eye(row_number), free_part]).tolist()
+
+        # матрица записана заново в логическом порядке столбцов
+        self.__variables = [names[index] for index in basis + non_basis] + ["b"]
+        self.__columns = ColumnOrder(range(self.__width - 1), self.__width - 1)
+        self.__lu_factors = (permutation, lower.tolist(), np.triu(upper).tolist())
+
+        return True
+
+    def __bareiss_subtract(self, i, j, divisor):
+        """Method that sets row at _**j**_-pos to **(row_j*a[i][i] - row_i*a[j][i])/divisor** (division is exact)"""
+        pivot_value, coeff = self.__value(i, i), self.__value(j, i)
+
+        if self.__sparse:
+            row = {key: value*pivot_value for key, value in self.__matrix[j].items()}
+
+            if coeff != 0:
+                for key, value in self.__matrix[i].items():
+                    row[key] = row.get(key, 0) - value*coeff
+
+            self.__replace_row(j, {key: value//divisor for key, value in row.items() if value != 0})
+            return
+
+        if coeff == 0:
+            self.__matrix[j] = [value*pivot_value//divisor for value in self.__matrix[j]]
+            return
+
+        self.__replace_row(j, [(value*pivot_value - pivot_item*coeff)//divisor for value, pivot_item in zip(self.__matrix[j], self.__matrix[i])])
+
+    def __divide(self, row_index, divisor):
+        """Method that divides integer row at _row_index_ by _divisor_ (result is fractions)"""
+        if self.__sparse:
+            self.__matrix[row_index] = {key: Fraction(value, divisor) for key, value in self.__matrix[row_index].items()}
+            return
+
+        self.__matrix[row_index] = [Fraction(value, divisor) for value in self.__matrix[row_index]]
+
+    def __replace_row(self, index, row):
+        """Method that puts new _row_ at _index_ and updates numbers of nonzero values of columns"""
+        old_row = self.__matrix[index]
+
+        if self.__sparse:
+            for key in old_row.keys() - row.keys():
+                self.__decrease_nonzeros(key)
+            for key in row.keys() - old_row.keys():
+                self.__nonzeros[key] += 1
+        else:
+            for key, (old_value, value) in enumerate(zip(old_row, row)):
+                if (old_value == 0) != (value == 0):
+                    if old_value == 0:
+                        self.__nonzeros[key] += 1
+                    else:
+                        self.__decrease_nonzeros(key)
+
+        self.__matrix[index] = row
+
+    def __decrease_nonzeros(self, column):
+        """Decreases number of nonzero values of _column_, column with no values left is queued for moving to the back"""
+        self.__nonzeros[column] -= 1
+
+        if self.__nonzeros[column] == 0 and column != self.__width - 1:
+            self.__zero_columns.append(column)
+
     def __straight_way(self):
         """Method that performs a _straight way_"""
-        print("Straight way...")
+        self.__log("Straight way...")
         steps = len(self.__matrix)
 
         for step in range(steps):
-            if self.__matrix[step][step] == 0:
-                row_index = next((index for index, value in enumerate(self.__column(step)) if value != 0), None)
+            if self.__value(step, step) == 0:
+                # строки выше step уже обработаны, ведущий элемент ищем только ниже
+                row_index = next((index for index, value in enumerate(self.__column(step)) if index > step and value != 0), None)
                 if row_index is None:
                     self.__move_column_back(step)
                     continue
@@ -80,11 +322,11 @@ class Gauss:
 
     def __reversal_way(self):
         """Method that performs a _reversal way_"""
-        print("Reversal way...")
+        self.__log("Reversal way...")
         steps = len(self.__matrix)
 
         for step in reversed(range(steps)):
-            if self.__matrix[step][step] == 0:
+            if self.__value(step, step) == 0:
                 row_index = next((index for index, value in enumerate(self.__column(step)) if value != 0), None)
                 if row_index is None:
                     self.__move_column_back(step)
@@ -100,6 +342,10 @@ class Gauss:
 
     def __is_not_singular(self):
         """Returns _**True**_ if matrix is not singular"""
+        # строк больше, чем переменных: базис из всех строк не получить
+        if len(self.__matrix) > self.__width - 1:
+            return False
+
         flag = True
         for i in range(len(self.__matrix)):
             column = self.__column(i)
@@ -107,73 +353,94 @@ class Gauss:
 
         return flag
 
+    def __column_index(self, k):
+        """Returns index of column in matrix by its position _**k**_ in logical order"""
+        return self.__width - 1 if k == self.__width - 1 else self.__columns[k]
+
+    def __value(self, i, k):
+        """Returns value at _**i**_ row and _**k**_ column (in logical order of columns)"""
+        if self.__sparse:
+            return self.__matrix[i].get(self.__column_index(k), 0)
+
+        return self.__matrix[i][self.__column_index(k)]
+
     def __subtract(self, i, j):
-        """Method that substract row at _**i**_-pos from row at _**j**_-pos"""
-        row_length = len(self.__matrix[0])
-        self.__matrix[j] = [self.__matrix[j][k]*self.__matrix[i][i] - self.__matrix[i][k]*self.__matrix[j][i] for k in range(row_length)]
+        """Method that substract row at _**i**_-pos multiplied by **a[j][i]/a[i][i]** from row at _**j**_-pos (float mode only:
+        exact mode uses **__bareiss_subtract**, rows are not scaled by pivot, so values do not grow)"""
+        pivot_value, coeff = self.__value(i, i), self.__value(j, i)
 
-    def __swap_rows(self, i, j):
-        """Method that performs swap of _i_ and _j_ rows"""
-        self.__matrix[i], self.__matrix[j] = self.__matrix[j], self.__matrix[i]
+        # строку с нулём в ведущем столбце можно не трогать
+        if coeff == 0:
+            return
 
-    def __swap_columns(self, i, j):
-        """Method that performs swap of _i_ and _j_ columns"""
-        for row in self.__matrix:
-            row[i], row[j] = row[j], row[i]
+        multiplier = coeff/pivot_value
+        # в ведущем столбце остаток округления заменяется точным нулём
+        pivot_column = self.__column_index(i)
 
-        self.__variables[i], self.__variables[j] = self.__variables[j], self.__variables[i]
+        if self.__sparse:
+            row = dict(self.__matrix[j])
 
-    def __move_column_back(self, index):
-        """Method that moves column at _index_ to the pre-last position (before _free member_)"""
-        column = self.__pop_column(index)
-        self.__append_column(column)
+            for key, value in self.__matrix[i].items():
+                row[key] = row.get(key, 0) - value*multiplier
 
-        # перемещаем названия переменных соответственно
-        self.__variables.insert(-1, self.__variables.pop(index))
+            row.pop(pivot_column)
+            self.__replace_row(j, {key: value for key, value in row.items() if value != 0})
+            return
 
-    def __pop_column(self, index):
-        """Method that performs popping column that has index _index_"""
-        column = []
-        for row in self.__matrix:
-            column.append(row.pop(index))
+        row = [value - pivot_item*multiplier for value, pivot_item in zip(self.__matrix[j], self.__matrix[i])]
+        row[pivot_column] = 0
+        self.__replace_row(j, row)
 
-        return column
+    def __swap_rows(self, i, j):
+        """Method that performs swap of _i_ and _j_ rows (only references to rows are exchanged)"""
+        self.__matrix[i], self.__matrix[j] = self.__matrix[j], self.__matrix[i]
 
-    def __append_column(self, column):
-        """Method that performs appending _column_ to the pre-last position (before _free member_)"""
-        for row_index, row in enumerate(self.__matrix):
-            row.insert(-1, column[row_index])
+    def __move_column_back(self, index):
+        """Method that moves column at _index_ to the pre-last position (before _free member_), only logical order is changed"""
+        self.__columns.move_back(index)
 
     def __normalize(self, row_index):
         """Method that normalize row that has index _row_index_"""
-        coeff = self.__matrix[row_index][row_index]
+        coeff = self.__value(row_index, row_index)
 
         if coeff == 0:
             return
 
-        for k in range(row_index, len(self.__matrix[row_index])):                
-            self.__matrix[row_index][k] /= coeff
+        if self.__sparse:
+            row = self.__matrix[row_index]
+
+            for k in row:
+                row[k] /= coeff
 
-            if not self.__fractional:
-                self.__matrix[row_index][k] = round(self.__matrix[row_index][k], 3)
+            self.__replace_row(row_index, {key: value for key, value in row.items() if value != 0})
+            return
+
+        self.__replace_row(row_index, [value/coeff for value in self.__matrix[row_index]])
 
     def __find_zero_columns(self):
-        """Method that finding all-zeroes columns in matrix and performs their moving to the back"""
-        for column_index in range(len(self.__matrix[0])):
-            column = self.__column(column_index)
-            if all(item == 0 for item in column):
-                self.__move_column_back(column_index)
+        """Method that moves columns queued by **__replace_row** to the back: only columns that are still zero and not moved yet
+        (in their logical order)"""
+        zero_columns = [column for column in set(self.__zero_columns) if self.__nonzeros[column] == 0 and not self.__columns.is_moved(column)]
+        self.__zero_columns = []
+
+        for column in sorted(zero_columns, key = self.__columns.order_key):
+            self.__columns.move_column_back(column)
 
     def __column(self, index):
-        """Returns column at _index_ as list"""
-        return [self.__matrix[row_index][index] for row_index in range(len(self.__matrix))]
+        """Returns column at _index_ (in logical order of columns) as list"""
+        column = self.__column_index(index)
+
+        if self.__sparse:
+            return [row.get(column, 0) for row in self.__matrix]
+
+        return [row[column] for row in self.__matrix]
 
     def __str__(self):
         """Prints matrix fancy"""
         print("============================")
-        print(self.__variables)
-        for row in self.__matrix:
-            print([str(item) for item in row])
+        print(self.variables())
+        for row_index in range(len(self.__matrix)):
+            print([str(self.__value(row_index, k)) for k in range(self.__width)])
         print("============================")
 
 # if __name__ == "__main__":
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Headless solving of tasks from files: **python -m src.simplex [options] paths...**
+
+Every **.mat** file (or every **.mat** file of given directory) is solved with goal function from **.func** file
+with the same name (or the only **.func** file of the same directory). Models in MPS and CPLEX LP files (**.mps**, **.lp**, also gzipped)
+are solved as they are, their solution is given for variables of the model. One JSON line is written per task.
+Only the last table of every task is kept in memory. With **--save-tasks** tables of every task are written to binary task file while it is solved"""
+import argparse
+import json
+import os
+import sys
+import time
+from fractions import Fraction
+from src.common import file_managment
+from src.common.solver_stats import SolverStats
+from src.exceptions.exceptions import InfeasibleTaskError
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.pricing import PRICING_RULES
+from src.simplex.scaling import SCALING_METHODS
+
+MATRIX_EXTENSION = ".mat"
+FUNC_EXTENSION = ".func"
+TASK_EXTENSION = ".task"
+
+def parse_value(item, fractional):
+    """Parses value like dialogs do: "1/2", "1\\2", "0,5" are allowed"""
+    value = Fraction(item.replace("\\", "/").replace(",", "."))
+
+    return value if fractional else float(value)
+
+def find_tasks(paths):
+    """Generator of **(matrix_path, func_path)** pairs for files and directories from **paths**"""
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(name for name in os.listdir(path) if name.endswith(MATRIX_EXTENSION) or file_managment.model_format(name))
+
+            for name in names:
+                yield task_files(os.path.join(path, name))
+        else:
+            yield task_files(path)
+
+def task_files(path):
+    """Model files do not need goal function file"""
+    if file_managment.model_format(path):
+        return path, None
+
+    return path, find_func(path)
+
+def find_func(matrix_path):
+    """Returns path of goal function for matrix: file with the same name or the only **.func** file of directory"""
+    func_path = os.path.splitext(matrix_path)[0] + FUNC_EXTENSION
+
+    if os.path.isfile(func_path):
+        return func_path
+
+    directory = os.path.dirname(matrix_path) or "."
+    funcs = [name for name in os.listdir(directory) if name.endswith(FUNC_EXTENSION)]
+
+    if len(funcs) == 1:
+        return os.path.join(directory, funcs[0])
+
+    return None
+
+def read_task(matrix_path, func_path, fractional):
+    with open(matrix_path) as file:
+        raw_matrix = file_managment.read_matrix_from_file(file)
+
+    with open(func_path) as file:
+        raw_func = file_managment.read_func_from_file(file)
+
+    if not raw_matrix or not raw_func:
+        raise ValueError("can not read task")
+
+    matrix = [[parse_value(item, fractional) for item in row] for row in raw_matrix]
+    func = [parse_value(item, fractional) for item in raw_func]
+
+    return matrix, func
+
+def to_json_value(value):
+    """Fractions are written as strings to keep them exact"""
+    if isinstance(value, Fraction):
+        return str(value) if value.denominator != 1 else value.numerator
+
+    return value
+
+def open_task_file(matrix_path, args):
+    """Returns binary file for tables of task in **--save-tasks** directory or None"""
+    if not args.save_tasks:
+        return None
+
+    name = os.path.basename(matrix_path[:-3] if matrix_path.endswith(".gz") else matrix_path)
+
+    return open(os.path.join(args.save_tasks, os.path.splitext(name)[0] + TASK_EXTENSION), "wb")
+
+def solve(matrix_path, func_path, args):
+    """Solves one task and returns dict that is written as JSON line"""
+    record = {"problem": matrix_path, "func": func_path}
+    start = time.perf_counter()
+    task_file = None
+
+    try:
+        standard_form, bounds = None, None
+
+        if file_managment.model_format(matrix_path):
+            program = file_managment.read_model_from_file(matrix_path, args.fractional, args.fixed_mps)
+            standard_form, matrix, func, bounds = program.to_task()
+            record["variables"] = program.variable_names()
+        elif func_path is None:
+            raise ValueError("goal function file is not found")
+        else:
+            matrix, func = read_task(matrix_path, func_path, args.fractional)
+
+        stats = SolverStats() if args.stats else None
+        task_file = open_task_file(matrix_path, args)
+
+        if args.method == "simplex":
+            point = [int(item) for item in args.point.split()] if args.point else None
+            method = SimplexMethod(matrix = matrix, func = func, fractional = args.fractional, point = point, bounds = bounds, backend = args.backend, pricing = args.pricing, stats = stats, presolve = args.presolve, scaling = args.scaling, keep_history = False, task_file = task_file)
+        else:
+            method = ArtificialBasisMethod(matrix = matrix, func = func, fractional = args.fractional, bounds = bounds, backend = args.backend, pricing = args.pricing, stats = stats, presolve = args.presolve, scaling = args.scaling, keep_history = False, task_file = task_file)
+
+        method.auto_solve()
+
+        table = method.last_table()
+
+        record["status"] = "optimal" if table.first_statement() else "unbounded"
+        p0, solution = None, None
+
+        if record["status"] == "optimal":
+            p0, solution = method.p0(), method.solution()
+
+            if standard_form is not None:
+                p0, solution = standard_form.objective(p0), standard_form.restore(solution)
+
+        record["p0"] = to_json_value(p0)
+        record["solution"] = [to_json_value(value) for value in solution] if solution is not None else None
+        record["iterations"] = method.current_iteration()
+        record["pricing"] = method.pricing_rule()
+
+        if method.presolve() is not None:
+            record["presolve"] = method.presolve().report()
+
+        if method.scaling() is not None:
+            record["scaling"] = method.scaling().report()
+
+        if stats is not None:
+            record["stats"] = stats.to_dict()
+    except InfeasibleTaskError:
+        record["status"] = "infeasible"
+    except Exception as error:
+        record["status"] = "error"
+        record["error"] = getattr(error, "message", None) or str(error) or type(error).__name__
+    finally:
+        if task_file is not None:
+            task_file.close()
+
+    record["time"] = time.perf_counter() - start
+
+    return record
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "python -m src.simplex", description = "Solves linear programming tasks from .mat/.func, MPS and LP files")
+    parser.add_argument("paths", nargs = "+", help = ".mat, .mps, .lp files or directories with them")
+    parser.add_argument("--method", choices = ["simplex", "artificial"], default = "artificial")
+    parser.add_argument("--point", default = None, help = "basis for simplex method, like \"1 1 0 0\"")
+    parser.add_argument("--fractional", action = "store_true", help = "exact calculations with fractions")
+    parser.add_argument("--backend", default = None, choices = ["list", "numpy", "sparse", "integer"])
+    parser.add_argument("--pricing", default = None, choices = sorted(PRICING_RULES), help = "rule of choosing pivot column (dantzig by default)")
+    parser.add_argument("--presolve", action = "store_true", help = "reduce tasks (empty, singleton and duplicate rows, fixed and dominated columns) before solving")
+    parser.add_argument("--scaling", default = None, choices = SCALING_METHODS, help = "scaling of matrix in float mode")
+    parser.add_argument("--fixed-mps", action = "store_true", help = "read MPS files in fixed format (names with spaces)")
+    parser.add_argument("--stats", action = "store_true", help = "add times of phases, counters of pivots and sizes of numbers to records")
+    parser.add_argument("--save-tasks", default = None, metavar = "DIR", help = "write tables of every task to DIR/<name>.task while solving")
+    parser.add_argument("--output", default = None, help = "JSONL file (standard output by default)")
+
+    args = parser.parse_args(argv)
+
+    output = open(args.output, "w") if args.output else sys.stdout
+
+    try:
+        for matrix_path, func_path in find_tasks(args.paths):
+            output.write(json.dumps(solve(matrix_path, func_path, args), ensure_ascii = False) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,106 +4,329 @@ from src.simplex.simplex_method.simplex_method import SimplexMethod
 from src.simplex.simplex_method.simplex_table import SimplexTable
 from src.exceptions.exceptions import *
 from src.gauss.gauss import Gauss
+from src.common.sparse_matrix import SparseMatrix, prepare_storage
+from src.common.solver_stats import phase
+from src.common.task_file import TaskWriter
+from src.simplex.backends.backend import is_sparse_backend
+from src.simplex.bounds import Bounds
+from src.simplex.history import TableHistory
+from src.simplex.pricing import create_pricing
+from src.simplex.presolve import Presolve
+from src.simplex.scaling import create_scaling
+from src.simplex.stalling import StallingDetector, STALLING_LIMIT
 from fractions import Fraction
 import math
 
 class ArtificialBasisMethod:
-    def __init__(self, matrix = None, func = None, fractional = False):
+    def __init__(self, matrix = None, func = None, fractional = False, backend = None, bounds = None, warm_start = None, keep_history = True, history = None, pricing = None, stalling_limit = STALLING_LIMIT, stats = None, presolve = False, scaling = None, tolerances = None, task_file = None):
+        """Constructor. **warm_start** - solved task with the same matrix or names of its basis variables.
+        If that basis fits the task, artificial basis phase is skipped.
+        If **keep_history** is **False**, iterations of each phase transform one table in place.
+        **history** - **TableHistory** with retention policy of tables (all tables are kept by default).
+        **pricing** - rule of choosing pivot column in both phases, **stalling_limit** - see **SimplexMethod**.
+        **stats** - **SolverStats** shared by both phases (None - instrumentation is off).
+        If **presolve** is **True**, task is reduced by **Presolve** before the artificial basis phase,
+        **scaling** - method of scaling of matrix in float mode, **tolerances** - comparisons with zero in float mode,
+        **task_file** - binary file to which **auto_solve** writes tables of both phases as soon as they are made (see **SimplexMethod**)"""
         self.__matrix = matrix
+        self.__bounds = Bounds.from_pairs(bounds) if isinstance(bounds, list) else bounds
+        self.__artificial_matrix = None
+        self.__simplex_method = None
+        self.__warm_start = warm_start
+        self.__keep_history = keep_history
+        self.__pricing = create_pricing(pricing)
+        self.__stalling_limit = stalling_limit
+        self.__stalling = StallingDetector(self.__pricing, stalling_limit)
+        self.__stats = stats
+        self.__presolve = presolve or None
+        self.__scaling = create_scaling(scaling)
+        self.__is_scaled = False
+        self.__tolerances = tolerances
+        self.__task_file = task_file
+        self.__writer = None
         self.__func = func
         self.__fractional = fractional
-        self.__tables = []
+        self.__backend = backend
+        self.__tables = history if history is not None else TableHistory()
         self.__current_iteration = -1
         self.__p0 = None
         self.__can_continue_artificial = True
         self.__can_continue_simplex = False
 
     def __prepare_matrix(self):
-        for row in self.__matrix:
+        if self.__presolve is True:
+            self.__reduce_task()
+
+        if self.__scaling is not None and not self.__is_scaled:
+            self.__scale_task()
+
+        self.__matrix = prepare_storage(self.__matrix, sparse = is_sparse_backend(self.__backend))
+
+        # для переменных с границами ищем базис в сдвинутых переменных (нижние границы равны нулю)
+        if self.__bounds is not None:
+            self.__artificial_matrix, _, _ = self.__bounds.transform(self.__matrix, self.__func)
+        else:
+            self.__artificial_matrix = self.__matrix
+
+        if isinstance(self.__artificial_matrix, SparseMatrix):
+            free_index = self.__artificial_matrix.column_number() - 1
+
+            for row in self.__artificial_matrix.rows():
+                if row.get(free_index, 0) < 0:
+                    for key in row:
+                        row[key] = -row[key]
+            return
+
+        for row in self.__artificial_matrix:
             if row[-1] < 0:
                 row[:] = [-item for item in row]
 
+    def __reduce_task(self):
+        """Replaces task by the task reduced by presolve (the second phase gets reduced task too)"""
+        presolve = Presolve(self.__matrix, self.__func, self.__bounds, fractional = self.__fractional)
+
+        with phase(self.__stats, "presolve"):
+            self.__matrix, self.__func, self.__bounds = presolve.reduce()
+
+        if self.__stats is not None:
+            self.__stats.set_value("presolve", presolve.report())
+
+        self.__presolve = presolve
+
+    def __scale_task(self):
+        """Scales matrix, goal function and bounds (exact mode does not need scaling)"""
+        if self.__fractional:
+            self.__scaling = None
+            return
+
+        with phase(self.__stats, "scaling"):
+            self.__matrix, self.__func, self.__bounds = self.__scaling.scale(self.__matrix, self.__func, self.__bounds)
+
+        if self.__stats is not None:
+            self.__stats.set_value("scaling", self.__scaling.report())
+
+        self.__is_scaled = True
+
+    def __initial_table(self):
+        """Returns the first table of artificial basis method (the matrix itself is not changed by tables)"""
+        if isinstance(self.__artificial_matrix, SparseMatrix):
+            table = self.__artificial_matrix.copy()
+        else:
+            table = self.__artificial_matrix[:]
+
+        upper = None
+
+        if self.__bounds is not None and any(width is not None for width in self.__bounds.widths()):
+            upper = self.__bounds.widths()
+
+        return ArtificialBasisTable(table = table, fractional = self.__fractional, backend = self.__backend, bounds = upper, pricing = self.__pricing, stats = self.__stats, tolerances = self.__tolerances)
+
+    def __create_simplex_method(self):
+        """Creates simplex method for the second phase from basis found by artificial basis method.
+        Raises **InfeasibleTaskError** if artificial variables can not be zero"""
+        if not self.last_table().end_statement():
+            raise InfeasibleTaskError()
+
+        point = self.last_table().get_point()
+        complemented = None
+
+        if self.__bounds is not None:
+            complemented = self.last_table().complemented()[:len(point)]
+
+        return SimplexMethod(matrix = self.__matrix,
+                             func = self.__func,
+                             fractional = self.__fractional,
+                             point = point,
+                             backend = self.__backend,
+                             bounds = self.__bounds,
+                             complemented = complemented,
+                             keep_history = self.__keep_history,
+                             history = self.__tables.empty_copy(),
+                             pricing = self.__pricing,
+                             stalling_limit = self.__stalling_limit,
+                             stats = self.__stats,
+                             presolve = self.__presolve,
+                             scaling = self.__scaling,
+                             tolerances = self.__tolerances,
+                             task_file = self.__writer)
+
+    def __create_warm_method(self):
+        return SimplexMethod(matrix = self.__matrix,
+                             func = self.__func,
+                             fractional = self.__fractional,
+                             backend = self.__backend,
+                             bounds = self.__bounds,
+                             warm_start = self.__warm_start,
+                             keep_history = self.__keep_history,
+                             history = self.__tables.empty_copy(),
+                             pricing = self.__pricing,
+                             stalling_limit = self.__stalling_limit,
+                             stats = self.__stats,
+                             presolve = self.__presolve,
+                             scaling = self.__scaling.method() if self.__scaling is not None else None,
+                             tolerances = self.__tolerances,
+                             task_file = self.__writer)
+
+    def __warm_solve(self):
+        """Solves task by simplex method from warm start basis. Returns **False** if that basis does not fit"""
+        simplex_method = self.__create_warm_method()
+
+        try:
+            simplex_method.auto_solve()
+        except (BasisError, BasisSizeError, SingularMatrixError):
+            return False
+
+        self.__take_transforms(simplex_method)
+        self.__simplex_method = simplex_method
+        self.__tables = simplex_method.get_tables()
+        self.__current_iteration = simplex_method.current_iteration()
+
+        self.__can_continue_artificial = False
+        self.__can_continue_simplex = simplex_method.can_continue()
+
+        return True
+
+    def __warm_next(self):
+        """Makes the first table by simplex method from warm start basis. Returns **False** if that basis does not fit"""
+        simplex_method = self.__create_warm_method()
+
+        try:
+            simplex_method.next()
+        except (BasisError, BasisSizeError, SingularMatrixError):
+            return False
+
+        self.__take_transforms(simplex_method)
+        self.__simplex_method = simplex_method
+        self.__can_continue_artificial = False
+        self.__can_continue_simplex = simplex_method.can_continue()
+
+        return True
+
+    def __take_transforms(self, simplex_method):
+        """Takes reductions and scaling made by simplex method of warm start (its tables contain variables of transformed task)"""
+        self.__presolve = simplex_method.presolve()
+        self.__scaling = simplex_method.scaling()
+        self.__bounds = simplex_method.bounds()
+
+    def __artificial_step(self):
+        """Performs one iteration of artificial basis phase (in place of the last table if history is not kept)"""
+        if not self.__tables:
+            simplex_table = self.__initial_table()
+            self.__can_continue_artificial = simplex_table.solve()
+            self.__tables.append(simplex_table)
+            self.__stalling.reset()
+        elif self.__keep_history:
+            self.__write_last_table()
+            simplex_table = ArtificialBasisTable(previous_table = self.last_table())
+            self.__can_continue_artificial = simplex_table.solve()
+            self.__tables.append(simplex_table)
+        else:
+            self.__write_last_table()
+            simplex_table = self.last_table()
+            self.__can_continue_artificial = simplex_table.advance()
+
+        if self.__can_continue_artificial:
+            self.__stalling.observe(simplex_table)
+
     def __prepare_function(self):
         if self.__fractional:
             self.__func[:] = [Fraction(item) for item in self.__func]
 
+    def __write_last_table(self):
+        """Writes the last table to task file before the next iteration (its pivot element is chosen first)"""
+        if self.__writer is None:
+            return
+
+        self.last_table().find_pivot_element()
+        self.__writer.append(self.last_table())
+
+    def __close_writer(self):
+        """Writes result and index, tables of the second phase are written by its simplex method"""
+        if self.__writer is None:
+            return
+
+        self.__writer.close(self)
+        self.__writer = None
+
     def auto_solve(self):
+        if self.__task_file is not None:
+            self.__writer = TaskWriter(self.__task_file, self)
+
+        if self.__warm_start is not None and self.__warm_solve():
+            self.__close_writer()
+            return
+
         self.__prepare_matrix()
         self.__prepare_function()
 
         self.__can_continue_artificial = True
 
-        while self.__can_continue_artificial:
-            simplex_table = None
-
-            if not self.__tables:
-                simplex_table = ArtificialBasisTable(table = self.__matrix[:], fractional = self.__fractional)
-            else:
-                simplex_table = ArtificialBasisTable(previous_table = self.last_table())
+        with phase(self.__stats, "artificial"):
+            while self.__can_continue_artificial:
+                self.__artificial_step()
 
-            self.__can_continue_artificial = simplex_table.solve()
+                if self.__can_continue_artificial:
+                    self.__current_iteration += 1
 
-            if self.__can_continue_artificial:
-                self.__current_iteration += 1
+        if self.__stats is not None:
+            self.__stats.set_value("artificial_iterations", self.__current_iteration + 1)
 
-            self.__tables.append(simplex_table)
+        if self.__writer is not None:
+            self.__writer.append(self.last_table())
 
-        point = self.last_table().get_point()
-        
-        simplex_method = SimplexMethod(matrix = self.__matrix, func = self.__func, fractional = self.__fractional, point = point)
+        self.__simplex_method = self.__create_simplex_method()
 
-        simplex_method.auto_solve()
+        self.__simplex_method.auto_solve()
 
-        self.__tables += simplex_method.get_tables()
-        self.__current_iteration += (simplex_method.current_iteration() + 1)
+        self.__tables.extend(self.__simplex_method.get_tables())
+        self.__current_iteration += (self.__simplex_method.current_iteration() + 1)
         
-        self.__can_continue_simplex = simplex_method.can_continue()
+        self.__can_continue_simplex = self.__simplex_method.can_continue()
+        self.__close_writer()
 
     def next(self):
-        simplex_table = None
-
-        if self.__can_continue_artificial:
+        if not self.__tables and self.__warm_start is not None and self.__warm_next():
+            self.__tables.append(self.__simplex_method.last_table(), derived = False)
+        elif self.__can_continue_artificial:
             if not self.__tables:
-                simplex_table = ArtificialBasisTable(table = self.__matrix[:], fractional = self.__fractional)
-            else:
-                simplex_table = ArtificialBasisTable(previous_table = self.last_table())
+                self.__prepare_matrix()
 
-            self.__can_continue_artificial = simplex_table.solve()
+            self.__artificial_step()
 
             if not self.__can_continue_artificial:
                 self.__can_continue_simplex = True
-        else:
-            if type(self.last_table()) is SimplexTable:
-                simplex_table = SimplexTable(previous_table = self.last_table())
-            else:
-                point = self.last_table().get_point()
-                gauss = Gauss(matrix = self.__matrix, fractional = self.__fractional, point = point)
-
-                if not gauss.solve():
-                    raise SingularMatrixError()
-                
-                if any(item < 0 for item in gauss.free_member()):
-                    raise BasisError()
-
-                simplex_table = SimplexTable(variables_names = gauss.variables(),
-                                             table = gauss.free_part(),
-                                             free_member = gauss.free_member(),
-                                             fractional = self.__fractional)
+        elif type(self.last_table()) is not SimplexTable:
+            self.__simplex_method = self.__create_simplex_method()
+            self.__simplex_method.next()
+
+            self.__can_continue_simplex = self.__simplex_method.can_continue()
+            self.__tables.append(self.__simplex_method.last_table(), derived = False)
+        elif self.__keep_history:
+            simplex_table = SimplexTable(previous_table = self.last_table())
 
             self.__can_continue_simplex = simplex_table.solve(self.__func)
+            self.__tables.append(simplex_table)
+        else:
+            self.__can_continue_simplex = self.last_table().advance()
 
         self.__current_iteration += 1
-        self.__tables.append(simplex_table)
 
     def back(self):
-        del self.__tables[-1]
+        # без истории таблиц вернуться назад нельзя
+        if not self.__keep_history:
+            return
+
+        self.__tables.pop()
         self.__current_iteration -= 1
 
+        # таблицы после возврата уже встречались, это не зацикливание
+        self.__stalling.reset()
+
         if type(self.last_table()) is SimplexTable:
             self.__can_continue_simplex = self.last_table().third_statement()
             self.__can_continue_artificial = False
         elif type(self.last_table()) is ArtificialBasisTable:
-            self.__can_continue_artificial = not self.last_table().end_statement()
+            self.__can_continue_artificial = self.last_table().third_statement()
             self.__can_continue_simplex = False
 
     def last_table(self):
@@ -114,13 +337,75 @@ class ArtificialBasisMethod:
 
     def get_table(self, index = 0):
         return self.__tables[index]
+
+    def get_tables(self):
+        return self.__tables
     
     def can_continue(self):
         return self.__can_continue_artificial or self.__can_continue_simplex
 
+    def matrix(self):
+        """Returns matrix of the task (after presolve and scaling when solving is started)"""
+        return self.__matrix
+
+    def func(self):
+        return self.__func
+
+    def simplex_method(self):
+        """Returns simplex method of the second phase (None if it is not started)"""
+        return self.__simplex_method
+
+    def p0(self):
+        """Returns minimized value of goal function (when the second phase is started)"""
+        if self.__simplex_method is None:
+            return None
+
+        return self.last_table().p0() + self.__simplex_method.goal_constant()
+
+    def solution(self):
+        """Returns values of variables **x1..xN** in the last table of the second phase"""
+        if self.__simplex_method is None:
+            return None
+
+        values = self.last_table().values()
+
+        if self.__bounds is not None:
+            values = self.__bounds.restore(values, self.last_table().complemented())
+
+        if self.__scaling is not None:
+            values = self.__scaling.unscale(values)
+
+        if self.__presolve is not None:
+            values = self.__presolve.restore(values)
+
+        return values
+
     def let_continue(self):
         self.__can_continue = True
 
     def current_iteration(self):
         return self.__current_iteration
 
+    def pricing_rule(self):
+        """Returns name of rule of choosing pivot column"""
+        return self.__pricing.NAME
+
+    def method_name(self):
+        """Returns name of method that is written to task file"""
+        return "artificial"
+
+    def stalling(self):
+        """Returns **StallingDetector** of artificial basis phase (the second phase has its own one in **simplex_method()**)"""
+        return self.__stalling
+
+    def stats(self):
+        """Returns **SolverStats** of both phases or None if instrumentation is off"""
+        return self.__stats
+
+    def presolve(self):
+        """Returns **Presolve** with reductions applied to the task or None"""
+        return self.__presolve if self.__presolve is not True else None
+
+    def scaling(self):
+        """Returns **Scaling** applied to the task or None"""
+        return self.__scaling if self.__is_scaled else None
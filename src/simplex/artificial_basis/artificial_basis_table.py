@@ -1,30 +1,59 @@
-from fractions import Fraction
+from src.common.sparse_matrix import SparseMatrix
+from src.simplex.backends.backend import create_backend
+from src.simplex.basis import Basis
+from src.simplex.bounds import bounded_ratio_test, find_bounded_pivot
+from src.simplex.pricing import create_pricing
 
 class ArtificialBasisTable:
-    def __init__(self, variables_names = None, table = None, fractional = False, previous_table = None):
+    def __init__(self, variables_names = None, table = None, fractional = False, previous_table = None, backend = None, bounds = None, pricing = None, stats = None, tolerances = None):
+        """Constructor. **bounds** - upper bounds of original variables by their indices (None - not bounded),
+        **pricing** - rule of choosing pivot column (name or object from _pricing_ module, Dantzig's rule by default),
+        **stats** - **SolverStats** that counts pivots and sizes of numbers (None - instrumentation is off),
+        **tolerances** - comparisons with zero (see **Tolerances**, exact for fractions and default tolerances for floats)"""
         self.__previous_table = previous_table
         
         if self.__previous_table:
             self.__variables = self.__previous_table.variables()
-            self.__row_variables_names = self.__previous_table.row_variables()
-            self.__column_variables_names = self.__previous_table.column_variables()
-
-            row_number, column_number = self.__previous_table.row_number(), self.__previous_table.column_number()
-
-            self.__table = [[None for _ in range(column_number)] for _ in range(row_number)]
+            self.__variable_index = self.__previous_table.variable_index()
+            self.__basis = self.__previous_table.basis().copy()
+            self.__bounds = self.__previous_table.bounds()
+            self.__complemented = self.__previous_table.complemented().copy()
+            self.__pricing = self.__previous_table.pricing().copy()
+            self.__stats = self.__previous_table.stats()
+
+            self.__table = self.__previous_table.backend().copy()
             self.__fractional = self.__previous_table.is_fractional()
 
             self.__iteration_number = self.__previous_table.iteration_number() + 1
         else:
-            self.__table = table
+            # исходные переменные x1..xN, затем искусственные x(N+1)..x(N+M)
+            if isinstance(table, SparseMatrix):
+                variables_number, row_number = table.column_number() - 1, table.row_number()
+            else:
+                variables_number, row_number = len(table[0]) - 1, len(table)
 
-            self.__variables = ["x{}".format(i + 1) for i in range(len(self.__table[0]) - 1)]
+            self.__variables = ["x{}".format(i + 1) for i in range(variables_number)]
             self.__variables.append("b")
 
-            self.__row_variables_names = ["x{}".format(i + 1) for i in range(len(self.__table[0]) - 1, len(self.__table[0]) + len(self.__table) - 1)]
-            self.__column_variables_names = self.__variables
-            
-            self.__table.append([0 for _ in range(len(self.__table[0]))])
+            self.__variable_index = {"x{}".format(i + 1): i for i in range(variables_number + row_number)}
+
+            self.__basis = Basis(basis = range(variables_number, variables_number + row_number),
+                                 non_basis = range(variables_number),
+                                 variables_number = variables_number + row_number)
+
+            if isinstance(table, SparseMatrix):
+                rows = table.copy()
+                rows.append_row({})
+            else:
+                rows = table + [[0 for _ in range(len(table[0]))]]
+
+            self.__table = create_backend(rows, fractional, backend, tolerances)
+
+            # искусственные переменные сверху не ограничены
+            self.__bounds = list(bounds) + [None for _ in range(row_number)] if bounds is not None else None
+            self.__complemented = [False for _ in range(variables_number + row_number)]
+            self.__pricing = create_pricing(pricing)
+            self.__stats = stats
 
             self.__fractional = fractional
 
@@ -32,12 +61,84 @@ class ArtificialBasisTable:
 
         self.__pivot_element = None
 
+    def state(self):
+        """Returns dict of values that describe table (variables, basis, bounds, pivot element and values of cells) to save it, see **from_state**"""
+        return {
+            "variables": self.__variables,
+            "basis": self.__basis.basis(),
+            "non_basis": self.__basis.non_basis(),
+            "variables_number": self.__basis.variables_number(),
+            "bounds": self.__bounds,
+            "complemented": self.__complemented,
+            "pricing": self.__pricing.NAME,
+            "backend": self.__table.NAME,
+            "fractional": self.__fractional,
+            "iteration_number": self.__iteration_number,
+            "pivot": self.pivot_index(),
+            "rows": self.__table.to_lists(),
+        }
+
+    @staticmethod
+    def from_state(state, tolerances = None):
+        """Creates table by values of **state()** (weights of pricing rule are not saved, they start again)"""
+        table = ArtificialBasisTable.__new__(ArtificialBasisTable)
+        table.__previous_table = None
+        table.__variables = list(state["variables"])
+        table.__variable_index = {"x{}".format(i + 1): i for i in range(state["variables_number"])}
+        table.__basis = Basis(state["basis"], state["non_basis"], state["variables_number"])
+        table.__bounds = state["bounds"]
+        table.__complemented = list(state["complemented"])
+        table.__pricing = create_pricing(state["pricing"])
+        table.__stats = None
+        table.__table = create_backend(state["rows"], state["fractional"], state["backend"], tolerances)
+        table.__fractional = state["fractional"]
+        table.__iteration_number = state["iteration_number"]
+        table.__pivot_element = list(state["pivot"]) if state["pivot"] is not None else None
+
+        return table
+
     def iteration_number(self):
         """Returns the number of iteration of simplex table"""
         return self.__iteration_number
 
     def size(self):
-        return [len(self.__table) + 1, len(self.__table[0]) + 1]
+        return [self.__table.row_number() + 1, self.__table.column_number() + 1]
+
+    def backend(self):
+        """Returns tableau backend that stores values of table"""
+        return self.__table
+
+    def basis(self):
+        """Returns bookkeeping of basis and non-basis variables indices"""
+        return self.__basis
+
+    def bounds(self):
+        """Returns upper bounds of variables by their indices or None if variables are not bounded"""
+        return self.__bounds
+
+    def complemented(self):
+        """Returns flags of variables that stay in table as **bound - variable**"""
+        return self.__complemented
+
+    def pricing(self):
+        """Returns rule of choosing pivot column (its weights are kept by every table separately)"""
+        return self.__pricing
+
+    def set_pricing(self, pricing):
+        """Sets rule of choosing pivot column for this table and tables made from it"""
+        self.__pricing = pricing
+
+    def stats(self):
+        """Returns **SolverStats** of solving or None"""
+        return self.__stats
+
+    def variable_index(self):
+        """Returns dict that maps name of variable (including artificial ones) to its index"""
+        return self.__variable_index
+
+    def __name(self, variable):
+        """Returns name of variable by its index (artificial variables are numbered after original ones)"""
+        return "x{}".format(variable + 1)
 
     def is_fractional(self):
         """Returns **True** if table contains fractional values"""
@@ -45,46 +146,53 @@ class ArtificialBasisTable:
     
     def column_variables(self):
         """Returns names of variables that stay in columns headers as list of strings"""
-        return self.__column_variables_names.copy()
+        return [self.__name(variable) for variable in self.__basis.non_basis()] + ["b"]
 
     def row_variables(self):
         """Returns names of variables that stay in rows headers as list of strings"""
-        return self.__row_variables_names.copy()
+        return [self.__name(variable) for variable in self.__basis.basis()]
 
     def p0(self):
         """Returns p0 value, that is minimized value of goal function"""
-        return -self.__table[-1][-1]
+        return -self.__table.value(-1, -1)
 
     def row_number(self):
         """Returns the number of rows in table (including vector P)"""
-        return len(self.__table)
+        return self.__table.row_number()
 
     def column_number(self):
         """Returns the number of columns in table (including free member)"""
-        return len(self.__table[0])
+        return self.__table.column_number()
 
     def free_member(self):
         """Returns vector of free members as list"""
-        return [row[-1] for row in self.__table[:-1]]    
+        return self.__table.free_member()
 
     def pivot_element(self):
         """Returns pivot element by **[row_var, col_var]** pair of variables names, like ["x1", "x2"]"""
-        return self.__pivot_element
+        if self.__pivot_element is None:
+            return
+
+        row_index, column_index = self.__pivot_element
+
+        # смена границы переменной без смены базиса
+        if row_index == -1:
+            return [None, self.__name(self.__basis.non_basis()[column_index])]
+
+        return [self.__name(self.__basis.basis()[row_index]), self.__name(self.__basis.non_basis()[column_index])]
 
     def pivot_index(self):
+        """Returns pivot element by **[row_index, column_index]** pair of indices"""
         if self.__pivot_element is None:
             return
 
-        pivot_row_var, pivot_column_var = self.__pivot_element
-        pivot_row_var_index, pivot_column_var_index = self.__row_index_by_var(pivot_row_var), self.__column_index_by_var(pivot_column_var)
-
-        return [pivot_row_var_index, pivot_column_var_index]
+        return list(self.__pivot_element)
     
     def has_pivot(self):
         return self.__pivot_element is not None
     
     def p_vector(self):
-        return self.__table[-1]
+        return self.__table.p_vector()
 
     def is_possible_pivot(self, row_index, column_index):
         p_vector = self.p_vector()
@@ -92,42 +200,26 @@ class ArtificialBasisTable:
         if column_index == len(p_vector) - 1:
             return False
 
-        if p_vector[column_index] >= 0:
+        if not self.__table.tolerances().is_improving(p_vector[column_index]):
             return False
 
-        column = self.column(column_index)
-
-        row_indices = [index for index, value in enumerate(column) if value > 0]
-
-        ratios = None
-        
-        if self.__fractional:
-            ratios = [Fraction(self.free_member()[index], column[index]) for index in row_indices]
-        else:
-            ratios = [self.free_member()[index]/column[index] for index in row_indices]
+        if self.__bounds is not None:
+            return bounded_ratio_test(self.__table, self.__basis, self.__bounds, column_index) == row_index
 
-        possible_row_index = row_indices[ratios.index(min(ratios))]
-        
-        return possible_row_index == row_index
+        return self.__table.ratio_test(column_index) == row_index
 
     def value_table(self):
-        return self.__table
+        return self.__table.to_lists()
 
     def set_pivot_element(self, i, j):
-        """Setting pivot element by **[row_var, col_var]** pair of variables names, like ["x1", "x2"]"""
-        self.__pivot_element = [self.__row_variables_names[i], self.__column_variables_names[j]]
+        """Setting pivot element by **[row_index, column_index]** pair of indices"""
+        self.__pivot_element = [i, j]
     
     def unset_pivot_element(self):
         self.__pivot_element = None
 
     def get_point(self):
-        point = [0 for i in range(len(self.__variables) - 1)]
-
-        for index, var in enumerate(self.__variables[:-1]):
-            if var in self.__row_variables_names:
-                point[index] = 1
-        
-        return point
+        return [1 if self.__basis.is_basic(variable) else 0 for variable in range(len(self.__variables) - 1)]
 
     def variables(self):
         return self.__variables
@@ -139,160 +231,150 @@ class ArtificialBasisTable:
                 self.__previous_table.find_pivot_element()
 
         if self.__previous_table:
-            self.__push_table()
+            self.__apply_pivot(*self.__previous_table.pivot_index())
+
+            # предыдущая таблица больше не нужна, цепочка таблиц не должна удерживаться в памяти
+            self.__previous_table = None
         else:
             self.__calc_p_vector()
 
-        return not self.end_statement()
+        return self.third_statement()
+
+    def following_table(self):
+        """Returns new table made by pivot element of this table (tables are rebuilt by history, so the pivot is not counted in stats again)"""
+        table = ArtificialBasisTable(previous_table = self)
+        table.__stats = None
+        table.solve()
+
+        return table
 
-    def __push_table(self):
-        prev_pivot_row_var, prev_pivot_column_var = self.__previous_table.pivot_element()
-        prev_pivot_row_index, prev_pivot_column_index = self.__row_index_by_var(prev_pivot_row_var), self.__column_index_by_var(prev_pivot_column_var)
+    def advance(self):
+        """Performs the next iteration in place of this table (no new table is created). Returns **True** if one more iteration is possible"""
+        self.find_pivot_element()
 
-        self.__row_variables_names[prev_pivot_row_index] = prev_pivot_column_var
-        self.__column_variables_names[prev_pivot_column_index] = prev_pivot_row_var
+        if self.__pivot_element is None:
+            return False
 
-        prev_pivot_value = self.__previous_table.get_value_by_var(prev_pivot_row_var, prev_pivot_column_var)
+        self.__apply_pivot(*self.__pivot_element)
 
-        new_pivot_value = 1/prev_pivot_value
-        new_pivot_row_var, new_pivot_column_var = prev_pivot_column_var, prev_pivot_row_var
+        self.__pivot_element = None
+        self.__iteration_number += 1
 
-        self.__set_value_by_var(new_pivot_row_var, new_pivot_column_var, new_pivot_value)
+        return self.third_statement()
 
-        new_pivot_row = []
-        for index, item in enumerate(self.__previous_table.row_by_var(prev_pivot_row_var)):
-            if index == self.__column_index_by_var(new_pivot_column_var):
-                new_pivot_row.append(new_pivot_value)
-            else:
-                new_pivot_row.append(item/prev_pivot_value)
+    def __apply_pivot(self, prev_pivot_row_index, prev_pivot_column_index):
 
-        new_pivot_column = []
-        for index, item in enumerate(self.__previous_table.column_by_var(prev_pivot_column_var)):
-            if index == self.__row_index_by_var(new_pivot_row_var):
-                new_pivot_column.append(new_pivot_value)
-            else:
-                new_pivot_column.append(-1*item/prev_pivot_value)
-
-        self.__set_row(self.__row_index_by_var(new_pivot_row_var), new_pivot_row)
-        self.__set_column(self.__column_index_by_var(new_pivot_column_var), new_pivot_column)
-
-        for index, row in enumerate(self.__table):
-            if all(value is not None for value in row):
-                continue
-            prev_row = self.__previous_table.row(index)
-            coeff = self.__previous_table.column_by_var(prev_pivot_column_var)[index]
-            for row_index, item in enumerate(row):
-                if item is None:
-                    self.__table[index][row_index] = prev_row[row_index] - coeff*new_pivot_row[row_index]
-        
-        index = self.__column_index_by_var(prev_pivot_row_var)
+        # переменная просто переходит на другую границу, базис не меняется
+        if prev_pivot_row_index == -1:
+            self.__complement(prev_pivot_column_index)
 
-        for row in self.__table:
-            row.pop(index)
+            if self.__stats is not None:
+                self.__stats.count("bound_flips")
+            return
 
-        self.__column_variables_names.pop(index)
+        leaving_variable = self.__basis.basis()[prev_pivot_row_index]
 
-    def get_value_by_var(self, row_var, col_var):
-        """Returns the value of cell at coords **[row_var, col_var]**"""
-        i, j = self.__row_variables_names.index(row_var), self.__column_variables_names.index(col_var)
-        return self.__table[i][j]
+        # при отрицательном ведущем элементе выходящая переменная достигает верхней границы
+        to_upper = self.__bounds is not None and self.__table.value(prev_pivot_row_index, prev_pivot_column_index) < 0
 
-    def __set_value_by_var(self, row_var, col_var, value):
-        """Sets the **value** for cell at coords **[row_var, col_var]**"""
-        if self.__fractional:
-            value = Fraction(value)
+        self.__pricing.update(self.__table, self.__basis, prev_pivot_row_index, prev_pivot_column_index)
 
-        i, j = self.__row_variables_names.index(row_var), self.__column_variables_names.index(col_var)
-        self.__table[i][j] = value
+        self.__basis.exchange(prev_pivot_row_index, prev_pivot_column_index)
+        self.__table.pivot(prev_pivot_row_index, prev_pivot_column_index)
+
+        if to_upper:
+            self.__complement(prev_pivot_column_index)
+
+        # искусственная переменная, покинувшая базис, больше не нужна
+        if self.__is_artificial(leaving_variable):
+            self.__basis.delete_column(prev_pivot_column_index)
+            self.__table.delete_column(prev_pivot_column_index)
+
+        if self.__stats is not None:
+            self.__stats.count("pivots")
+            self.__stats.observe_table(self.__table)
+
+    def __complement(self, column_index):
+        """Substitutes non-basis variable at **column_index** by **bound - variable**"""
+        variable = self.__basis.non_basis()[column_index]
+
+        self.__table.complement_column(column_index, self.__bounds[variable])
+        self.__complemented[variable] = not self.__complemented[variable]
+
+    def __is_artificial(self, variable):
+        return variable >= len(self.__variables) - 1
+
+    def get_value_by_var(self, row_var, col_var):
+        """Returns the value of cell at coords **[row_var, col_var]**"""
+        i, j = self.__row_index_by_var(row_var), self.__column_index_by_var(col_var)
+        return self.__table.value(i, j)
 
     def __calc_p_vector(self):
         """Methods that calculates the P vector"""
-        for j in range(len(self.__table[0])):
-            s = 0
-            for i in range(len(self.__table)):
-                s -= self.__table[i][j]
-            self.__table[-1][j] = s
+        basis_costs = [1 for _ in self.__basis.basis()]
+        non_basis_costs = [0 for _ in self.__basis.non_basis()]
+
+        self.__table.set_objective(basis_costs, non_basis_costs)
     
     def end_statement(self):
-        return self.__table[-1][-1] == 0
+        """Sum of artificial variables is zero (within primal tolerance) => basis of original task is found"""
+        return self.__table.tolerances().is_zero(self.__table.value(-1, -1))
+
+    def third_statement(self):
+        """Possible to do one more iteration: sum of artificial variables is not zero and there is pivot element.
+        If there is no pivot while the sum is not zero, constraints of task can not hold"""
+        if self.end_statement():
+            return False
+
+        if self.__bounds is not None:
+            return find_bounded_pivot(self.__table, self.__basis, self.__bounds) is not None
+
+        return self.__table.find_pivot() is not None
 
     def column_by_var(self, var):
         """Returns column by name of varible"""
-        if var not in self.__column_variables_names:
+        column_index = self.__column_index_by_var(var)
+        if column_index == -1:
             return -1
-        column_index = self.__column_variables_names.index(var)
         return self.column(column_index)
 
     def row_by_var(self, var):
         """Returns row by name of varible"""
-        if var not in self.__row_variables_names:
+        row_index = self.__row_index_by_var(var)
+        if row_index == -1:
             return -1
-        row_index = self.__row_variables_names.index(var)
         return self.row(row_index)
 
     def column(self, index):
         """Returns the column by **index**"""
-        if index < 0 or index >= len(self.__table[0]):
+        if index < 0 or index >= self.__table.column_number():
             return -1
-        return [row[index] for row in self.__table]
+        return self.__table.column(index)
 
     def row(self, index):
         """Returns the row by **index**"""
-        if index < 0 or index >= len(self.__table):
+        if index < 0 or index >= self.__table.row_number():
             return -1
-        return self.__table[index]
+        return self.__table.row(index)
 
     def __column_index_by_var(self, var):
         """Returns the column index by **var**"""
-        if var not in self.__column_variables_names:
+        if var not in self.__variable_index:
             return -1
-        return self.__column_variables_names.index(var)
+        return self.__basis.column_of(self.__variable_index[var])
 
     def __row_index_by_var(self, var):
         """Returns the row index by **var**"""
-        if var not in self.__row_variables_names:
+        if var not in self.__variable_index:
             return -1
-        return self.__row_variables_names.index(var)
-
-    def __set_column(self, index, new_col):
-        """Set the new column at **index** in table"""
-        for col_val, row in zip(new_col, self.__table):
-            row[index] = col_val
-
-    def __set_row(self, index, new_row):
-        """Set the new row at **index** in table"""
-        self.__table[index] = new_row
+        return self.__basis.row_of(self.__variable_index[var])
 
     def find_pivot_element(self):
         """Method that performs finding a pivot element in table"""
         if self.__pivot_element is not None:
             return
 
-        p_vector = self.__table[-1]
-
-        col_indices = [index for index, value in enumerate(p_vector[:-1]) if value < 0 and any(item > 0 for item in self.column(index))]
-        
-        if len(col_indices) == 0:
-            self.__pivot_element = None
-            return
-
-        col_index = p_vector.index(min([p_vector[index] for index in col_indices]))
-        
-        column = self.column(col_index)[:-1]
-
-        row_indices = [index for index, value in enumerate(column) if value > 0]
-
-        if len(row_indices) == 0:
-            self.__pivot_element = None
-            return        
-
-        ratios = None
-
-        if self.__fractional:
-            ratios = [Fraction(self.free_member()[index], column[index]) for index in row_indices]
-        else:
-            ratios = [self.free_member()[index]/column[index] for index in row_indices]
-
-        row_index = row_indices[ratios.index(min(ratios))]
+        self.__pivot_element = self.__pricing.find_pivot(self.__table, self.__basis, self.__bounds)
 
-        self.__pivot_element = [self.__row_variables_names[row_index], self.__column_variables_names[col_index]]
+        if self.__stats is not None and self.__pivot_element is not None and self.__pivot_element[0] != -1:
+            self.__stats.observe_ratio_test(self.__table, *self.__pivot_element)
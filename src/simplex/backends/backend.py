@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from src.exceptions.exceptions import BackendError
+from src.common.sparse_matrix import SparseMatrix, is_sparse_enough
+from .list_backend import ListBackend
+from .integer_backend import IntegerBackend
+from .numpy_backend import NumpyBackend
+from .sparse_backend import SparseBackend
+
+BACKENDS = {
+    ListBackend.NAME: ListBackend,
+    IntegerBackend.NAME: IntegerBackend,
+    NumpyBackend.NAME: NumpyBackend,
+    SparseBackend.NAME: SparseBackend,
+}
+
+def backend_class(fractional = False, backend = None, rows = None):
+    """Returns tableau backend class by its name. By default _sparse_ is used for big sparse **rows**,
+    _numpy_ for floats (if installed, else _list_) and _integer_ for fractions"""
+    if backend is None:
+        if rows is not None and is_sparse_enough(rows):
+            return SparseBackend
+
+        if fractional:
+            return IntegerBackend
+
+        if not NumpyBackend.is_available():
+            return ListBackend
+
+        return NumpyBackend
+
+    if not isinstance(backend, str):
+        backend = backend.NAME
+
+    if backend not in BACKENDS:
+        raise BackendError()
+
+    if backend == NumpyBackend.NAME and (fractional or not NumpyBackend.is_available()):
+        raise BackendError()
+
+    if backend == IntegerBackend.NAME and not fractional:
+        raise BackendError()
+
+    return BACKENDS[backend]
+
+def is_sparse_backend(backend = None):
+    """Returns **True**/**False** if **backend** is given explicitly (sparse or not) and None for automatic choice"""
+    if backend is None:
+        return None
+
+    if not isinstance(backend, str):
+        backend = backend.NAME
+
+    return backend == SparseBackend.NAME
+
+def create_backend(rows, fractional = False, backend = None, tolerances = None):
+    """Creates tableau backend filled by **rows** (list of lists or **SparseMatrix**), **tolerances** - see **Tolerances**"""
+    cls = backend_class(fractional, backend, rows)
+
+    if cls is not SparseBackend and isinstance(rows, SparseMatrix):
+        rows = rows.to_dense()
+
+    return cls(rows, fractional, tolerances)
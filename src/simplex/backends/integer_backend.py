@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+import math
+import sys
+from fractions import Fraction
+from src.simplex.tolerances import EXACT_TOLERANCES
+
+class IntegerBackend:
+    """Tableau storage for exact mode: integer numerators with one common positive denominator (value = numerator/denominator).
+    Pivot is fraction-free (Edmonds): the pivot numerator becomes the new denominator and other values are divided exactly
+    by the previous one, so sizes of numerators are bounded by determinants of bases. Fractions are made only on reading values"""
+
+    NAME = "integer"
+
+    def __init__(self, rows, fractional = True, tolerances = None):
+        """Constructor. **rows** is list of lists of integers or fractions, the last row is the P vector, the last column is the free member.
+        Values are exact, so **tolerances** are not used (comparisons with zero are exact)"""
+        rows = [[Fraction(item) for item in row] for row in rows]
+        denominator = 1
+
+        for row in rows:
+            for item in row:
+                denominator = denominator*item.denominator//math.gcd(denominator, item.denominator)
+
+        self.__rows = [[item.numerator*(denominator//item.denominator) for item in row] for row in rows]
+        self.__denominator = denominator
+
+        self.__reduce()
+
+    def copy(self):
+        """Returns independent copy of tableau"""
+        backend = IntegerBackend([])
+        backend.__rows = [row[:] for row in self.__rows]
+        backend.__denominator = self.__denominator
+
+        return backend
+
+    def is_fractional(self):
+        return True
+
+    def tolerances(self):
+        return EXACT_TOLERANCES
+
+    def denominator(self):
+        """Returns common denominator of all values"""
+        return self.__denominator
+
+    def row_number(self):
+        """Returns the number of rows (including vector P)"""
+        return len(self.__rows)
+
+    def column_number(self):
+        """Returns the number of columns (including free member)"""
+        return len(self.__rows[0])
+
+    def value(self, i, j):
+        return Fraction(self.__rows[i][j], self.__denominator)
+
+    def row(self, index):
+        return [Fraction(item, self.__denominator) for item in self.__rows[index]]
+
+    def column(self, index):
+        return [Fraction(row[index], self.__denominator) for row in self.__rows]
+
+    def free_member(self):
+        return [Fraction(row[-1], self.__denominator) for row in self.__rows[:-1]]
+
+    def p_vector(self):
+        return self.row(-1)
+
+    def to_lists(self):
+        return [self.row(index) for index in range(len(self.__rows))]
+
+    def set_objective(self, basis_costs, non_basis_costs):
+        """Calculates the P vector: **P[j] = c[j] - sum(c_basis[i]*a[i][j])**, the last value is **-sum(c_basis[i]*b[i])**"""
+        basis_costs = [Fraction(cost) for cost in basis_costs]
+        non_basis_costs = [Fraction(cost) for cost in non_basis_costs]
+
+        # таблица домножается на общий знаменатель стоимостей, тогда произведения стоимостей на числители целые
+        scale = 1
+
+        for cost in basis_costs + non_basis_costs:
+            scale = scale*cost.denominator//math.gcd(scale, cost.denominator)
+
+        self.__scale(scale)
+
+        basis_costs = [int(cost*scale) for cost in basis_costs]
+        rows = self.__rows[:-1]
+
+        p_vector = []
+
+        for j, cost in enumerate(non_basis_costs):
+            s = int(cost*scale)*self.__denominator
+            for basis_cost, row in zip(basis_costs, rows):
+                s -= basis_cost*row[j]
+            p_vector.append(s//scale)
+
+        p_vector.append(-sum(basis_cost*row[-1] for basis_cost, row in zip(basis_costs, rows))//scale)
+
+        self.__rows[-1] = p_vector
+
+    def pivot(self, i, j):
+        """Performs modified Jordan exchange around element at **[i, j]** without fractions"""
+        rows = self.__rows
+        pivot_row = rows[i]
+        pivot_value = pivot_row[j]
+        denominator = self.__denominator
+
+        products = [[item*pivot_value - row[j]*pivot_item for item, pivot_item in zip(row, pivot_row)] if index != i else None
+                    for index, row in enumerate(rows)]
+
+        is_exact = all(item % denominator == 0 for row in products if row is not None for item in row)
+
+        if is_exact:
+            # деление Эдмондса: новым знаменателем становится ведущий элемент, остальные значения делятся нацело
+            new_rows = [[item//denominator for item in row] if row is not None else pivot_row[:] for row in products]
+            new_rows[i][j] = denominator
+            self.__denominator = pivot_value
+        else:
+            # начальная таблица не получена целочисленными преобразованиями: общий знаменатель **d*pivot**
+            new_rows = [row if row is not None else [item*denominator for item in pivot_row] for row in products]
+            new_rows[i][j] = denominator*denominator
+            self.__denominator = denominator*pivot_value
+
+        for index, row in enumerate(rows):
+            if index != i:
+                new_rows[index][j] = -row[j] if is_exact else -row[j]*denominator
+
+        self.__rows = new_rows
+
+        if self.__denominator < 0:
+            self.__rows = [[-item for item in row] for row in self.__rows]
+            self.__denominator = -self.__denominator
+
+        if not is_exact:
+            self.__reduce()
+
+    def complement_column(self, index, bound):
+        """Substitutes variable of column **index** by **bound - variable**"""
+        bound = Fraction(bound)
+        self.__scale(bound.denominator)
+
+        for row in self.__rows:
+            value = row[index]
+            row[-1] -= int(value*bound)
+            row[index] = -value
+
+    def complement_row(self, index, bound):
+        """Substitutes basis variable of row **index** by **bound - variable**"""
+        bound = self.__fit(bound)
+
+        row = self.__rows[index]
+        row[:-1] = [-item for item in row[:-1]]
+        row[-1] = int(bound*self.__denominator) - row[-1]
+
+    def append_row(self, row):
+        """Adds **row** to the end of table (before the P vector)"""
+        row = [Fraction(item) for item in row]
+        self.__scale(self.__common_denominator(row))
+
+        self.__rows.insert(len(self.__rows) - 1, [int(item*self.__denominator) for item in row])
+
+    def shift_free_member(self, values):
+        """Adds **values** to the free member column (including the P vector)"""
+        values = [Fraction(value) for value in values]
+        self.__scale(self.__common_denominator(values))
+
+        for row, value in zip(self.__rows, values):
+            row[-1] += int(value*self.__denominator)
+
+    def delete_column(self, index):
+        for row in self.__rows:
+            row.pop(index)
+
+    def column_products(self, index):
+        """Returns dot products of column **index** with every column except the free member (over rows of constraints)"""
+        products = [0 for _ in range(len(self.__rows[0]) - 1)]
+
+        for row in self.__rows[:-1]:
+            value = row[index]
+
+            if value != 0:
+                for column_index in range(len(products)):
+                    products[column_index] += value*row[column_index]
+
+        square = self.__denominator*self.__denominator
+
+        return [Fraction(product, square) for product in products]
+
+    def number_bits(self):
+        """Returns the largest bit lengths of numerators and common denominator"""
+        numerator_bits = max((abs(item).bit_length() for row in self.__rows for item in row), default = 0)
+
+        return numerator_bits, self.__denominator.bit_length()
+
+    def memory_size(self):
+        """Returns approximate size of tableau in bytes"""
+        return sys.getsizeof(self.__rows) + sum(sys.getsizeof(row) + sum(sys.getsizeof(item) for item in row) for row in self.__rows)
+
+    def ratio_test(self, column_index):
+        """Returns index of row that gives minimal ratio **b[i]/a[i][column_index]** over positive **a[i][column_index]**"""
+        best_index = None
+
+        for index, row in enumerate(self.__rows[:-1]):
+            value = row[column_index]
+
+            if value <= 0:
+                continue
+
+            # знаменатели положительны, отношения сравниваются перекрёстным умножением
+            if best_index is None or row[-1]*self.__rows[best_index][column_index] < self.__rows[best_index][-1]*value:
+                best_index = index
+
+        return best_index
+
+    def find_pivot(self):
+        """Returns **[row, column]** indices of pivot element chosen by the most negative value of P vector and minimal ratio"""
+        p_vector = self.__rows[-1]
+
+        col_indices = [index for index, value in enumerate(p_vector[:-1]) if value < 0 and any(row[index] > 0 for row in self.__rows[:-1])]
+
+        if len(col_indices) == 0:
+            return None
+
+        col_index = min(col_indices, key = lambda index: p_vector[index])
+        row_index = self.ratio_test(col_index)
+
+        if row_index is None:
+            return None
+
+        return [row_index, col_index]
+
+    def __common_denominator(self, values):
+        """Returns the least factor of table such that all **values** become integer numerators after scaling by it"""
+        scale = 1
+
+        for value in values:
+            denominator = (value*self.__denominator).denominator
+            scale = scale*denominator//math.gcd(scale, denominator)
+
+        return scale
+
+    def __fit(self, value):
+        """Scales table so that **value** is integer in units of common denominator, returns **value** as fraction"""
+        value = Fraction(value)
+        self.__scale(self.__common_denominator([value]))
+
+        return value
+
+    def __scale(self, factor):
+        """Multiplies numerators and common denominator by **factor**"""
+        if factor == 1:
+            return
+
+        self.__rows = [[item*factor for item in row] for row in self.__rows]
+        self.__denominator *= factor
+
+    def __reduce(self):
+        """Divides numerators and common denominator by their greatest common divisor"""
+        divisor = self.__denominator
+
+        for row in self.__rows:
+            for item in row:
+                divisor = math.gcd(divisor, item)
+
+                if divisor == 1:
+                    return
+
+        if divisor > 1:
+            self.__rows = [[item//divisor for item in row] for row in self.__rows]
+            self.__denominator //= divisor
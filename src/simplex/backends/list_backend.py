@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+import sys
+from fractions import Fraction
+from src.common.solver_stats import fraction_bits, value_size
+from src.simplex.tolerances import create_tolerances
+
+class ListBackend:
+    """Tableau storage as list of lists (rows) of fractions or floats. Used as fallback for float mode without **numpy**"""
+
+    NAME = "list"
+
+    def __init__(self, rows, fractional = False, tolerances = None):
+        """Constructor. **rows** is list of lists, the last row is the P vector, the last column is the free member, **tolerances** - comparisons with zero (exact for fractions and default tolerances for floats if None)"""
+        if fractional:
+            self.__rows = [[Fraction(item) for item in row] for row in rows]
+        else:
+            self.__rows = [[float(item) for item in row] for row in rows]
+
+        self.__fractional = fractional
+        self.__tolerances = create_tolerances(tolerances, fractional)
+
+    def copy(self):
+        """Returns independent copy of tableau"""
+        backend = ListBackend(self.__rows, self.__fractional, self.__tolerances)
+        backend.__fractional = self.__fractional
+
+        return backend
+
+    def tolerances(self):
+        return self.__tolerances
+
+    def is_fractional(self):
+        return self.__fractional
+
+    def row_number(self):
+        """Returns the number of rows (including vector P)"""
+        return len(self.__rows)
+
+    def column_number(self):
+        """Returns the number of columns (including free member)"""
+        return len(self.__rows[0])
+
+    def value(self, i, j):
+        return self.__rows[i][j]
+
+    def row(self, index):
+        return self.__rows[index]
+
+    def column(self, index):
+        return [row[index] for row in self.__rows]
+
+    def free_member(self):
+        return [row[-1] for row in self.__rows[:-1]]
+
+    def p_vector(self):
+        return self.__rows[-1]
+
+    def to_lists(self):
+        return self.__rows
+
+    def set_objective(self, basis_costs, non_basis_costs):
+        """Calculates the P vector: **P[j] = c[j] - sum(c_basis[i]*a[i][j])**, the last value is **-sum(c_basis[i]*b[i])**"""
+        rows = self.__rows[:-1]
+        p_vector = []
+
+        for j, cost in enumerate(non_basis_costs):
+            s = cost
+            for basis_cost, row in zip(basis_costs, rows):
+                s += -basis_cost*row[j]
+            p_vector.append(s)
+
+        p_vector.append(sum(-basis_cost*row[-1] for basis_cost, row in zip(basis_costs, rows)))
+
+        self.__rows[-1] = p_vector
+
+    def pivot(self, i, j):
+        """Performs modified Jordan exchange around element at **[i, j]**"""
+        rows = self.__rows
+        pivot_value = rows[i][j]
+
+        new_pivot_value = 1/pivot_value
+        new_pivot_row = [item/pivot_value for item in rows[i]]
+        new_pivot_row[j] = new_pivot_value
+
+        for index, row in enumerate(rows):
+            if index == i or row[j] == 0:
+                continue
+
+            coeff = row[j]
+            new_row = [item - coeff*new_item for item, new_item in zip(row, new_pivot_row)]
+            new_row[j] = -1*coeff/pivot_value
+
+            rows[index] = new_row
+
+        rows[i] = new_pivot_row
+
+    def complement_column(self, index, bound):
+        """Substitutes variable of column **index** by **bound - variable**"""
+        for row in self.__rows:
+            value = row[index]
+            row[-1] -= value*bound
+            row[index] = -value
+
+    def complement_row(self, index, bound):
+        """Substitutes basis variable of row **index** by **bound - variable**"""
+        row = self.__rows[index]
+        row[:-1] = [-item for item in row[:-1]]
+        row[-1] = bound - row[-1]
+
+    def append_row(self, row):
+        """Adds **row** to the end of table (before the P vector)"""
+        if self.__fractional:
+            row = [Fraction(item) for item in row]
+        else:
+            row = [float(item) for item in row]
+
+        self.__rows.insert(len(self.__rows) - 1, row)
+
+    def shift_free_member(self, values):
+        """Adds **values** to the free member column (including the P vector)"""
+        for row, value in zip(self.__rows, values):
+            row[-1] += value
+
+    def delete_column(self, index):
+        for row in self.__rows:
+            row.pop(index)
+
+    def number_bits(self):
+        """Returns the largest bit lengths of numerators and denominators (None for floats)"""
+        if not self.__fractional:
+            return None
+
+        return fraction_bits(item for row in self.__rows for item in row)
+
+    def memory_size(self):
+        """Returns approximate size of tableau in bytes"""
+        return sys.getsizeof(self.__rows) + sum(sys.getsizeof(row) + sum(value_size(item) for item in row) for row in self.__rows)
+
+    def ratio_test(self, column_index):
+        """Returns index of row that gives minimal ratio **b[i]/a[i][column_index]** over positive **a[i][column_index]**
+        (Harris ratio test in float mode, see **Tolerances**)"""
+        return self.__tolerances.ratio_test((index, row[column_index], row[-1]) for index, row in enumerate(self.__rows[:-1]))
+
+    def column_products(self, index):
+        """Returns dot products of column **index** with every column except the free member (over rows of constraints)"""
+        products = [0 for _ in range(len(self.__rows[0]) - 1)]
+
+        for row in self.__rows[:-1]:
+            value = row[index]
+
+            if value != 0:
+                for column_index in range(len(products)):
+                    products[column_index] += value*row[column_index]
+
+        return products
+
+    def find_pivot(self):
+        """Returns **[row, column]** indices of pivot element chosen by the most negative value of P vector and minimal ratio"""
+        p_vector = self.__rows[-1]
+
+        tolerances = self.__tolerances
+        col_indices = [index for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value) and any(tolerances.is_pivot(row[index]) for row in self.__rows[:-1])]
+
+        if len(col_indices) == 0:
+            return None
+
+        col_index = min(col_indices, key = lambda index: p_vector[index])
+        row_index = self.ratio_test(col_index)
+
+        if row_index is None:
+            return None
+
+        return [row_index, col_index]
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from src.simplex.tolerances import create_tolerances
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class NumpyBackend:
+    """Tableau storage as dense **numpy.ndarray** of floats. Pivot is performed as a single rank-1 update"""
+
+    NAME = "numpy"
+
+    def __init__(self, rows, fractional = False, tolerances = None):
+        """Constructor. **rows** is list of lists or 2d array, the last row is the P vector, the last column is the free member, **tolerances** - comparisons with zero (exact for fractions and default tolerances for floats if None)"""
+        self.__table = np.array(rows, dtype = np.float64)
+        self.__buffers = None
+        self.__tolerances = create_tolerances(tolerances, fractional)
+
+    @staticmethod
+    def is_available():
+        return np is not None
+
+    def copy(self):
+        """Returns independent copy of tableau"""
+        return NumpyBackend(self.__table, tolerances = self.__tolerances)
+
+    def tolerances(self):
+        return self.__tolerances
+
+    def is_fractional(self):
+        return False
+
+    def row_number(self):
+        """Returns the number of rows (including vector P)"""
+        return self.__table.shape[0]
+
+    def column_number(self):
+        """Returns the number of columns (including free member)"""
+        return self.__table.shape[1]
+
+    def value(self, i, j):
+        return self.__table[i, j].item()
+
+    def row(self, index):
+        return self.__table[index].tolist()
+
+    def column(self, index):
+        return self.__table[:, index].tolist()
+
+    def free_member(self):
+        return self.__table[:-1, -1].tolist()
+
+    def p_vector(self):
+        return self.__table[-1].tolist()
+
+    def to_lists(self):
+        return self.__table.tolist()
+
+    def set_objective(self, basis_costs, non_basis_costs):
+        """Calculates the P vector: **P = c_non_basis - c_basis*A**, the last value is **-c_basis*b**"""
+        basis_costs = np.array(basis_costs, dtype = np.float64)
+
+        self.__table[-1, :-1] = np.array(non_basis_costs, dtype = np.float64) - basis_costs @ self.__table[:-1, :-1]
+        self.__table[-1, -1] = -basis_costs @ self.__table[:-1, -1]
+
+    def __pivot_buffers(self):
+        """Returns preallocated buffers for pivot row, pivot column and rank-1 update (reallocated only if shape is changed)"""
+        rows, columns = self.__table.shape
+
+        if self.__buffers is None or self.__buffers[2].shape != (rows, columns):
+            self.__buffers = (np.empty(columns), np.empty(rows), np.empty((rows, columns)))
+
+        return self.__buffers
+
+    def pivot(self, i, j):
+        """Performs modified Jordan exchange around element at **[i, j]** as rank-1 update in place (without allocations)"""
+        table = self.__table
+        pivot_row, pivot_column, update = self.__pivot_buffers()
+
+        pivot_value = table[i, j].item()
+
+        np.divide(table[i], pivot_value, out = pivot_row)
+        pivot_column[:] = table[:, j]
+
+        np.multiply.outer(pivot_column, pivot_row, out = update)
+        np.subtract(table, update, out = table)
+
+        table[i] = pivot_row
+        np.divide(pivot_column, -pivot_value, out = table[:, j])
+        table[i, j] = 1 / pivot_value
+
+    def complement_column(self, index, bound):
+        """Substitutes variable of column **index** by **bound - variable**"""
+        self.__table[:, -1] -= self.__table[:, index] * float(bound)
+        self.__table[:, index] *= -1
+
+    def complement_row(self, index, bound):
+        """Substitutes basis variable of row **index** by **bound - variable**"""
+        self.__table[index, :-1] *= -1
+        self.__table[index, -1] = float(bound) - self.__table[index, -1]
+
+    def append_row(self, row):
+        """Adds **row** to the end of table (before the P vector)"""
+        self.__table = np.insert(self.__table, self.__table.shape[0] - 1, np.array(row, dtype = np.float64), axis = 0)
+
+    def shift_free_member(self, values):
+        """Adds **values** to the free member column (including the P vector)"""
+        self.__table[:, -1] += np.array(values, dtype = np.float64)
+
+    def delete_column(self, index):
+        self.__table = np.delete(self.__table, index, axis = 1)
+
+    def number_bits(self):
+        return None
+
+    def memory_size(self):
+        """Returns size of tableau (and pivot buffers) in bytes"""
+        buffers = sum(buffer.nbytes for buffer in self.__buffers) if self.__buffers is not None else 0
+
+        return self.__table.nbytes + buffers
+
+    def ratio_test(self, column_index):
+        """Returns index of row that gives minimal ratio **b[i]/a[i][column_index]** over positive **a[i][column_index]**
+        (Harris ratio test if it is on, see **Tolerances**)"""
+        tolerances = self.__tolerances
+        column = self.__table[:-1, column_index]
+        row_indices = np.flatnonzero(column > tolerances.pivot())
+
+        if row_indices.size == 0:
+            return None
+
+        values = column[row_indices]
+        ratios = self.__table[row_indices, -1] / values
+
+        if not tolerances.is_harris():
+            return int(row_indices[np.argmin(ratios)])
+
+        bound = np.min((self.__table[row_indices, -1] + tolerances.primal()) / values)
+
+        return int(row_indices[np.argmax(np.where(ratios <= bound, values, -np.inf))])
+
+    def column_products(self, index):
+        """Returns dot products of column **index** with every column except the free member (over rows of constraints)"""
+        return (self.__table[:-1, index] @ self.__table[:-1, :-1]).tolist()
+
+    def find_pivot(self):
+        """Returns **[row, column]** indices of pivot element chosen by the most negative value of P vector and minimal ratio"""
+        p_vector = self.__table[-1, :-1]
+
+        candidates = (p_vector < -self.__tolerances.dual()) & (self.__table[:-1, :-1] > self.__tolerances.pivot()).any(axis = 0)
+
+        if not candidates.any():
+            return None
+
+        col_index = int(np.argmin(np.where(candidates, p_vector, np.inf)))
+        row_index = self.ratio_test(col_index)
+
+        if row_index is None:
+            return None
+
+        return [row_index, col_index]
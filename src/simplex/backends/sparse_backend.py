@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+import sys
+from fractions import Fraction
+from src.common.sparse_matrix import SparseMatrix
+from src.common.solver_stats import fraction_bits, value_size
+from src.simplex.tolerances import create_tolerances
+
+class SparseBackend:
+    """Tableau storage as list of dict rows. Pivot touches only rows with nonzero value in pivot column"""
+
+    NAME = "sparse"
+
+    def __init__(self, rows, fractional = False, tolerances = None):
+        """Constructor. **rows** is list of lists or **SparseMatrix**, the last row is the P vector, the last column is the free member, **tolerances** - comparisons with zero (exact for fractions and default tolerances for floats if None)"""
+        if not isinstance(rows, SparseMatrix):
+            rows = SparseMatrix.from_dense(rows)
+
+        self.__rows = [dict(row) for row in rows.rows()]
+        self.__column_number = rows.column_number()
+
+        if fractional:
+            for row in self.__rows:
+                for key in row:
+                    row[key] = Fraction(row[key])
+
+        self.__fractional = fractional
+        self.__tolerances = create_tolerances(tolerances, fractional)
+
+    def copy(self):
+        """Returns independent copy of tableau"""
+        backend = SparseBackend(SparseMatrix([], self.__column_number), tolerances = self.__tolerances)
+        backend.__rows = [dict(row) for row in self.__rows]
+        backend.__fractional = self.__fractional
+
+        return backend
+
+    def tolerances(self):
+        return self.__tolerances
+
+    def is_fractional(self):
+        return self.__fractional
+
+    def row_number(self):
+        """Returns the number of rows (including vector P)"""
+        return len(self.__rows)
+
+    def column_number(self):
+        """Returns the number of columns (including free member)"""
+        return self.__column_number
+
+    def nonzeros(self):
+        return sum(len(row) for row in self.__rows)
+
+    def value(self, i, j):
+        if j < 0:
+            j += self.__column_number
+        return self.__rows[i].get(j, 0)
+
+    def row(self, index):
+        row = self.__rows[index]
+        return [row.get(column_index, 0) for column_index in range(self.__column_number)]
+
+    def column(self, index):
+        if index < 0:
+            index += self.__column_number
+        return [row.get(index, 0) for row in self.__rows]
+
+    def free_member(self):
+        return self.column(-1)[:-1]
+
+    def p_vector(self):
+        return self.row(-1)
+
+    def to_lists(self):
+        return [self.row(index) for index in range(len(self.__rows))]
+
+    def set_objective(self, basis_costs, non_basis_costs):
+        """Calculates the P vector: **P[j] = c[j] - sum(c_basis[i]*a[i][j])**, the last value is **-sum(c_basis[i]*b[i])**"""
+        p_vector = {index: cost for index, cost in enumerate(non_basis_costs) if cost != 0}
+
+        for basis_cost, row in zip(basis_costs, self.__rows[:-1]):
+            if basis_cost == 0:
+                continue
+            for key, value in row.items():
+                p_vector[key] = p_vector.get(key, 0) - basis_cost*value
+
+        self.__rows[-1] = {key: value for key, value in p_vector.items() if value != 0}
+
+    def pivot(self, i, j):
+        """Performs modified Jordan exchange around element at **[i, j]**, rows with zero in pivot column are skipped"""
+        rows = self.__rows
+        pivot_value = rows[i][j]
+
+        new_pivot_row = {key: value/pivot_value for key, value in rows[i].items()}
+        new_pivot_row[j] = 1/pivot_value
+
+        for index, row in enumerate(rows):
+            if index == i or j not in row:
+                continue
+
+            coeff = row.pop(j)
+
+            for key, value in new_pivot_row.items():
+                if key == j:
+                    continue
+
+                new_value = row.get(key, 0) - coeff*value
+
+                if new_value == 0:
+                    row.pop(key, None)
+                else:
+                    row[key] = new_value
+
+            row[j] = -1*coeff/pivot_value
+
+        rows[i] = new_pivot_row
+
+    def complement_column(self, index, bound):
+        """Substitutes variable of column **index** by **bound - variable**"""
+        free_index = self.__column_number - 1
+
+        for row in self.__rows:
+            if index not in row:
+                continue
+
+            value = row[index]
+            free_value = row.get(free_index, 0) - value*bound
+
+            if free_value == 0:
+                row.pop(free_index, None)
+            else:
+                row[free_index] = free_value
+
+            row[index] = -value
+
+    def complement_row(self, index, bound):
+        """Substitutes basis variable of row **index** by **bound - variable**"""
+        free_index = self.__column_number - 1
+        row = self.__rows[index]
+
+        free_value = bound - row.pop(free_index, 0)
+        for key in row:
+            row[key] = -row[key]
+
+        if free_value != 0:
+            row[free_index] = free_value
+
+    def append_row(self, row):
+        """Adds **row** (list or dict) to the end of table (before the P vector)"""
+        items = row.items() if isinstance(row, dict) else enumerate(row)
+        convert = Fraction if self.__fractional else (lambda value: value)
+
+        self.__rows.insert(len(self.__rows) - 1, {key: convert(value) for key, value in items if value != 0})
+
+    def shift_free_member(self, values):
+        """Adds **values** to the free member column (including the P vector)"""
+        free_index = self.__column_number - 1
+
+        for row, value in zip(self.__rows, values):
+            if value == 0:
+                continue
+
+            free_value = row.get(free_index, 0) + value
+
+            if free_value == 0:
+                row.pop(free_index, None)
+            else:
+                row[free_index] = free_value
+
+    def delete_column(self, index):
+        for number, row in enumerate(self.__rows):
+            self.__rows[number] = {(key if key < index else key - 1): value for key, value in row.items() if key != index}
+
+        self.__column_number -= 1
+
+    def number_bits(self):
+        """Returns the largest bit lengths of numerators and denominators (None for floats)"""
+        if not self.__fractional:
+            return None
+
+        return fraction_bits(Fraction(value) for row in self.__rows for value in row.values())
+
+    def memory_size(self):
+        """Returns approximate size of tableau in bytes"""
+        return sys.getsizeof(self.__rows) + sum(sys.getsizeof(row) + sum(value_size(value) for value in row.values()) for row in self.__rows)
+
+    def ratio_test(self, column_index):
+        """Returns index of row that gives minimal ratio **b[i]/a[i][column_index]** over positive **a[i][column_index]**
+        (Harris ratio test in float mode, see **Tolerances**)"""
+        free_index = self.__column_number - 1
+
+        return self.__tolerances.ratio_test((index, row[column_index], row.get(free_index, 0)) for index, row in enumerate(self.__rows[:-1]) if column_index in row)
+
+    def column_products(self, index):
+        """Returns dot products of column **index** with every column except the free member (over rows of constraints)"""
+        free_index = self.__column_number - 1
+        products = [0 for _ in range(free_index)]
+
+        for row in self.__rows[:-1]:
+            value = row.get(index, 0)
+
+            if value != 0:
+                for key, item in row.items():
+                    if key != free_index:
+                        products[key] += value*item
+
+        return products
+
+    def find_pivot(self):
+        """Returns **[row, column]** indices of pivot element chosen by the most negative value of P vector and minimal ratio"""
+        free_index = self.__column_number - 1
+
+        tolerances = self.__tolerances
+
+        positive_columns = set()
+        for row in self.__rows[:-1]:
+            positive_columns.update(key for key, value in row.items() if tolerances.is_pivot(value))
+
+        col_indices = [index for index, value in self.__rows[-1].items() if index != free_index and tolerances.is_improving(value) and index in positive_columns]
+
+        if len(col_indices) == 0:
+            return None
+
+        col_index = min(col_indices, key = lambda index: (self.__rows[-1][index], index))
+        row_index = self.ratio_test(col_index)
+
+        if row_index is None:
+            return None
+
+        return [row_index, col_index]
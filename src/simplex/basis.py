@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+class Basis:
+    """Class for bookkeeping of basis and non-basis variables by integer indices (variable **k** is named "x{k+1}")"""
+
+    def __init__(self, basis, non_basis, variables_number):
+        """Constructor. **basis** - variables indices of table rows, **non_basis** - variables indices of table columns"""
+        self.__basis = list(basis)
+        self.__non_basis = list(non_basis)
+        self.__variables_number = variables_number
+
+        self.__row_position = [-1 for _ in range(variables_number)]
+        self.__column_position = [-1 for _ in range(variables_number)]
+
+        for row_index, variable in enumerate(self.__basis):
+            self.__row_position[variable] = row_index
+
+        for column_index, variable in enumerate(self.__non_basis):
+            self.__column_position[variable] = column_index
+
+    def copy(self):
+        """Returns independent copy of bookkeeping"""
+        basis = Basis([], [], 0)
+
+        basis.__basis = self.__basis.copy()
+        basis.__non_basis = self.__non_basis.copy()
+        basis.__variables_number = self.__variables_number
+        basis.__row_position = self.__row_position.copy()
+        basis.__column_position = self.__column_position.copy()
+
+        return basis
+
+    def variables_number(self):
+        return self.__variables_number
+
+    def basis(self):
+        """Returns variables indices that stay in rows as list"""
+        return self.__basis
+
+    def non_basis(self):
+        """Returns variables indices that stay in columns as list"""
+        return self.__non_basis
+
+    def row_of(self, variable):
+        """Returns the row index of **variable** or -1 if it is not basic"""
+        return self.__row_position[variable]
+
+    def column_of(self, variable):
+        """Returns the column index of **variable** or -1 if it is basic (or removed)"""
+        return self.__column_position[variable]
+
+    def is_basic(self, variable):
+        return self.__row_position[variable] != -1
+
+    def exchange(self, row_index, column_index):
+        """Swaps basis variable at **row_index** and non-basis variable at **column_index**"""
+        leaving, entering = self.__basis[row_index], self.__non_basis[column_index]
+
+        self.__basis[row_index], self.__non_basis[column_index] = entering, leaving
+
+        self.__row_position[entering], self.__row_position[leaving] = row_index, -1
+        self.__column_position[leaving], self.__column_position[entering] = column_index, -1
+
+    def delete_column(self, column_index):
+        """Removes non-basis variable at **column_index** from bookkeeping"""
+        variable = self.__non_basis.pop(column_index)
+        self.__column_position[variable] = -1
+
+        for index in range(column_index, len(self.__non_basis)):
+            self.__column_position[self.__non_basis[index]] = index
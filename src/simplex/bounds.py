@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from src.common.sparse_matrix import SparseMatrix
+
+class Bounds:
+    """Bounds of variables: **lower[j] <= xj <= upper[j]**, None in **upper** means that variable is not bounded above"""
+
+    def __init__(self, lower = None, upper = None, variables_number = 0):
+        """Constructor. Omitted **lower** means zero lower bounds, omitted **upper** means no upper bounds"""
+        if lower is None:
+            lower = [0 for _ in range(variables_number)]
+
+        if upper is None:
+            upper = [None for _ in range(len(lower))]
+
+        self.__lower = list(lower)
+        self.__upper = list(upper)
+
+    @staticmethod
+    def from_pairs(pairs):
+        """Creates bounds from list of **(lower, upper)** pairs"""
+        return Bounds([pair[0] for pair in pairs], [pair[1] for pair in pairs])
+
+    def lower(self):
+        return self.__lower
+
+    def upper(self):
+        return self.__upper
+
+    def widths(self):
+        """Returns **upper - lower** for every variable (None if variable is not bounded above)"""
+        return [None if upper is None else upper - lower for lower, upper in zip(self.__lower, self.__upper)]
+
+    def is_trivial(self):
+        """Returns **True** if bounds are just **xj >= 0**"""
+        return all(lower == 0 for lower in self.__lower) and all(upper is None for upper in self.__upper)
+
+    def transform(self, matrix, func, complemented = None):
+        """Substitutes **xj = lower[j] + yj** and **yj = width[j] - y'j** for complemented variables.
+        Returns new matrix, new function and constant that must be added to the goal function"""
+        widths = self.widths()
+
+        # сдвиг на нижнюю границу и переход к дополнению: x = lower + width - y'
+        shifts = [lower + width if complemented is not None and complemented[j] else lower for j, (lower, width) in enumerate(zip(self.__lower, widths))]
+        signs = [-1 if complemented is not None and complemented[j] else 1 for j in range(len(self.__lower))]
+
+        constant = sum(cost*shift for cost, shift in zip(func, shifts))
+        new_func = [cost*sign for cost, sign in zip(func, signs)]
+
+        if isinstance(matrix, SparseMatrix):
+            free_index = matrix.column_number() - 1
+            rows = []
+
+            for row in matrix.rows():
+                new_row = {key: value*signs[key] if key != free_index else value for key, value in row.items()}
+                new_row[free_index] = row.get(free_index, 0) - sum(value*shifts[key] for key, value in row.items() if key != free_index)
+                rows.append({key: value for key, value in new_row.items() if value != 0})
+
+            return SparseMatrix(rows, matrix.column_number()), new_func, constant
+
+        new_matrix = []
+        for row in matrix:
+            new_row = [value*sign for value, sign in zip(row[:-1], signs)]
+            new_row.append(row[-1] - sum(value*shift for value, shift in zip(row[:-1], shifts)))
+            new_matrix.append(new_row)
+
+        return new_matrix, new_func, constant
+
+    def restore(self, values, complemented = None):
+        """Returns values of original variables by values of table variables"""
+        widths = self.widths()
+        solution = []
+
+        for j, value in enumerate(values):
+            if complemented is not None and complemented[j]:
+                value = widths[j] - value
+            solution.append(self.__lower[j] + value)
+
+        return solution
+
+    def is_feasible(self, variables, values):
+        """Returns **True** if table **values** of **variables** (indices) do not exceed widths of bounds"""
+        widths = self.widths()
+
+        return all(widths[variable] is None or value <= widths[variable] for variable, value in zip(variables, values))
+
+def bounded_ratio_test(backend, basis, upper, column_index):
+    """Ratio test of bounded-variable simplex for entering column **column_index**.
+    Returns row index of leaving variable, -1 if entering variable just flips to its upper bound, or None"""
+    column = backend.column(column_index)[:-1]
+    free_member = backend.free_member()
+    rows = basis.basis()
+    tolerances = backend.tolerances()
+
+    best_row, best_ratio = None, None
+
+    own_bound = upper[basis.non_basis()[column_index]]
+    if own_bound is not None:
+        best_row, best_ratio = -1, own_bound
+
+    for row_index, value in enumerate(column):
+        if tolerances.is_pivot(value):
+            ratio = free_member[row_index]/value
+        elif tolerances.is_pivot(-value) and upper[rows[row_index]] is not None:
+            ratio = (upper[rows[row_index]] - free_member[row_index])/(-value)
+        else:
+            continue
+
+        if best_ratio is None or ratio < best_ratio:
+            best_row, best_ratio = row_index, ratio
+
+    return best_row
+
+def find_bounded_pivot(backend, basis, upper):
+    """Returns **[row, column]** of pivot chosen by the most negative value of P vector and bounded ratio test (row is -1 for bound flip)"""
+    p_vector = backend.p_vector()
+    tolerances = backend.tolerances()
+    candidates = sorted((value, index) for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value))
+
+    for _, column_index in candidates:
+        row_index = bounded_ratio_test(backend, basis, upper, column_index)
+
+        if row_index is not None:
+            return [row_index, column_index]
+
+    return None
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+def infeasible_row(backend, basis, upper = None):
+    """Returns **(row, sign)** of basis variable with the largest bound violation or None if all free members are feasible.
+    **sign** is 1 for negative value and -1 for value that exceeds upper bound"""
+    rows = basis.basis()
+    tolerances = backend.tolerances()
+    best_row, best_sign, best_violation = None, 1, 0
+
+    for row_index, value in enumerate(backend.free_member()):
+        if tolerances.is_negative(value):
+            violation, sign = -value, 1
+        elif upper is not None and upper[rows[row_index]] is not None and tolerances.is_negative(upper[rows[row_index]] - value):
+            violation, sign = value - upper[rows[row_index]], -1
+        else:
+            continue
+
+        if violation > best_violation:
+            best_row, best_sign, best_violation = row_index, sign, violation
+
+    if best_row is None:
+        return None
+
+    return best_row, best_sign
+
+def find_dual_pivot(backend, basis, upper = None):
+    """Returns **[row, column]** of pivot for dual simplex method: the most infeasible row leaves,
+    entering column gives minimal ratio **P[j]/|a[row][j]|** (so the P vector stays non-negative). Returns None if there is no such column"""
+    found = infeasible_row(backend, basis, upper)
+
+    if found is None:
+        return None
+
+    row_index, sign = found
+    row = backend.row(row_index)
+    p_vector = backend.p_vector()
+    tolerances = backend.tolerances()
+
+    best_column, best_ratio = None, None
+
+    for column_index in range(len(row) - 1):
+        value = sign*row[column_index]
+
+        if not tolerances.is_pivot(-value):
+            continue
+
+        ratio = p_vector[column_index]/(-value)
+
+        if best_ratio is None or ratio < best_ratio:
+            best_column, best_ratio = column_index, ratio
+
+    if best_column is None:
+        return None
+
+    return [row_index, best_column]
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+class TableHistory:
+    """Tables of method by iterations with retention policy:
+    _full_ keeps every table, _ring_ keeps the last **size** tables, _pivots_ keeps only the last table and log of pivot elements.
+    Tables that are not made by pivot of the previous table (first tables of phases, tables with changed constraints) are always kept,
+    other tables are rebuilt on demand from the nearest kept one by pivots from the log"""
+
+    FULL = "full"
+    RING = "ring"
+    PIVOTS = "pivots"
+
+    def __init__(self, policy = FULL, size = 10, checkpoint = 0):
+        """Constructor. **size** - number of the last tables for _ring_ policy,
+        **checkpoint** - if not zero, every **checkpoint**-th table is kept too (it limits the length of rebuilding)"""
+        self.__policy = policy
+        self.__size = size if policy == TableHistory.RING else 1
+        self.__checkpoint = checkpoint
+
+        self.__tables = []
+        self.__pivots = []
+        self.__derived = []
+
+    def empty_copy(self):
+        """Returns empty history with the same retention policy"""
+        return TableHistory(self.__policy, self.__size, self.__checkpoint)
+
+    def policy(self):
+        return self.__policy
+
+    def kept_number(self):
+        """Returns the number of tables that are kept in memory"""
+        return sum(1 for table in self.__tables if table is not None)
+
+    def __len__(self):
+        return len(self.__tables)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.__tables)
+
+        if index < 0 or index >= len(self.__tables):
+            raise IndexError(index)
+
+        if self.__tables[index] is not None:
+            return self.__tables[index]
+
+        start = index
+        while self.__tables[start] is None:
+            start -= 1
+
+        table = self.__tables[start]
+
+        for position in range(start, index):
+            table = table.following_table()
+
+            if self.__pivots[position + 1] is not None:
+                table.set_pivot_element(*self.__pivots[position + 1])
+
+        return table
+
+    def append(self, table, derived = True):
+        """Adds **table**, **derived** means that table is made by pivot element of the last table"""
+        derived = derived and len(self.__tables) > 0
+
+        if derived:
+            self.__pivots[-1] = self.__tables[-1].pivot_index()
+
+        self.__add(table, None, derived)
+
+    def extend(self, history):
+        """Adds all tables of other **history** (kept tables and pivot log are taken as is)"""
+        for table, pivot, derived in zip(history.__tables, history.__pivots, history.__derived):
+            self.__add(table, pivot, derived and len(self.__tables) > 0)
+
+    def pop(self):
+        """Removes the last table, the new last table is rebuilt if it was not kept"""
+        self.__tables.pop()
+        self.__pivots.pop()
+        self.__derived.pop()
+
+        if self.__tables and self.__tables[-1] is None:
+            self.__tables[-1] = self[-1]
+
+    def clear(self):
+        self.__tables = []
+        self.__pivots = []
+        self.__derived = []
+
+    def __add(self, table, pivot, derived):
+        self.__tables.append(table)
+        self.__pivots.append(pivot)
+        self.__derived.append(derived)
+
+        if self.__policy == TableHistory.FULL:
+            return
+
+        # таблица, вышедшая из окна последних таблиц, хранится только если без неё не восстановить следующие
+        index = len(self.__tables) - 1 - self.__size
+
+        if index >= 0 and self.__derived[index] and not (self.__checkpoint and index % self.__checkpoint == 0):
+            self.__tables[index] = None
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+import copy
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from src.common.solver_stats import SolverStats
+from src.exceptions.exceptions import InfeasibleTaskError
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+
+# матрицы меньше этого числа элементов дешевле передать вместе с задачей
+SHARED_MEMORY_MIN_SIZE = 10000
+
+class SolverTask:
+    """Task for parallel solving: matrix with free member, goal function and method (_simplex_ needs **point**).
+    If **stats** is **True**, result gets statistics of solving as dict (see **SolverStats.to_dict**), **presolve** and **scaling** - see **SimplexMethod**"""
+
+    SIMPLEX = "simplex"
+    ARTIFICIAL = "artificial"
+
+    def __init__(self, matrix, func, method = ARTIFICIAL, fractional = False, point = None, bounds = None, backend = None, pricing = None, stats = False, presolve = False, scaling = None):
+        self.matrix = matrix
+        self.func = func
+        self.method = method
+        self.fractional = fractional
+        self.point = point
+        self.bounds = bounds
+        self.backend = backend
+        self.pricing = pricing
+        self.stats = stats
+        self.presolve = presolve
+        self.scaling = scaling
+
+    def size(self):
+        """Returns the number of matrix values (used for scheduling the largest tasks first)"""
+        if self.matrix is None:
+            return 0
+
+        if hasattr(self.matrix, "nonzeros"):
+            return self.matrix.row_number()*self.matrix.column_number()
+
+        return len(self.matrix)*len(self.matrix[0])
+
+    def without_matrix(self):
+        """Returns copy of task without matrix (matrix is passed through shared memory)"""
+        task = copy.copy(self)
+        task.matrix = None
+
+        return task
+
+    def create_method(self, matrix):
+        stats = SolverStats() if self.stats else None
+
+        if self.method == SolverTask.SIMPLEX:
+            return SimplexMethod(matrix = matrix, func = list(self.func), fractional = self.fractional, point = self.point, backend = self.backend, bounds = self.bounds, pricing = self.pricing, stats = stats, presolve = self.presolve, scaling = self.scaling)
+
+        return ArtificialBasisMethod(matrix = matrix, func = list(self.func), fractional = self.fractional, backend = self.backend, bounds = self.bounds, pricing = self.pricing, stats = stats, presolve = self.presolve, scaling = self.scaling)
+
+class SolverResult:
+    """Result of task solved in worker process. **status** - _optimal_, _unbounded_, _infeasible_ or _error_,
+    **p0** and **solution** are set only for optimal tasks, **error** is message of raised exception or None"""
+
+    OPTIMAL = "optimal"
+    UNBOUNDED = "unbounded"
+    INFEASIBLE = "infeasible"
+    ERROR = "error"
+
+    def __init__(self, index, status = OPTIMAL, p0 = None, solution = None, basis = None, iterations = 0, error = None, stats = None):
+        self.index = index
+        self.status = status
+        self.p0 = p0
+        self.solution = solution
+        self.basis = basis
+        self.iterations = iterations
+        self.error = error
+        self.stats = stats
+
+class SharedMatrix:
+    """Dense matrix of floats (or integers) placed in shared memory once for all worker processes"""
+
+    def __init__(self, matrix, integer = False):
+        self.__typecode = "q" if integer else "d"
+        self.__shape = (len(matrix), len(matrix[0]))
+
+        data = array(self.__typecode, (int(item) if integer else float(item) for row in matrix for item in row)).tobytes()
+
+        self.__memory = shared_memory.SharedMemory(create = True, size = max(len(data), 1))
+        self.__memory.buf[:len(data)] = data
+
+    @staticmethod
+    def can_share(matrix, fractional):
+        """Returns **True** if matrix is dense and its values are kept exactly (fractional matrices must be integer)"""
+        if not isinstance(matrix, list):
+            return False
+
+        if fractional:
+            return all(item == int(item) and abs(item) < 2**63 for row in matrix for item in row)
+
+        return True
+
+    def descriptor(self):
+        """Returns picklable description that is enough to read matrix in other process"""
+        return self.__memory.name, self.__shape, self.__typecode
+
+    def release(self):
+        self.__memory.close()
+        self.__memory.unlink()
+
+    @staticmethod
+    def read(descriptor):
+        """Returns matrix (list of rows) read from shared memory by **descriptor**"""
+        name, (rows, columns), typecode = descriptor
+
+        memory = shared_memory.SharedMemory(name = name)
+
+        try:
+            values = array(typecode)
+            values.frombytes(bytes(memory.buf[:rows*columns*values.itemsize]))
+        finally:
+            memory.close()
+
+        values = values.tolist()
+
+        return [values[i*columns:(i + 1)*columns] for i in range(rows)]
+
+def solve_task(index, task, descriptor = None):
+    """Solves task in worker process, matrix is read from shared memory if **descriptor** is given"""
+    matrix = SharedMatrix.read(descriptor) if descriptor is not None else task.matrix
+
+    try:
+        method = task.create_method(matrix)
+        method.auto_solve()
+    except InfeasibleTaskError as error:
+        return SolverResult(index, SolverResult.INFEASIBLE, error = error.message)
+    except Exception as error:
+        return SolverResult(index, SolverResult.ERROR, error = getattr(error, "message", None) or repr(error))
+
+    table = method.last_table()
+    stats = method.stats().to_dict() if method.stats() is not None else None
+
+    if not table.first_statement():
+        return SolverResult(index, SolverResult.UNBOUNDED, iterations = method.current_iteration(), stats = stats)
+
+    return SolverResult(index,
+                        p0 = method.p0(),
+                        solution = method.solution(),
+                        basis = table.row_variables(),
+                        iterations = method.current_iteration(),
+                        stats = stats)
+
+class ParallelSolver:
+    """Solves independent tasks in **ProcessPoolExecutor**. Big matrices are put to shared memory once
+    (tasks with the same matrix object share it), results are yielded as soon as tasks are completed"""
+
+    def __init__(self, max_workers = None, shared_memory_min_size = SHARED_MEMORY_MIN_SIZE):
+        self.__max_workers = max_workers
+        self.__shared_memory_min_size = shared_memory_min_size
+
+    def solve(self, tasks):
+        """Generator of **SolverResult** for **tasks** (list of **SolverTask**) in order of completion, **index** is position in **tasks**"""
+        shared = {}
+
+        try:
+            with ProcessPoolExecutor(max_workers = self.__max_workers) as executor:
+                futures = []
+
+                # большие задачи отправляются первыми, чтобы не остаться в конце на одном процессе
+                for index in sorted(range(len(tasks)), key = lambda index: tasks[index].size(), reverse = True):
+                    futures.append(self.__submit(executor, index, tasks[index], shared))
+
+                for future in as_completed(futures):
+                    yield future.result()
+        finally:
+            for matrix in shared.values():
+                matrix.release()
+
+    def __submit(self, executor, index, task, shared):
+        if task.size() < self.__shared_memory_min_size or not SharedMatrix.can_share(task.matrix, task.fractional):
+            return executor.submit(solve_task, index, task)
+
+        key = (id(task.matrix), task.fractional)
+
+        if key not in shared:
+            shared[key] = SharedMatrix(task.matrix, integer = task.fractional)
+
+        return executor.submit(solve_task, index, task.without_matrix(), shared[key].descriptor())
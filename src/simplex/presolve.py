@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+import math
+from fractions import Fraction
+from src.common.sparse_matrix import SparseMatrix
+from src.exceptions.exceptions import InfeasibleTaskError
+from src.simplex.bounds import Bounds
+
+EMPTY_ROWS = "empty_rows"
+SINGLETON_ROWS = "singleton_rows"
+DUPLICATE_ROWS = "duplicate_rows"
+FIXED_COLUMNS = "fixed_columns"
+EMPTY_COLUMNS = "empty_columns"
+DOMINATED_COLUMNS = "dominated_columns"
+
+# в режиме float значения после подстановок сравниваются с относительной погрешностью
+RELATIVE_TOLERANCE = 1e-9
+ABSOLUTE_TOLERANCE = 1e-12
+
+def is_close(a, b):
+    """Exact comparison of fractions and integers, comparison with tolerance if one of values is float"""
+    if isinstance(a, float) or isinstance(b, float):
+        return math.isclose(a, b, rel_tol = RELATIVE_TOLERANCE, abs_tol = ABSOLUTE_TOLERANCE)
+
+    return a == b
+
+class Presolve:
+    """Shrinks task **A*x = b, lower <= x <= upper, min c*x** before solving and maps solution of reduced task back (postsolve).
+    Reductions are repeated while they change something:
+    - empty rows are removed (or task is infeasible if their free member is not zero);
+    - singleton rows **a*xj = b** fix variable **xj = b/a**;
+    - duplicate rows (proportional with free member) are removed, proportional rows with other free member mean infeasible task;
+    - fixed variables (**lower = upper**) are substituted to free member and goal function;
+    - empty columns are fixed at the bound that is better for goal function;
+    - dominated columns: if column k is column j multiplied by **t > 0**, **xj** is not bounded above and **c[k] >= t*c[j]**, then **xk** is fixed at lower bound.
+    The last row is never removed, so reduced task always has constraints. Variables of given basis point are not fixed as empty or dominated columns"""
+
+    def __init__(self, matrix, func, bounds = None, fractional = False, point = None):
+        """Constructor. **matrix** - list of lists or **SparseMatrix** with free member in the last column, **bounds** - **Bounds** or None.
+        In **fractional** mode values are converted to fractions, so substitutions stay exact. **point** - flags of basis variables or None"""
+        self.__sparse = isinstance(matrix, SparseMatrix)
+
+        if self.__sparse:
+            free_index = matrix.column_number() - 1
+            self.__variables_number = free_index
+            self.__rows = [{key: value for key, value in row.items() if key != free_index} for row in matrix.rows()]
+            self.__free_member = [row.get(free_index, 0) for row in matrix.rows()]
+        else:
+            self.__variables_number = len(matrix[0]) - 1
+            self.__rows = [{key: value for key, value in enumerate(row[:-1]) if value != 0} for row in matrix]
+            self.__free_member = [row[-1] for row in matrix]
+
+        self.__func = list(func)
+        self.__has_bounds = bounds is not None
+
+        if bounds is None:
+            bounds = Bounds(variables_number = self.__variables_number)
+
+        self.__lower = list(bounds.lower())
+        self.__upper = list(bounds.upper())
+
+        if fractional:
+            self.__rows = [{key: Fraction(value) for key, value in row.items()} for row in self.__rows]
+            self.__free_member = [Fraction(value) for value in self.__free_member]
+            self.__func = [Fraction(value) for value in self.__func]
+            self.__lower = [Fraction(value) for value in self.__lower]
+            self.__upper = [Fraction(value) if value is not None else None for value in self.__upper]
+
+        # базисные переменные заданной точки не закрепляются, иначе точка перестанет подходить сокращённой задаче
+        self.__protected = set(j for j, flag in enumerate(point) if flag) if point is not None else set()
+
+        self.__row_indices = list(range(len(self.__rows)))
+        self.__column_indices = list(range(self.__variables_number))
+        self.__fixed = {}
+        self.__constant = 0
+        self.__bounds = None
+        self.__reductions = {name: 0 for name in [EMPTY_ROWS, SINGLETON_ROWS, DUPLICATE_ROWS, FIXED_COLUMNS, EMPTY_COLUMNS, DOMINATED_COLUMNS]}
+
+    def reduce(self):
+        """Applies reductions. Returns reduced matrix (of the same storage as original one), goal function and bounds (None if they are trivial).
+        Raises **InfeasibleTaskError** if reductions prove that constraints can not hold"""
+        active_rows = set(range(len(self.__rows)))
+        active_columns = set(range(self.__variables_number))
+        columns = {j: set() for j in active_columns}
+
+        for i, row in enumerate(self.__rows):
+            for j in row:
+                columns[j].add(i)
+
+        def fix(j, value):
+            lower, upper = self.__lower[j], self.__upper[j]
+
+            if value < lower:
+                if not is_close(value, lower):
+                    raise InfeasibleTaskError()
+                value = lower
+
+            if upper is not None and value > upper:
+                if not is_close(value, upper):
+                    raise InfeasibleTaskError()
+                value = upper
+
+            for i in columns[j]:
+                self.__free_member[i] -= self.__rows[i].pop(j)*value
+
+            self.__fixed[j] = value
+            self.__constant += self.__func[j]*value
+            active_columns.discard(j)
+            columns[j] = set()
+
+        def remove_row(i):
+            for j in self.__rows[i]:
+                columns[j].discard(i)
+
+            active_rows.discard(i)
+
+        changed = True
+
+        while changed:
+            changed = False
+
+            for j in sorted(active_columns):
+                if self.__upper[j] is not None and self.__upper[j] == self.__lower[j]:
+                    fix(j, self.__lower[j])
+                    self.__reductions[FIXED_COLUMNS] += 1
+                    changed = True
+
+            for i in sorted(active_rows):
+                row = self.__rows[i]
+
+                if len(row) == 0:
+                    if not is_close(self.__free_member[i], 0):
+                        raise InfeasibleTaskError()
+
+                    if len(active_rows) > 1:
+                        remove_row(i)
+                        self.__reductions[EMPTY_ROWS] += 1
+                        changed = True
+                elif len(row) == 1 and len(active_rows) > 1:
+                    [(j, value)] = row.items()
+                    fix(j, self.__free_member[i]/value)
+                    remove_row(i)
+                    self.__reductions[SINGLETON_ROWS] += 1
+                    changed = True
+
+            for j in sorted(active_columns):
+                if len(columns[j]) == 0 and j not in self.__protected:
+                    cost = self.__func[j]
+
+                    # переменная с отрицательной стоимостью без верхней границы оставлена: неограниченность определит симплекс-метод
+                    if cost >= 0:
+                        fix(j, self.__lower[j])
+                    elif self.__upper[j] is not None:
+                        fix(j, self.__upper[j])
+                    else:
+                        continue
+
+                    self.__reductions[EMPTY_COLUMNS] += 1
+                    changed = True
+
+            changed = self.__remove_duplicate_rows(active_rows, remove_row) or changed
+            changed = self.__remove_dominated_columns(active_columns, columns, fix) or changed
+
+        self.__row_indices = sorted(active_rows)
+        self.__column_indices = sorted(active_columns)
+
+        return self.__reduced_task()
+
+    def __remove_duplicate_rows(self, active_rows, remove_row):
+        """Removes rows proportional to other rows (with free member). Returns **True** if something is removed"""
+        keys = {}
+        changed = False
+
+        for i in sorted(active_rows):
+            row = self.__rows[i]
+
+            if len(row) == 0:
+                continue
+
+            first = row[min(row)]
+            key = tuple(sorted((j, value/first) for j, value in row.items()))
+
+            if key not in keys:
+                keys[key] = i
+                continue
+
+            original = keys[key]
+            factor = first/self.__rows[original][min(row)]
+
+            if not is_close(self.__free_member[i], self.__free_member[original]*factor):
+                raise InfeasibleTaskError()
+
+            remove_row(i)
+            self.__reductions[DUPLICATE_ROWS] += 1
+            changed = True
+
+        return changed
+
+    def __remove_dominated_columns(self, active_columns, columns, fix):
+        """Fixes variables of columns dominated by proportional columns. Returns **True** if something is fixed"""
+        keys = {}
+
+        for j in sorted(active_columns):
+            if len(columns[j]) == 0:
+                continue
+
+            first_row = min(columns[j])
+            first = self.__rows[first_row][j]
+            key = tuple(sorted((i, self.__rows[i][j]/first) for i in columns[j]))
+
+            keys.setdefault((key, first > 0), []).append(j)
+
+        changed = False
+
+        for group in keys.values():
+            if len(group) < 2:
+                continue
+
+            for k in group:
+                if k not in active_columns or k in self.__protected:
+                    continue
+
+                for j in group:
+                    if j == k or j not in active_columns or self.__upper[j] is not None:
+                        continue
+
+                    # column k = t*column j, t > 0
+                    first_row = min(columns[j])
+                    factor = self.__rows[first_row][k]/self.__rows[first_row][j]
+
+                    if self.__func[k] >= factor*self.__func[j] and not (self.__func[k] == factor*self.__func[j] and k < j):
+                        fix(k, self.__lower[k])
+                        self.__reductions[DOMINATED_COLUMNS] += 1
+                        changed = True
+                        break
+
+        return changed
+
+    def __reduced_task(self):
+        column_map = {j: index for index, j in enumerate(self.__column_indices)}
+        free_index = len(self.__column_indices)
+
+        rows = []
+
+        for i in self.__row_indices:
+            row = {column_map[j]: value for j, value in self.__rows[i].items()}
+
+            if self.__free_member[i] != 0:
+                row[free_index] = self.__free_member[i]
+
+            rows.append(row)
+
+        matrix = SparseMatrix(rows, free_index + 1)
+
+        if not self.__sparse:
+            matrix = matrix.to_dense()
+
+        func = [self.__func[j] for j in self.__column_indices]
+
+        self.__bounds = Bounds([self.__lower[j] for j in self.__column_indices], [self.__upper[j] for j in self.__column_indices])
+
+        if not self.__has_bounds and self.__bounds.is_trivial():
+            self.__bounds = None
+
+        return matrix, func, self.__bounds
+
+    def constant(self):
+        """Returns value of goal function on fixed variables (it is added to p0 of reduced task)"""
+        return self.__constant
+
+    def bounds(self):
+        """Returns bounds of variables of reduced task (None if they are trivial)"""
+        return self.__bounds
+
+    def reductions(self):
+        """Returns dict that maps name of reduction to the number of its applications"""
+        return self.__reductions
+
+    def removed_rows(self):
+        """Returns indices of removed rows of original matrix"""
+        kept = set(self.__row_indices)
+        return [i for i in range(len(self.__rows)) if i not in kept]
+
+    def removed_columns(self):
+        """Returns indices of fixed variables of original task"""
+        return sorted(self.__fixed)
+
+    def has_same_reductions(self, other):
+        """Returns **True** if **other** presolve (None - task is not reduced) removed the same rows and columns,
+        so variables and constraints of reduced tasks correspond to each other"""
+        if other is None:
+            return not self.removed_rows() and not self.removed_columns()
+
+        return self.removed_rows() == other.removed_rows() and self.removed_columns() == other.removed_columns()
+
+    def fixed_values(self):
+        """Returns dict that maps index of fixed variable to its value"""
+        return self.__fixed
+
+    def report(self):
+        """Returns reductions and sizes of original and reduced tasks as dict"""
+        return {
+            "reductions": dict(self.__reductions),
+            "rows": [len(self.__rows), len(self.__row_indices)],
+            "columns": [self.__variables_number, len(self.__column_indices)],
+        }
+
+    def variables_number(self):
+        """Returns the number of variables of original task"""
+        return self.__variables_number
+
+    def reduce_values(self, values):
+        """Returns values given for every original variable (like flags of complemented variables) only for variables of reduced task"""
+        return [values[j] for j in self.__column_indices]
+
+    def reduce_point(self, point):
+        """Returns basis point (flags of basis variables) for reduced task or None if it does not fit reduced rows"""
+        if point is None:
+            return None
+
+        reduced = self.reduce_values(point)
+
+        if sum(1 for item in reduced if item) != len(self.__row_indices):
+            return None
+
+        return reduced
+
+    def restore(self, values):
+        """Returns values of original variables **x1..xN** by values of reduced task variables"""
+        solution = [None for _ in range(self.__variables_number)]
+
+        for index, j in enumerate(self.__column_indices):
+            solution[j] = values[index]
+
+        for j, value in self.__fixed.items():
+            solution[j] = value
+
+        return solution + list(values[len(self.__column_indices):])
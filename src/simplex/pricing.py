@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+from src.exceptions.exceptions import PricingError
+from src.simplex.bounds import bounded_ratio_test, find_bounded_pivot
+
+class DantzigPricing:
+    """Dantzig's rule: column with the most negative value of P vector, then minimal ratio"""
+
+    NAME = "dantzig"
+
+    def copy(self):
+        return self
+
+    def find_pivot(self, backend, basis, bounds = None):
+        """Returns **[row, column]** of pivot element or None"""
+        if bounds is not None:
+            return find_bounded_pivot(backend, basis, bounds)
+
+        return backend.find_pivot()
+
+    def update(self, backend, basis, row_index, column_index):
+        """Called before pivot around **[row_index, column_index]**"""
+        pass
+
+class PricingRule(DantzigPricing):
+    """Base of pricing rules that order candidate columns themselves (subclasses redefine **candidates**).
+    By itself it is Dantzig's rule that tries the next column if ratio test of the previous one finds no row"""
+
+    def candidates(self, p_vector, basis, tolerances):
+        """Returns indices of columns with negative value of P vector (below **-tolerances.dual()**) in order of preference:
+        the most negative first"""
+        return sorted((index for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value)), key = lambda index: p_vector[index])
+
+    def ratio_test(self, backend, basis, column_index):
+        return backend.ratio_test(column_index)
+
+    def find_pivot(self, backend, basis, bounds = None):
+        for column_index in self.candidates(backend.p_vector(), basis, backend.tolerances()):
+            if bounds is not None:
+                row_index = bounded_ratio_test(backend, basis, bounds, column_index)
+            else:
+                row_index = self.ratio_test(backend, basis, column_index)
+
+            if row_index is not None:
+                return [row_index, column_index]
+
+        return None
+
+class BlandPricing(PricingRule):
+    """Bland's rule: variable with the smallest index among columns with negative P and among leaving candidates (prevents cycling)"""
+
+    NAME = "bland"
+
+    def candidates(self, p_vector, basis, tolerances):
+        non_basis = basis.non_basis()
+        return sorted((index for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value)), key = lambda index: non_basis[index])
+
+    def ratio_test(self, backend, basis, column_index):
+        column = backend.column(column_index)[:-1]
+        free_member = backend.free_member()
+        rows = basis.basis()
+        tolerances = backend.tolerances()
+
+        best_row, best_ratio = None, None
+
+        for row_index, value in enumerate(column):
+            if not tolerances.is_pivot(value):
+                continue
+
+            ratio = free_member[row_index]/value
+
+            if best_ratio is None or ratio < best_ratio or (ratio == best_ratio and rows[row_index] < rows[best_row]):
+                best_row, best_ratio = row_index, ratio
+
+        return best_row
+
+class DevexPricing(PricingRule):
+    """Devex rule: the largest **P[j]^2/w[j]**, reference weights **w** approximate norms of columns and are updated on every pivot"""
+
+    NAME = "devex"
+
+    def __init__(self):
+        self.__weights = {}
+
+    def copy(self):
+        pricing = DevexPricing()
+        pricing.__weights = dict(self.__weights)
+
+        return pricing
+
+    def candidates(self, p_vector, basis, tolerances):
+        non_basis = basis.non_basis()
+        indices = [index for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value)]
+
+        return sorted(indices, key = lambda index: -p_vector[index]*p_vector[index]/self.__weights.get(non_basis[index], 1))
+
+    def update(self, backend, basis, row_index, column_index):
+        row = backend.row(row_index)
+        pivot_value = row[column_index]
+
+        non_basis = basis.non_basis()
+        entering_weight = self.__weights.get(non_basis[column_index], 1)
+
+        for index, variable in enumerate(non_basis):
+            if index == column_index or row[index] == 0:
+                continue
+
+            ratio = row[index]/pivot_value
+            self.__weights[variable] = max(self.__weights.get(variable, 1), ratio*ratio*entering_weight)
+
+        self.__weights[basis.basis()[row_index]] = max(entering_weight/(pivot_value*pivot_value), 1)
+
+class SteepestEdgePricing(PricingRule):
+    """Steepest edge rule: the largest **P[j]^2/g[j]** where **g[j] = 1 + |column j|^2**.
+    Weights are computed once and then updated on every pivot by recurrence **g[j] - 2*s*(column j, column q) + s^2*g[q]**"""
+
+    NAME = "steepest_edge"
+
+    def __init__(self):
+        self.__weights = None
+
+    def copy(self):
+        pricing = SteepestEdgePricing()
+        pricing.__weights = dict(self.__weights) if self.__weights is not None else None
+
+        return pricing
+
+    def __init_weights(self, backend, basis):
+        self.__weights = {}
+
+        for index, variable in enumerate(basis.non_basis()):
+            self.__weights[variable] = 1 + sum(value*value for value in backend.column(index)[:-1])
+
+    def candidates(self, p_vector, basis, tolerances):
+        non_basis = basis.non_basis()
+        indices = [index for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value)]
+
+        return sorted(indices, key = lambda index: -p_vector[index]*p_vector[index]/self.__weights.get(non_basis[index], 1))
+
+    def find_pivot(self, backend, basis, bounds = None):
+        if self.__weights is None:
+            self.__init_weights(backend, basis)
+
+        return PricingRule.find_pivot(self, backend, basis, bounds)
+
+    def update(self, backend, basis, row_index, column_index):
+        if self.__weights is None:
+            self.__init_weights(backend, basis)
+
+        row = backend.row(row_index)
+        pivot_value = row[column_index]
+        products = backend.column_products(column_index)
+
+        non_basis = basis.non_basis()
+        entering_weight = self.__weights.get(non_basis[column_index], 1)
+
+        for index, variable in enumerate(non_basis):
+            if index == column_index or row[index] == 0:
+                continue
+
+            ratio = row[index]/pivot_value
+            weight = self.__weights.get(variable, 1) - 2*ratio*products[index] + ratio*ratio*entering_weight
+
+            self.__weights[variable] = max(weight, 1 + ratio*ratio)
+
+        self.__weights[basis.basis()[row_index]] = entering_weight/(pivot_value*pivot_value)
+
+PRICING_RULES = {
+    DantzigPricing.NAME: DantzigPricing,
+    SteepestEdgePricing.NAME: SteepestEdgePricing,
+    DevexPricing.NAME: DevexPricing,
+    BlandPricing.NAME: BlandPricing,
+}
+
+def create_pricing(pricing = None):
+    """Returns pricing rule by its name (Dantzig's rule by default) or copy of **pricing** if it is already an object"""
+    if pricing is None:
+        return DantzigPricing()
+
+    if not isinstance(pricing, str):
+        return pricing.copy()
+
+    if pricing not in PRICING_RULES:
+        raise PricingError()
+
+    return PRICING_RULES[pricing]()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from src.exceptions.exceptions import SingularMatrixError
+
+class BasisFactorization:
+    """Class that keeps LU factorization of basis matrix **B** (PB = LU) and eta file of product form updates"""
+
+    def __init__(self, columns = None, fractional = False, refactor_frequency = 50, factors = None):
+        """Constructor. **columns** - list of basis columns (each column is list of **m** values).
+        **factors** - ready **(permutation, lower, upper)** of basis matrix (like **Gauss.lu_factors()**), then **columns** are not factorized again"""
+        self.__fractional = fractional
+        self.__refactor_frequency = refactor_frequency
+
+        if factors is not None:
+            self.__permutation, self.__lower, self.__upper = [list(item) for item in factors]
+            self.__size = len(self.__permutation)
+            self.__etas = []
+        else:
+            self.factorize(columns)
+
+    def factorize(self, columns):
+        """Computes LU factorization of matrix made from **columns**, eta file is cleared"""
+        size = len(columns)
+
+        upper = [[columns[k][i] for k in range(size)] for i in range(size)]
+        lower = [[0 for _ in range(size)] for _ in range(size)]
+        permutation = list(range(size))
+
+        for k in range(size):
+            if self.__fractional:
+                pivot_row = next((i for i in range(k, size) if upper[i][k] != 0), None)
+            else:
+                pivot_row = max(range(k, size), key = lambda i: abs(upper[i][k]))
+
+            if pivot_row is None or upper[pivot_row][k] == 0:
+                raise SingularMatrixError()
+
+            if pivot_row != k:
+                upper[k], upper[pivot_row] = upper[pivot_row], upper[k]
+                lower[k], lower[pivot_row] = lower[pivot_row], lower[k]
+                permutation[k], permutation[pivot_row] = permutation[pivot_row], permutation[k]
+
+            pivot_value = upper[k][k]
+            pivot_row_values = upper[k]
+
+            for i in range(k + 1, size):
+                if upper[i][k] == 0:
+                    continue
+
+                coeff = upper[i][k]/pivot_value
+                lower[i][k] = coeff
+
+                row = upper[i]
+                for j in range(k, size):
+                    row[j] -= coeff*pivot_row_values[j]
+
+        self.__size = size
+        self.__lower = lower
+        self.__upper = upper
+        self.__permutation = permutation
+        self.__etas = []
+
+    def size(self):
+        return self.__size
+
+    def etas_number(self):
+        """Returns the number of product form updates made since the last factorization"""
+        return len(self.__etas)
+
+    def need_refactor(self):
+        return len(self.__etas) >= self.__refactor_frequency
+
+    def ftran(self, column):
+        """Solves **Bx = column** and returns **x** as list"""
+        size, lower, upper = self.__size, self.__lower, self.__upper
+
+        x = [column[self.__permutation[i]] for i in range(size)]
+
+        for i in range(size):
+            row = lower[i]
+            s = x[i]
+            for k in range(i):
+                if row[k] != 0:
+                    s -= row[k]*x[k]
+            x[i] = s
+
+        for i in reversed(range(size)):
+            row = upper[i]
+            s = x[i]
+            for j in range(i + 1, size):
+                if row[j] != 0:
+                    s -= row[j]*x[j]
+            x[i] = s/row[i]
+
+        for row_index, eta in self.__etas:
+            value = x[row_index]
+            if value == 0:
+                continue
+            for i, item in enumerate(eta):
+                if i == row_index:
+                    x[i] = item*value
+                else:
+                    x[i] += item*value
+
+        return x
+
+    def btran(self, row):
+        """Solves **yB = row** and returns **y** as list"""
+        size, lower, upper = self.__size, self.__lower, self.__upper
+
+        z = list(row)
+
+        for row_index, eta in reversed(self.__etas):
+            z[row_index] = sum(item*value for item, value in zip(eta, z))
+
+        v = [0 for _ in range(size)]
+        for i in range(size):
+            s = z[i]
+            for k in range(i):
+                if upper[k][i] != 0:
+                    s -= upper[k][i]*v[k]
+            v[i] = s/upper[i][i]
+
+        u = [0 for _ in range(size)]
+        for i in reversed(range(size)):
+            s = v[i]
+            for k in range(i + 1, size):
+                if lower[k][i] != 0:
+                    s -= lower[k][i]*u[k]
+            u[i] = s
+
+        y = [0 for _ in range(size)]
+        for i in range(size):
+            y[self.__permutation[i]] = u[i]
+
+        return y
+
+    def update(self, row_index, column):
+        """Appends eta matrix for replacing basis column at **row_index** by column with **ftran** result **column**"""
+        pivot_value = column[row_index]
+
+        eta = [-item/pivot_value for item in column]
+        eta[row_index] = 1/pivot_value
+
+        self.__etas.append((row_index, eta))
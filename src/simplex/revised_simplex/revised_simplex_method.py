@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+import copy
+from fractions import Fraction
+from src.gauss.gauss import Gauss
+from src.exceptions.exceptions import *
+from src.simplex.basis import Basis
+from src.common.sparse_matrix import SparseMatrix, prepare_storage
+from src.simplex.tolerances import create_tolerances
+from src.simplex.stalling import STALLING_LIMIT
+from .basis_factorization import BasisFactorization
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class RevisedSimplexMethod:
+    """Revised simplex method: keeps LU factorization of basis instead of the whole simplex table.
+    Only the entering column and the reduced costs are computed on each iteration.
+    **tolerances** - comparisons with zero and ratio test (see **Tolerances**, exact for fractions and default tolerances for floats).
+    If basis repeats or **stalling_limit** degenerate iterations go in a row, Bland's rule is used until goal function changes"""
+
+    def __init__(self, matrix = None, func = None, fractional = False, point = None, refactor_frequency = 50, sparse = None, tolerances = None, stalling_limit = STALLING_LIMIT):
+        self.__matrix = matrix
+        self.__sparse = sparse
+        self.__func = func
+        self.__fractional = fractional
+        self.__point = point
+        self.__refactor_frequency = refactor_frequency
+        self.__current_iteration = 0
+        self.__can_continue = True
+        self.__unlimited = False
+        self.__p0 = None
+        self.__tolerances = create_tolerances(tolerances, fractional)
+        self.__stalling_limit = stalling_limit
+        self.__bland = False
+        self.__degenerate_number = 0
+        self.__visited = set()
+
+    def __prepare(self):
+        """Reads problem data and finds starting basis"""
+        convert = Fraction if self.__fractional else float
+
+        self.__matrix = prepare_storage(self.__matrix, sparse = self.__sparse)
+        self.__costs = [convert(item) for item in self.__func]
+
+        if isinstance(self.__matrix, SparseMatrix):
+            row_number, variables_number = self.__matrix.row_number(), self.__matrix.column_number() - 1
+
+            # столбцы хранятся как словари {номер строки: ненулевое значение}
+            self.__columns = [{} for _ in range(variables_number)]
+            self.__free_member = [0 for _ in range(row_number)]
+
+            for row_index, row in enumerate(self.__matrix.rows()):
+                for column_index, value in row.items():
+                    if column_index == variables_number:
+                        self.__free_member[row_index] = convert(value)
+                    else:
+                        self.__columns[column_index][row_index] = convert(value)
+        else:
+            row_number, variables_number = len(self.__matrix), len(self.__matrix[0]) - 1
+
+            self.__columns = [[convert(row[j]) for row in self.__matrix] for j in range(variables_number)]
+            self.__free_member = [convert(row[-1]) for row in self.__matrix]
+
+        self.__row_number = row_number
+
+        if self.__point is not None:
+            basis = [index for index, value in enumerate(self.__point) if value]
+
+            if len(basis) != row_number:
+                raise BasisSizeError()
+        else:
+            matrix = self.__matrix.copy() if isinstance(self.__matrix, SparseMatrix) else copy.deepcopy(self.__matrix)
+            gauss = Gauss(matrix = matrix, fractional = self.__fractional)
+
+            if not gauss.solve():
+                raise SingularMatrixError()
+
+            basis = [int(name[1:]) - 1 for name in gauss.variables()[:row_number]]
+
+        basis_set = set(basis)
+        non_basis = [index for index in range(variables_number) if index not in basis_set]
+
+        self.__basis = Basis(basis, non_basis, variables_number)
+
+        # разложение, найденное методом Гаусса для выбора базиса, используется повторно
+        factors = gauss.lu_factors() if self.__point is None else None
+
+        self.__factorization = BasisFactorization(columns = [self.__dense_column(index) for index in basis] if factors is None else None,
+                                                  fractional = self.__fractional,
+                                                  refactor_frequency = self.__refactor_frequency,
+                                                  factors = factors)
+
+        self.__basis_values = self.__factorization.ftran(self.__free_member)
+
+        if any(self.__tolerances.is_negative(value) for value in self.__basis_values):
+            raise BasisError()
+
+        if np is not None and not self.__fractional and not isinstance(self.__matrix, SparseMatrix):
+            self.__array = np.array(self.__columns, dtype = np.float64).T
+            self.__cost_array = np.array(self.__costs, dtype = np.float64)
+        else:
+            self.__array = None
+
+    def __dense_column(self, index):
+        """Returns column of matrix at **index** as list"""
+        column = self.__columns[index]
+
+        if isinstance(column, dict):
+            return [column.get(row_index, 0) for row_index in range(self.__row_number)]
+
+        return column
+
+    def __reduced_costs(self):
+        """Returns reduced costs of non-basis variables in order of table columns"""
+        multipliers = self.__factorization.btran([self.__costs[index] for index in self.__basis.basis()])
+        non_basis = self.__basis.non_basis()
+
+        if self.__array is not None:
+            reduced_costs = self.__cost_array - np.array(multipliers) @ self.__array
+            return reduced_costs[non_basis].tolist()
+
+        reduced_costs = []
+        for index in non_basis:
+            s = self.__costs[index]
+            column = self.__columns[index]
+
+            if isinstance(column, dict):
+                for row_index, item in column.items():
+                    s -= multipliers[row_index]*item
+            else:
+                for multiplier, item in zip(multipliers, column):
+                    if item != 0:
+                        s -= multiplier*item
+
+            reduced_costs.append(s)
+
+        return reduced_costs
+
+    def __ratio_test(self, column):
+        """Returns row index with minimal ratio of basis value to positive entry of **column** (Harris ratio test in float mode)"""
+        return self.__tolerances.ratio_test([(index, value, self.__basis_values[index]) for index, value in enumerate(column)])
+
+    def __bland_ratio_test(self, column):
+        """Returns row index with minimal ratio, ties are broken by the smallest index of basis variable (Bland's rule)"""
+        rows = self.__basis.basis()
+        best_row, best_ratio = None, None
+
+        for index, value in enumerate(column):
+            if not self.__tolerances.is_pivot(value):
+                continue
+
+            ratio = self.__basis_values[index]/value
+
+            if best_ratio is None or ratio < best_ratio or (ratio == best_ratio and rows[index] < rows[best_row]):
+                best_row, best_ratio = index, ratio
+
+        return best_row
+
+    def __observe(self, theta):
+        """Counts degenerate iterations and switches Bland's rule on when basis repeats or method stalls"""
+        key = frozenset(self.__basis.basis())
+
+        if not self.__tolerances.is_zero(theta):
+            self.__bland = False
+            self.__degenerate_number = 0
+            self.__visited = {key}
+            return
+
+        self.__degenerate_number += 1
+
+        if key in self.__visited or self.__degenerate_number >= self.__stalling_limit:
+            self.__bland = True
+
+        self.__visited.add(key)
+
+    def __iterate(self):
+        """Performs one iteration. Returns **False** if optimum is reached or goal function is unlimited"""
+        reduced_costs = self.__reduced_costs()
+        non_basis = self.__basis.non_basis()
+
+        if self.__bland:
+            candidates = sorted((non_basis[index], index) for index, value in enumerate(reduced_costs) if self.__tolerances.is_improving(value))
+        else:
+            candidates = sorted((value, index) for index, value in enumerate(reduced_costs) if self.__tolerances.is_improving(value))
+
+        if len(candidates) == 0:
+            return False
+
+        for _, column_index in candidates:
+            column = self.__factorization.ftran(self.__dense_column(non_basis[column_index]))
+            row_index = self.__bland_ratio_test(column) if self.__bland else self.__ratio_test(column)
+
+            if row_index is not None:
+                break
+        else:
+            self.__unlimited = True
+            return False
+
+        theta = self.__basis_values[row_index]/column[row_index]
+
+        for index, value in enumerate(column):
+            if value != 0:
+                self.__basis_values[index] -= theta*value
+        self.__basis_values[row_index] = theta
+
+        self.__basis.exchange(row_index, column_index)
+        self.__observe(theta)
+
+        if self.__factorization.need_refactor():
+            self.__factorization.factorize([self.__dense_column(index) for index in self.__basis.basis()])
+            self.__basis_values = self.__factorization.ftran(self.__free_member)
+        else:
+            self.__factorization.update(row_index, column)
+
+        return True
+
+    def auto_solve(self):
+        self.__prepare()
+
+        while self.__iterate():
+            self.__current_iteration += 1
+
+        self.__can_continue = False
+        self.__p0 = sum(self.__costs[index]*value for index, value in zip(self.__basis.basis(), self.__basis_values))
+
+    def p0(self):
+        return self.__p0
+
+    def basis(self):
+        return self.__basis
+
+    def row_variables(self):
+        """Returns names of basis variables as list of strings, like **row_variables()** of simplex table"""
+        return ["x{}".format(index + 1) for index in self.__basis.basis()]
+
+    def free_member(self):
+        """Returns values of basis variables as list"""
+        return self.__basis_values
+
+    def solution(self):
+        """Returns values of all variables **x1..xN** as list"""
+        solution = [0 for _ in range(self.__basis.variables_number())]
+
+        for index, value in zip(self.__basis.basis(), self.__basis_values):
+            solution[index] = value
+
+        return solution
+
+    def is_unlimited(self):
+        """Returns **True** if goal function is unlimited"""
+        return self.__unlimited
+
+    def can_continue(self):
+        return self.__can_continue
+
+    def current_iteration(self):
+        return self.__current_iteration
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import math
+from src.common.sparse_matrix import SparseMatrix
+from src.exceptions.exceptions import ScalingError
+from src.simplex.bounds import Bounds
+
+GEOMETRIC = "geometric"
+EQUILIBRATION = "equilibration"
+
+SCALING_METHODS = [GEOMETRIC, EQUILIBRATION]
+
+# проходы геометрического масштабирования прекращаются, если разброс значений уменьшился меньше чем на 10%
+SCALING_ITERATIONS = 20
+SCALING_IMPROVEMENT = 0.9
+
+class Scaling:
+    """Scaling of task for float mode: **A' = R*A*C**, **b' = R*b**, **c' = C*c**, **x = C*x'** (goal function keeps its values).
+    _geometric_ - rows and columns are divided by geometric mean of their largest and smallest absolute values while spread of values decreases,
+    then rows and columns are equilibrated; _equilibration_ - rows, then columns are divided by their largest absolute values.
+    Factors are powers of 2, so scaling itself does not add rounding errors"""
+
+    def __init__(self, method = GEOMETRIC):
+        if method not in SCALING_METHODS:
+            raise ScalingError()
+
+        self.__method = method
+        self.__row_factors = []
+        self.__column_factors = []
+        self.__spread = [None, None]
+
+    def method(self):
+        return self.__method
+
+    def row_factors(self):
+        return self.__row_factors
+
+    def column_factors(self):
+        return self.__column_factors
+
+    def scale(self, matrix, func, bounds = None):
+        """Returns scaled matrix (of the same storage as **matrix**), goal function and bounds"""
+        sparse = isinstance(matrix, SparseMatrix)
+
+        if sparse:
+            free_index = matrix.column_number() - 1
+            rows = [{key: value for key, value in row.items() if key != free_index and value != 0} for row in matrix.rows()]
+            free_member = [row.get(free_index, 0) for row in matrix.rows()]
+        else:
+            free_index = len(matrix[0]) - 1
+            rows = [{key: value for key, value in enumerate(row[:-1]) if value != 0} for row in matrix]
+            free_member = [row[-1] for row in matrix]
+
+        self.__row_factors = [1 for _ in rows]
+        self.__column_factors = [1 for _ in range(free_index)]
+        self.__spread[0] = self.__spread_of(rows)
+
+        if self.__method == GEOMETRIC:
+            spread = self.__spread[0]
+
+            for _ in range(SCALING_ITERATIONS):
+                self.__scale_rows(rows, geometric = True)
+                self.__scale_columns(rows, geometric = True)
+
+                new_spread = self.__spread_of(rows)
+
+                if new_spread >= spread*SCALING_IMPROVEMENT:
+                    break
+
+                spread = new_spread
+
+        self.__scale_rows(rows, geometric = False)
+        self.__scale_columns(rows, geometric = False)
+
+        self.__spread[1] = self.__spread_of(rows)
+
+        for row, factor in zip(rows, self.__row_factors):
+            for j in row:
+                row[j] = row[j]*factor*self.__column_factors[j]
+
+        free_member = [value*factor for value, factor in zip(free_member, self.__row_factors)]
+
+        for row, free_value in zip(rows, free_member):
+            if free_value != 0:
+                row[free_index] = free_value
+
+        scaled_matrix = SparseMatrix(rows, free_index + 1)
+
+        if not sparse:
+            scaled_matrix = scaled_matrix.to_dense()
+
+        scaled_func = [cost*factor for cost, factor in zip(func, self.__column_factors)]
+
+        if bounds is not None:
+            bounds = Bounds([lower/factor for lower, factor in zip(bounds.lower(), self.__column_factors)],
+                            [upper/factor if upper is not None else None for upper, factor in zip(bounds.upper(), self.__column_factors)])
+
+        return scaled_matrix, scaled_func, bounds
+
+    def __scale_rows(self, rows, geometric):
+        """Updates row factors by current scaled values of **rows**"""
+        for i, row in enumerate(rows):
+            values = [abs(value*self.__row_factors[i]*self.__column_factors[j]) for j, value in row.items()]
+
+            if values:
+                self.__row_factors[i] *= self.__factor(values, geometric)
+
+    def __scale_columns(self, rows, geometric):
+        """Updates column factors by current scaled values of **rows**"""
+        columns = [[] for _ in self.__column_factors]
+
+        for i, row in enumerate(rows):
+            for j, value in row.items():
+                columns[j].append(abs(value*self.__row_factors[i]*self.__column_factors[j]))
+
+        for j, values in enumerate(columns):
+            if values:
+                self.__column_factors[j] *= self.__factor(values, geometric)
+
+    @staticmethod
+    def __factor(values, geometric):
+        """Returns power of 2 nearest to **1/sqrt(max*min)** (geometric) or to **1/max** of **values**"""
+        largest = max(values)
+        value = math.sqrt(largest*min(values)) if geometric else largest
+
+        return 2.0**(-round(math.log2(value)))
+
+    def __spread_of(self, rows):
+        """Returns ratio of the largest and the smallest absolute values of scaled matrix"""
+        values = [abs(value*self.__row_factors[i]*self.__column_factors[j]) for i, row in enumerate(rows) for j, value in row.items()]
+
+        if not values:
+            return 1
+
+        return max(values)/min(values)
+
+    def report(self):
+        """Returns method and spread of matrix values (the largest/the smallest absolute value) before and after scaling"""
+        return {"method": self.__method, "spread": list(self.__spread)}
+
+    def unscale(self, values):
+        """Returns values of variables of unscaled task (extra values like slacks of added constraints are not scaled)"""
+        return [value*factor for value, factor in zip(values, self.__column_factors)] + list(values[len(self.__column_factors):])
+
+    def scale_row(self, row):
+        """Returns constraint **row** (coefficients of variables and free member) in scaled variables (row itself is not scaled)"""
+        return [value*factor for value, factor in zip(row[:-1], self.__column_factors)] + list(row[len(self.__column_factors):])
+
+    def scale_free_value(self, index, value):
+        """Returns free member of constraint **index** in scaled task (constraints added after solving are not scaled)"""
+        if index < len(self.__row_factors):
+            return value*self.__row_factors[index]
+
+        return value
+
+def create_scaling(scaling = None):
+    """Returns **Scaling** by its method name (_geometric_ if **scaling** is **True**) or None if scaling is off"""
+    if not scaling:
+        return None
+
+    return Scaling(GEOMETRIC if scaling is True else scaling)
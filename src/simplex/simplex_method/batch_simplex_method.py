@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+from fractions import Fraction
+from src.exceptions.exceptions import *
+from src.common.sparse_matrix import SparseMatrix
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.revised_simplex.basis_factorization import BasisFactorization
+from src.simplex.tolerances import create_tolerances
+from .simplex_method import SimplexMethod
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# задачи, не решённые вместе за BATCH_ITERATIONS*(m + n) итераций, решаются отдельно
+BATCH_ITERATIONS = 10
+
+# ошибки решения отдельной задачи, остальные исключения не перехватываются
+SOLVER_ERRORS = (BasisError, BasisSizeError, SingularMatrixError, MatrixSizeError, BackendError, PricingError)
+
+class BatchSimplexMethod:
+    """Solves K tasks with one matrix that differ by free member and/or goal function.
+    Optimal bases found so far are shared: every basis is factorized once and checked for all unsolved tasks at once
+    (with **numpy** in float mode). In float mode the rest tasks are then solved together from the first optimal basis:
+    tables of all tasks are kept in one array, pricing, ratio tests and pivots are made for all tasks by one numpy operation
+    (primal simplex for tasks that basis is feasible for, dual simplex for tasks it is dual feasible for).
+    Only tasks that fit neither of them (and unbounded or infeasible ones) are solved separately, warm started from the first task.
+    In fractional mode there are no batched iterations: tasks that fit no shared basis are solved separately"""
+
+    def __init__(self, matrix = None, func = None, funcs = None, free_members = None, fractional = False, point = None, backend = None):
+        """Constructor. **matrix** - rows with free member, **funcs** - list of K goal functions (or one **func** for all tasks),
+        **free_members** - list of K free member vectors (or free member of **matrix** for all tasks)"""
+        if isinstance(matrix, SparseMatrix):
+            matrix = matrix.to_dense()
+
+        self.__matrix = matrix
+        self.__fractional = fractional
+        self.__point = point
+        self.__backend = backend
+
+        convert = Fraction if fractional else float
+        tasks_number = max(len(funcs) if funcs is not None else 1, len(free_members) if free_members is not None else 1)
+
+        self.__funcs = [[convert(item) for item in (funcs[k] if funcs is not None else func)] for k in range(tasks_number)]
+
+        if free_members is None:
+            free_members = [[row[-1] for row in matrix] for _ in range(tasks_number)]
+
+        self.__free_members = [[convert(item) for item in free_member] for free_member in free_members]
+
+        self.__p0 = [None for _ in range(tasks_number)]
+        self.__solutions = [None for _ in range(tasks_number)]
+        self.__bases = [None for _ in range(tasks_number)]
+        self.__statuses = [None for _ in range(tasks_number)]
+        self.__errors = [None for _ in range(tasks_number)]
+
+        self.__shared_bases = []
+        self.__separate_solves = 0
+        self.__batch_solves = 0
+
+    def __task_matrix(self, index):
+        """Returns copy of matrix with free member of task **index**"""
+        return [row[:-1] + [free_value] for row, free_value in zip(self.__matrix, self.__free_members[index])]
+
+    def __solve_separately(self, index, warm_start = None):
+        """Solves task **index** by simplex method (warm started if possible) or by artificial basis method"""
+        self.__separate_solves += 1
+
+        try:
+            method = SimplexMethod(matrix = self.__task_matrix(index),
+                                   func = list(self.__funcs[index]),
+                                   fractional = self.__fractional,
+                                   point = list(self.__point) if self.__point is not None and warm_start is None else None,
+                                   backend = self.__backend,
+                                   warm_start = warm_start)
+            method.auto_solve()
+        except (BasisError, BasisSizeError, SingularMatrixError):
+            method = ArtificialBasisMethod(matrix = self.__task_matrix(index),
+                                           func = list(self.__funcs[index]),
+                                           fractional = self.__fractional,
+                                           backend = self.__backend)
+            method.auto_solve()
+
+        return method
+
+    def __share_basis(self, table):
+        """Factorizes basis of **table** once and keeps it with the table for checking other tasks"""
+        basis, non_basis = list(table.basis().basis()), list(table.basis().non_basis())
+        tableau = [row[:-1] for row in table.value_table()[:-1]]
+
+        if self.__is_vectorized():
+            columns = np.array([[float(row[variable]) for row in self.__matrix] for variable in basis])
+            factorization = np.linalg.inv(columns.T)
+            tableau = np.array(tableau, dtype = np.float64)
+        else:
+            columns = [[Fraction(row[variable]) if self.__fractional else float(row[variable]) for row in self.__matrix] for variable in basis]
+            factorization = BasisFactorization(columns = columns, fractional = self.__fractional)
+
+        self.__shared_bases.append((basis, non_basis, factorization, tableau))
+
+    def __is_vectorized(self):
+        return np is not None and not self.__fractional
+
+    def __check_shared_basis(self, shared_basis, indices):
+        """Marks tasks from **indices** as solved if shared basis is optimal for them. Returns indices of the rest tasks"""
+        basis, non_basis, factorization, tableau = shared_basis
+
+        if not indices:
+            return []
+
+        if self.__is_vectorized():
+            free_members = factorization @ np.array([self.__free_members[k] for k in indices], dtype = np.float64).T
+            costs = np.array([self.__funcs[k] for k in indices], dtype = np.float64)
+
+            basis_costs = costs[:, basis]
+            p_vectors = costs[:, non_basis] - basis_costs @ tableau
+
+            optimal = (free_members >= 0).all(axis = 0) & (p_vectors >= 0).all(axis = 1)
+            p0 = (basis_costs*free_members.T).sum(axis = 1)
+
+            for position in np.flatnonzero(optimal):
+                self.__set_result(indices[position], basis, free_members[:, position].tolist(), p0[position].item())
+
+            return [index for index, is_optimal in zip(indices, optimal) if not is_optimal]
+
+        rest = []
+
+        for index in indices:
+            free_member = factorization.ftran(self.__free_members[index])
+            costs = self.__funcs[index]
+
+            basis_costs = [costs[variable] for variable in basis]
+            is_optimal = all(value >= 0 for value in free_member)
+
+            for column_index, variable in enumerate(non_basis):
+                if not is_optimal:
+                    break
+
+                p_value = costs[variable] - sum(cost*row[column_index] for cost, row in zip(basis_costs, tableau))
+                is_optimal = p_value >= 0
+
+            if is_optimal:
+                self.__set_result(index, basis, free_member, sum(cost*value for cost, value in zip(basis_costs, free_member)))
+            else:
+                rest.append(index)
+
+        return rest
+
+    def __batch_solve(self, shared_basis, indices):
+        """Solves tasks **indices** together from shared basis by simplex iterations on array of their tables
+        (rows of **B^-1*A** with basis values, the last row is P vector and **-p0**). Returns indices of tasks that are left for separate solving"""
+        basis, _, inverse, _ = shared_basis
+        tolerances = create_tolerances(None, self.__fractional)
+
+        matrix = np.array([row[:-1] for row in self.__matrix], dtype = np.float64)
+        row_number, variables_number = matrix.shape
+        costs = np.array([self.__funcs[k] for k in indices], dtype = np.float64)
+
+        tables = np.empty((len(indices), row_number + 1, variables_number + 1))
+        tables[:, :row_number, :variables_number] = inverse @ matrix
+        tables[:, :row_number, variables_number] = (inverse @ np.array([self.__free_members[k] for k in indices], dtype = np.float64).T).T
+
+        bases = np.tile(np.array(basis), (len(indices), 1))
+        basis_costs = np.take_along_axis(costs, bases, axis = 1)
+
+        tables[:, row_number, :variables_number] = costs - np.einsum("km,kmn->kn", basis_costs, tables[:, :row_number, :variables_number])
+        tables[:, row_number, variables_number] = -np.einsum("km,km->k", basis_costs, tables[:, :row_number, variables_number])
+
+        # прямой симплекс-метод сохраняет допустимость базиса, двойственный - двойственную допустимость
+        primal = (tables[:, :row_number, variables_number] >= -tolerances.primal()).all(axis = 1)
+        dual = ~primal & (tables[:, row_number, :variables_number] >= -tolerances.dual()).all(axis = 1)
+
+        running = primal | dual
+        optimal = np.zeros(len(indices), dtype = bool)
+
+        for _ in range(BATCH_ITERATIONS*(row_number + variables_number)):
+            if not running.any():
+                break
+
+            rows, columns, stopped = self.__batch_pivots(tables, primal, dual, running, tolerances)
+
+            optimal |= stopped == 1
+            running &= stopped == 0
+
+            tasks = np.flatnonzero(running)
+
+            if len(tasks) == 0:
+                break
+
+            rows, columns = rows[tasks], columns[tasks]
+            positions = np.arange(len(tasks))
+
+            # ведущее преобразование всех таблиц сразу: T -= столбец*строка/ведущий элемент
+            selected = tables[tasks]
+            pivot_rows = selected[positions, rows, :]/selected[positions, rows, columns][:, None]
+            pivot_columns = selected[positions, :, columns]
+
+            selected -= pivot_columns[:, :, None]*pivot_rows[:, None, :]
+            selected[positions, rows, :] = pivot_rows
+
+            tables[tasks] = selected
+            bases[tasks, rows] = columns
+
+        for position in np.flatnonzero(optimal):
+            free_member = tables[position, :row_number, variables_number]
+            self.__set_result(indices[position], bases[position].tolist(), free_member.tolist(), -tables[position, row_number, variables_number].item())
+
+        self.__batch_solves += int(optimal.sum())
+
+        return [index for index, is_optimal in zip(indices, optimal) if not is_optimal]
+
+    @staticmethod
+    def __batch_pivots(tables, primal, dual, running, tolerances):
+        """Chooses pivot elements of all tables: Dantzig's rule and ratio test for **primal** tasks, the most negative basis value and
+        dual ratio test for **dual** ones. Returns pivot rows, pivot columns and state of tasks: 0 - go on, 1 - optimal, 2 - solve separately"""
+        tasks_number, row_number, variables_number = tables.shape[0], tables.shape[1] - 1, tables.shape[2] - 1
+        positions = np.arange(tasks_number)
+
+        p_vectors = tables[:, row_number, :variables_number]
+        free_members = tables[:, :row_number, variables_number]
+
+        stopped = np.where(running, 0, 2)
+
+        # прямой шаг: входит столбец с наименьшей оценкой, выходит строка с наименьшим отношением
+        primal_columns = np.argmin(p_vectors, axis = 1)
+        primal_optimal = p_vectors[positions, primal_columns] >= -tolerances.dual()
+
+        entries = tables[positions, :row_number, primal_columns]
+        allowed = entries > tolerances.pivot()
+        ratios = np.where(allowed, free_members/np.where(allowed, entries, 1), np.inf)
+        primal_rows = np.argmin(ratios, axis = 1)
+        unbounded = ~allowed.any(axis = 1)
+
+        # двойственный шаг: выходит строка с наименьшим значением, входит столбец с наименьшим отношением оценки к элементу строки
+        dual_rows = np.argmin(free_members, axis = 1)
+        dual_optimal = free_members[positions, dual_rows] >= -tolerances.primal()
+
+        entries = tables[positions, dual_rows, :variables_number]
+        allowed = entries < -tolerances.pivot()
+        ratios = np.where(allowed, p_vectors/np.where(allowed, -entries, 1), np.inf)
+        dual_columns = np.argmin(ratios, axis = 1)
+        infeasible = ~allowed.any(axis = 1)
+
+        rows = np.where(primal, primal_rows, dual_rows)
+        columns = np.where(primal, primal_columns, dual_columns)
+
+        finished = np.where(primal, primal_optimal, dual_optimal)
+        failed = np.where(primal, unbounded, infeasible) & ~finished
+
+        stopped = np.where(running & finished, 1, stopped)
+        stopped = np.where(running & failed, 2, stopped)
+
+        return rows, columns, stopped
+
+    def __set_result(self, index, basis, free_member, p0):
+        solution = [0 for _ in range(len(self.__matrix[0]) - 1)]
+
+        for variable, value in zip(basis, free_member):
+            solution[variable] = value
+
+        self.__p0[index] = p0
+        self.__solutions[index] = solution
+        self.__bases[index] = ["x{}".format(variable + 1) for variable in basis]
+        self.__statuses[index] = "optimal"
+
+    def auto_solve(self):
+        indices = list(range(len(self.__funcs)))
+
+        first_method = None
+        batched = False
+
+        while indices:
+            index = indices.pop(0)
+
+            try:
+                method = self.__solve_separately(index, warm_start = first_method)
+            except InfeasibleTaskError as error:
+                self.__statuses[index] = "infeasible"
+                self.__errors[index] = error
+                continue
+            except SOLVER_ERRORS as error:
+                self.__statuses[index] = "error"
+                self.__errors[index] = error
+                continue
+
+            table = method.last_table()
+
+            if not table.first_statement():
+                self.__statuses[index] = "unbounded"
+                continue
+
+            self.__p0[index] = method.p0()
+            self.__solutions[index] = table.values()
+            self.__bases[index] = table.row_variables()
+            self.__statuses[index] = "optimal"
+
+            if first_method is None and isinstance(method, SimplexMethod):
+                first_method = method
+
+            try:
+                self.__share_basis(table)
+            except (SingularMatrixError, ArithmeticError, ValueError):
+                continue
+
+            indices = self.__check_shared_basis(self.__shared_bases[-1], indices)
+
+            # остальные задачи решаются вместе от первого оптимального базиса
+            if self.__is_vectorized() and indices and not batched:
+                batched = True
+                indices = self.__batch_solve(self.__shared_bases[-1], indices)
+
+    def tasks_number(self):
+        return len(self.__funcs)
+
+    def status(self, index = 0):
+        """Returns _optimal_, _unbounded_, _infeasible_ or _error_ for task **index** (None if it is not solved yet)"""
+        return self.__statuses[index]
+
+    def p0(self, index = 0):
+        """Returns minimum of goal function of task **index** (None if task is not optimal)"""
+        return self.__p0[index]
+
+    def solution(self, index = 0):
+        """Returns values of variables **x1..xN** of task **index** (None if task is not optimal)"""
+        return self.__solutions[index]
+
+    def basis(self, index = 0):
+        """Returns names of basis variables of optimal table of task **index**"""
+        return self.__bases[index]
+
+    def error(self, index = 0):
+        """Returns exception raised while solving task **index** (infeasible or failed task) or None"""
+        return self.__errors[index]
+
+    def shared_bases_number(self):
+        """Returns the number of different optimal bases that were factorized"""
+        return len(self.__shared_bases)
+
+    def separate_solves_number(self):
+        """Returns the number of tasks that were solved by separate simplex method"""
+        return self.__separate_solves
+
+    def batch_solves_number(self):
+        """Returns the number of tasks that were solved by batched iterations"""
+        return self.__batch_solves
@@ -2,82 +2,508 @@
 import math
 from src.gauss.gauss import Gauss
 from src.exceptions.exceptions import *
+from src.common.sparse_matrix import SparseMatrix, prepare_storage
+from src.common.solver_stats import phase
+from src.common.task_file import TaskWriter
+from src.simplex.backends.backend import is_sparse_backend
+from src.simplex.bounds import Bounds
+from src.simplex.history import TableHistory
+from src.simplex.pricing import create_pricing
+from src.simplex.presolve import Presolve
+from src.simplex.scaling import Scaling, create_scaling
+from src.simplex.tolerances import create_tolerances
+from src.simplex.stalling import StallingDetector, STALLING_LIMIT
+from src.simplex.revised_simplex.basis_factorization import BasisFactorization
 from .simplex_table import SimplexTable
 from fractions import Fraction
 
 class SimplexMethod:
-    def __init__(self, matrix = None, func = None, fractional = False, point = None, current_iteration = 0):
+    def __init__(self, matrix = None, func = None, fractional = False, point = None, current_iteration = 0, backend = None, bounds = None, complemented = None, warm_start = None, keep_history = True, history = None, pricing = None, stalling_limit = STALLING_LIMIT, stats = None, presolve = False, scaling = None, tolerances = None, task_file = None):
+        """Constructor. **warm_start** - solved task with the same matrix (its last table is reused)
+        or names of basis variables, like **row_variables()** of its last table.
+        If **keep_history** is **False**, only one table is kept and iterations transform it in place.
+        **history** - **TableHistory** with retention policy of tables (all tables are kept by default).
+        **pricing** - rule of choosing pivot column: _dantzig_ (default), _steepest_edge_, _devex_, _bland_ or rule object.
+        After **stalling_limit** iterations without change of goal function (or on repeated basis) Bland's rule is used until it changes.
+        **stats** - **SolverStats** that collects times of phases, counters of pivots and sizes of numbers.
+        If **presolve** is **True**, task is reduced by **Presolve** before solving (tables contain variables of reduced task,
+        **solution()** and **p0()** are given for original one). **Presolve** object means that the task is already reduced by it.
+        Constraints of presolved task can not be added or changed: reductions depend on all rows and goal function.
+        **scaling** - _geometric_ (or **True**), _equilibration_ or None: scaling of matrix in float mode (solution is unscaled automatically).
+        **Scaling** object means that the task is already scaled by it.
+        **tolerances** - **Tolerances** of comparisons with zero and ratio test (Harris ratio test with default tolerances in float mode, exact comparisons for fractions).
+        **task_file** - binary file (or **TaskWriter** of artificial basis method) to which **auto_solve** writes every table as soon as
+        its pivot element is chosen, so tables of long solving are not kept only in memory (see **task_file**)"""
         self.__matrix = matrix
         self.__func = func
         self.__fractional = fractional
-        self.__tables = []
+        self.__backend = backend
+        self.__tables = history if history is not None else TableHistory()
         self.__current_iteration = current_iteration
         self.__point = point
+        self.__bounds = Bounds.from_pairs(bounds) if isinstance(bounds, list) else bounds
+        self.__complemented = complemented
+        self.__constant = 0
+        self.__p0 = None
+        self.__free_values = None
+        self.__added_rows = []
+        self.__slacks = {}
+        self.__warm_start = warm_start
+        self.__keep_history = keep_history
+        self.__pricing = create_pricing(pricing)
+        self.__stalling = StallingDetector(self.__pricing, stalling_limit)
+        self.__stats = stats
+        self.__presolve = presolve or None
+        self.__is_scaled = isinstance(scaling, Scaling)
+        self.__scaling = scaling if self.__is_scaled else create_scaling(scaling)
+        self.__tolerances = tolerances
+        self.__task_file = task_file
+        self.__writer = None
 
-    def auto_solve(self):
-        gauss = Gauss(matrix = self.__matrix, fractional = self.__fractional, point = self.__point)
+    def __prepare_matrix(self):
+        """Chooses dense or sparse storage of matrix by its density (or by explicitly given backend).
+        Bounded variables are shifted to zero lower bounds (and complemented if needed)"""
+        if self.__presolve is True:
+            self.__reduce_task()
+
+        if self.__scaling is not None and not self.__is_scaled:
+            self.__scale_task()
+
+        self.__matrix = prepare_storage(self.__matrix, sparse = is_sparse_backend(self.__backend))
+
+        if self.__fractional:
+            self.__func[:] = [Fraction(item) for item in self.__func]
+
+        self.__free_values = [self.__matrix_value(i, -1) for i in range(self.__row_number())]
+
+        self.__prepare_warm_start()
+
+        if self.__bounds is not None:
+            self.__matrix, self.__func, self.__constant = self.__bounds.transform(self.__matrix, self.__func, self.__complemented)
+
+        if self.__presolve is not None:
+            self.__constant += self.__presolve.constant()
+
+    def __reduce_task(self):
+        """Replaces task by the task reduced by presolve"""
+        presolve = Presolve(self.__matrix, self.__func, self.__bounds, fractional = self.__fractional, point = self.__point)
+
+        with phase(self.__stats, "presolve"):
+            self.__matrix, self.__func, self.__bounds = presolve.reduce()
+
+        self.__point = presolve.reduce_point(self.__point)
+
+        if self.__complemented is not None:
+            self.__complemented = presolve.reduce_values(self.__complemented)
+
+        if self.__stats is not None:
+            self.__stats.set_value("presolve", presolve.report())
+
+        self.__presolve = presolve
+
+    def __scale_task(self):
+        """Scales matrix, goal function and bounds (exact mode does not need scaling)"""
+        if self.__fractional:
+            self.__scaling = None
+            return
+
+        with phase(self.__stats, "scaling"):
+            self.__matrix, self.__func, self.__bounds = self.__scaling.scale(self.__matrix, self.__func, self.__bounds)
+
+        if self.__stats is not None:
+            self.__stats.set_value("scaling", self.__scaling.report())
+
+        self.__is_scaled = True
+
+    def __first_table(self, fractional):
+        # матрица задачи нужна и после решения (для изменения ограничений), поэтому Гауссу передаётся копия
+        matrix = self.__matrix.copy() if isinstance(self.__matrix, SparseMatrix) else [row[:] for row in self.__matrix]
+        gauss = Gauss(matrix = matrix, fractional = fractional, point = self.__point, stats = self.__stats)
 
         if not gauss.solve():
             raise SingularMatrixError()
 
-        if any(item < 0 for item in gauss.free_member()):
+        free_member = gauss.free_member()
+
+        # при горячем старте недопустимый базис ещё может исправить двойственный симплекс-метод
+        tolerances = create_tolerances(self.__tolerances, self.__fractional)
+
+        if any(tolerances.is_negative(item) for item in free_member) and self.__warm_start is None:
             raise BasisError()
 
-        self.__can_continue = True
+        upper = None
 
-        if self.__fractional:
-            self.__func[:] = [Fraction(item) for item in self.__func]
+        if self.__bounds is not None and any(width is not None for width in self.__bounds.widths()):
+            upper = self.__bounds.widths()
+            basis = [int(name[1:]) - 1 for name in gauss.variables()[:len(free_member)]]
+
+            if not self.__bounds.is_feasible(basis, free_member) and self.__warm_start is None:
+                raise BasisError()
+
+        return SimplexTable(variables_names = gauss.variables(),
+                            table = gauss.free_part(),
+                            free_member = free_member,
+                            fractional = self.__fractional,
+                            backend = self.__backend,
+                            bounds = upper,
+                            complemented = self.__complemented,
+                            pricing = self.__pricing,
+                            stats = self.__stats,
+                            tolerances = self.__tolerances)
+
+    def __prepare_warm_start(self):
+        """Takes basis (and complemented variables) of the task given for warm start"""
+        if self.__warm_start is None:
+            return
+
+        if isinstance(self.__warm_start, list):
+            names = set(self.__warm_start)
+            self.__point = [1 if "x{}".format(j + 1) in names else 0 for j in range(self.__variables_number())]
+            return
+
+        if not isinstance(self.__warm_start, SimplexMethod):
+            self.__warm_start = self.__warm_start.simplex_method()
+
+        if self.__warm_start is None or not self.__warm_start.tables_number():
+            raise UnsolvedTaskError()
+
+        # переменные таблиц соответствуют друг другу, только если предварительная обработка удалила те же строки и столбцы
+        if not self.__has_same_reductions(self.__warm_start.presolve()):
+            raise BasisError()
+
+        table = self.__warm_start.last_table()
+
+        if self.__bounds is not None and len(table.complemented()) == self.__variables_number():
+            self.__complemented = list(table.complemented())
+
+        self.__point = [1 if table.basis().is_basic(j) else 0 for j in range(self.__variables_number())]
+
+    def __has_same_reductions(self, presolve):
+        if self.__presolve is None:
+            return presolve is None or presolve.has_same_reductions(None)
 
-        while self.__can_continue:
-            simplex_table = None
+        return self.__presolve.has_same_reductions(presolve)
 
-            if not self.__tables:
-                simplex_table = SimplexTable(variables_names = gauss.variables(),
-                                             table = gauss.free_part(),
-                                             free_member = gauss.free_member(),
-                                             fractional = self.__fractional)
-            else:
-                simplex_table = SimplexTable(previous_table = self.last_table())
+    def __warm_table(self):
+        """Returns the first table made from the last table of warm start task (free member is recalculated only if it is changed)
+        or None if that table does not fit the matrix"""
+        if not isinstance(self.__warm_start, SimplexMethod):
+            return None
+
+        table = self.__warm_start.last_table()
+
+        if table.basis().variables_number() != self.__variables_number() or table.row_number() - 1 != self.__row_number():
+            return None
+
+        values = table.value_table()
+        free_member = [row[-1] for row in values[:-1]]
+
+        if self.__free_values != self.__warm_start.constraint_free_member():
+            convert = Fraction if self.__fractional else float
+            row_number = self.__row_number()
+
+            columns = [[convert(self.__matrix_value(i, variable)) for i in range(row_number)] for variable in table.basis().basis()]
+            factorization = BasisFactorization(columns = columns, fractional = self.__fractional)
+
+            free_member = factorization.ftran([convert(self.__matrix_value(i, -1)) for i in range(row_number)])
+
+        upper = None
+
+        if self.__bounds is not None and any(width is not None for width in self.__bounds.widths()):
+            upper = self.__bounds.widths()
+
+        return SimplexTable(variables_names = table.row_variables() + table.column_variables() + ["b"],
+                            table = [row[:-1] for row in values[:-1]],
+                            free_member = free_member,
+                            fractional = self.__fractional,
+                            backend = self.__backend,
+                            bounds = upper,
+                            complemented = self.__complemented,
+                            pricing = self.__pricing,
+                            stats = self.__stats,
+                            tolerances = self.__tolerances)
+
+    def __start_table(self, fractional):
+        """Returns the first table: from warm start task if possible, else by Gauss method"""
+        table = self.__warm_table()
+
+        if table is None:
+            table = self.__first_table(fractional)
+
+        return table
+
+    def __check_start(self, table):
+        """Basis of warm start must be either primal feasible (new goal function) or dual feasible (new free member)"""
+        if not table.is_primal_feasible() and not table.first_statement():
+            raise BasisError()
+
+    def __step(self, first_table = None):
+        """Performs one iteration: solves **first_table**, makes new table from the last one
+        or (if history is not kept) transforms the last table in place"""
+        if first_table is not None:
+            simplex_table = first_table
 
             self.__can_continue = simplex_table.solve(self.__func)
+            self.__check_start(simplex_table)
+            self.__tables.append(simplex_table, derived = False)
 
-            if not self.__can_continue:
-                self.__p0 = simplex_table.p0()
-            
-            self.__current_iteration = simplex_table.iteration_number()
+            self.__stalling.reset()
+        elif self.__keep_history:
+            self.__write_last_table()
+            simplex_table = SimplexTable(previous_table = self.last_table())
+
+            self.__can_continue = simplex_table.solve(self.__func)
             self.__tables.append(simplex_table)
+        else:
+            self.__write_last_table()
+            simplex_table = self.last_table()
+            self.__can_continue = simplex_table.advance()
+
+        if not self.__can_continue:
+            self.__p0 = simplex_table.p0() + self.__constant
+        else:
+            self.__stalling.observe(simplex_table)
+
+        self.__current_iteration = simplex_table.iteration_number()
+
+    def __open_writer(self):
+        if self.__task_file is None:
+            return
+
+        self.__writer = self.__task_file if isinstance(self.__task_file, TaskWriter) else TaskWriter(self.__task_file, self)
+
+    def __write_last_table(self):
+        """Writes the last table to task file before the next iteration (its pivot element is chosen first)"""
+        if self.__writer is None:
+            return
+
+        self.last_table().find_pivot_element()
+        self.__writer.append(self.last_table())
+
+    def __close_writer(self):
+        """Writes the last table and result (the writer of artificial basis method is closed by that method)"""
+        if self.__writer is None:
+            return
+
+        self.__writer.append(self.last_table())
+
+        if self.__writer is not self.__task_file:
+            self.__writer.close(self)
+
+        self.__writer = None
+
+    def auto_solve(self):
+        self.__prepare_matrix()
+        self.__open_writer()
+
+        table = self.__start_table(self.__fractional)
+
+        with phase(self.__stats, "main"):
+            self.__step(table)
+
+            while self.__can_continue:
+                self.__step()
+
+        self.__record_stats()
+        self.__close_writer()
+
+        # двойственный симплекс-метод горячего старта останавливается на недопустимом базисе, если ограничения несовместны
+        if not self.last_table().is_primal_feasible():
+            raise InfeasibleTaskError()
 
     def next(self):
-        simplex_table = None
+        if not self.__tables:
+            self.__prepare_matrix()
+            self.__step(self.__start_table(True))
+        else:
+            self.__step()
 
+    def add_constraint(self, row, less_equal = True):
+        """Adds constraint **row** (coefficients of x1..xN and free member) to the solved task: **row*x <= b** (or **>=** if not **less_equal**).
+        The new slack variable is basic, so the last table stays dual feasible and is reoptimized by dual simplex method"""
         if not self.__tables:
-            gauss = Gauss(matrix = self.__matrix, fractional = True, point = self.__point)
+            raise UnsolvedTaskError()
 
-            if not gauss.solve():
-                raise SingularMatrixError()
+        if self.__presolve is not None:
+            raise PresolveError()
 
-            if any(item < 0 for item in gauss.free_member()):
-                raise BasisError()
+        if len(row) != self.__variables_number() + 1:
+            raise MatrixSizeError()
 
-            simplex_table = SimplexTable(variables_names = gauss.variables(),
-                                         table = gauss.free_part(),
-                                         free_member = gauss.free_member(),
-                                         fractional = self.__fractional)
-        else:
-            simplex_table = SimplexTable(previous_table = self.last_table())
+        if self.__scaling is not None:
+            row = self.__scaling.scale_row(row)
 
-        self.__can_continue = simplex_table.solve(self.__func)
-        
-        if not self.__can_continue:
-            self.__p0 = simplex_table.p0()
+        if not less_equal:
+            row = [-item for item in row]
 
-        self.__current_iteration = simplex_table.iteration_number()
-        self.__tables.append(simplex_table)
+        if self.__fractional:
+            row = [Fraction(item) for item in row]
+
+        coefficients, free_value = list(row[:-1]), row[-1]
+        self.__free_values.append(free_value)
+
+        if self.__bounds is not None:
+            [transformed], _, _ = self.__bounds.transform([coefficients + [free_value]], self.__func, self.__complemented)
+            coefficients, free_value = transformed[:-1], transformed[-1]
+
+        self.__added_rows.append(coefficients)
+
+        # в таблице переменные могли смениться на дополнения относительно исходной подстановки
+        table = SimplexTable(previous_table = self.last_table())
+        signs = self.__signs(table)
+        widths = self.__bounds.widths() if self.__bounds is not None else None
+        free_value -= sum(value*widths[variable] for variable, value in enumerate(coefficients) if signs[variable] < 0)
+
+        slack = table.add_row([value*sign for value, sign in zip(coefficients, signs)], free_value)
+
+        self.__func.append(0)
+
+        if self.__bounds is not None:
+            self.__bounds.lower().append(0)
+            self.__bounds.upper().append(None)
+
+        if self.__complemented is not None:
+            self.__complemented.append(False)
+
+        self.__slacks[len(self.__free_values) - 1] = slack
+        self.__append_and_reoptimize(table)
+
+    def tighten_constraint(self, index, free_value):
+        """Sets free member of constraint **index** (rows of matrix, then added constraints) to **free_value** in the solved task.
+        Only free member column of the last table changes, then it is reoptimized by dual simplex method"""
+        if not self.__tables:
+            raise UnsolvedTaskError()
+
+        if self.__presolve is not None:
+            raise PresolveError()
+
+        if self.__scaling is not None:
+            free_value = self.__scaling.scale_free_value(index, free_value)
+
+        if self.__fractional:
+            free_value = Fraction(free_value)
+
+        delta = free_value - self.__free_values[index]
+        self.__free_values[index] = free_value
+
+        table = SimplexTable(previous_table = self.last_table())
+        column = self.__inverse_column(table, index)
+
+        signs = self.__signs(table)
+        basis_costs = [self.__cost(variable)*signs[variable] for variable in table.basis().basis()]
+
+        values = [delta*item for item in column]
+        values.append(-sum(cost*value for cost, value in zip(basis_costs, values)))
+
+        table.shift_free_member(values)
+
+        self.__append_and_reoptimize(table)
+
+    def __append_and_reoptimize(self, table):
+        """Appends changed **table** and continues solving (dual simplex iterations while basis is infeasible)"""
+        self.__current_iteration = table.iteration_number()
+
+        if not self.__keep_history:
+            self.__tables.clear()
+
+        self.__tables.append(table, derived = False)
+        self.__stalling.reset()
+
+        self.__can_continue = table.third_statement()
+
+        with phase(self.__stats, "main"):
+            while self.__can_continue:
+                self.__step()
+
+        self.__record_stats()
+
+        if not self.last_table().is_primal_feasible():
+            raise InfeasibleTaskError()
+
+        self.__p0 = self.last_table().p0() + self.__constant
+
+    def __record_stats(self):
+        if self.__stats is None:
+            return
+
+        self.__stats.set_value("main_iterations", self.__current_iteration)
+        self.__stats.set_value("pricing", self.__pricing.NAME)
+        self.__stats.set_value("stalling_switches", self.__stalling.switches_number())
+
+    def __signs(self, table):
+        """Returns signs of table variables relative to variables of transformed matrix (-1 if complemented since then)"""
+        initial = self.__complemented if self.__complemented is not None else []
+
+        return [-1 if flag != (variable < len(initial) and initial[variable]) else 1 for variable, flag in enumerate(table.complemented())]
+
+    def __cost(self, variable):
+        return self.__func[variable] if variable < len(self.__func) else 0
+
+    def __inverse_column(self, table, index):
+        """Returns column **index** of inverse basis matrix in order of table rows"""
+        basis = table.basis()
+        row_number = len(basis.basis())
+
+        # для добавленных ограничений столбец обратной матрицы даёт дополнительная переменная
+        if index in self.__slacks:
+            slack = self.__slacks[index]
+
+            if basis.is_basic(slack):
+                return [1 if row_index == basis.row_of(slack) else 0 for row_index in range(row_number)]
+
+            return table.column(basis.column_of(slack))[:-1]
+
+        signs = self.__signs(table)
+        convert = Fraction if self.__fractional else float
+        columns = [[convert(value*signs[variable]) for value in self.__constraint_column(variable)] for variable in basis.basis()]
+
+        factorization = BasisFactorization(columns = columns, fractional = self.__fractional)
+
+        return factorization.ftran([1 if row_index == index else 0 for row_index in range(row_number)])
+
+    def __constraint_column(self, variable):
+        """Returns column of **variable** in constraints of transformed matrix including added constraints"""
+        column = [self.__matrix_value(i, variable) if variable < self.__variables_number() else 0 for i in range(self.__row_number())]
+
+        for number, coefficients in enumerate(self.__added_rows):
+            value = coefficients[variable] if variable < len(coefficients) else 0
+
+            if self.__slacks[self.__row_number() + number] == variable:
+                value = 1
+
+            column.append(value)
+
+        return column
+
+    def __row_number(self):
+        if isinstance(self.__matrix, SparseMatrix):
+            return self.__matrix.row_number()
+
+        return len(self.__matrix)
+
+    def __variables_number(self):
+        if isinstance(self.__matrix, SparseMatrix):
+            return self.__matrix.column_number() - 1
+
+        return len(self.__matrix[0]) - 1
+
+    def __matrix_value(self, i, j):
+        if isinstance(self.__matrix, SparseMatrix):
+            return self.__matrix.value(i, j if j >= 0 else self.__matrix.column_number() + j)
+
+        return self.__matrix[i][j]
 
     def back(self):
-        del self.__tables[-1]
+        # без истории таблиц вернуться назад нельзя
+        if not self.__keep_history:
+            return
+
+        self.__tables.pop()
         self.__current_iteration -= 1
         self.let_continue()
+
+        # таблицы после возврата уже встречались, это не зацикливание
+        self.__stalling.reset()
         
     def last_table(self):
         return self.__tables[-1]
@@ -94,6 +520,41 @@ class SimplexMethod:
     def p0(self):
         return self.__p0
 
+    def constraint_free_member(self):
+        """Returns free members of constraints (rows of matrix, then added constraints) as they were given"""
+        return self.__free_values
+
+    def bounds(self):
+        """Returns bounds of variables of the task that is solved by tables (after presolve and scaling) or None"""
+        return self.__bounds
+
+    def matrix(self):
+        """Returns matrix of the task that is solved by tables (after presolve, scaling and shift of bounded variables)"""
+        return self.__matrix
+
+    def func(self):
+        """Returns goal function of the task that is solved by tables"""
+        return self.__func
+
+    def goal_constant(self):
+        """Returns constant that is added to p0 of tables after shifting bounded variables and fixing variables by presolve"""
+        return self.__constant
+
+    def solution(self):
+        """Returns values of variables **x1..xN** in the last table"""
+        values = self.last_table().values()
+
+        if self.__bounds is not None:
+            values = self.__bounds.restore(values, self.last_table().complemented())
+
+        if self.__scaling is not None:
+            values = self.__scaling.unscale(values)
+
+        if self.__presolve is not None:
+            values = self.__presolve.restore(values)
+
+        return values
+
     def can_continue(self):
         return self.__can_continue
 
@@ -102,3 +563,27 @@ class SimplexMethod:
 
     def current_iteration(self):
         return self.__current_iteration
+
+    def pricing_rule(self):
+        """Returns name of rule of choosing pivot column"""
+        return self.__pricing.NAME
+
+    def method_name(self):
+        """Returns name of method that is written to task file"""
+        return "simplex"
+
+    def stalling(self):
+        """Returns **StallingDetector** that watches iterations of the method"""
+        return self.__stalling
+
+    def stats(self):
+        """Returns **SolverStats** of the method or None if instrumentation is off"""
+        return self.__stats
+
+    def presolve(self):
+        """Returns **Presolve** with reductions applied to the task or None"""
+        return self.__presolve if self.__presolve is not True else None
+
+    def scaling(self):
+        """Returns **Scaling** applied to the task or None"""
+        return self.__scaling if self.__is_scaled else None
@@ -1,36 +1,61 @@
 # -*- coding: utf-8 -*-
-from fractions import Fraction
+from src.common.sparse_matrix import SparseMatrix
+from src.simplex.backends.backend import create_backend
+from src.simplex.basis import Basis
+from src.simplex.bounds import bounded_ratio_test, find_bounded_pivot
+from src.simplex.dual_simplex import infeasible_row, find_dual_pivot
+from src.simplex.pricing import create_pricing
 
 class SimplexTable:
     """Class for descripting object of simplex table"""
 
-    def __init__(self, variables_names = None, table = None, free_member = None, fractional = False, previous_table = None):
+    def __init__(self, variables_names = None, table = None, free_member = None, fractional = False, previous_table = None, backend = None, bounds = None, complemented = None, pricing = None, stats = None, tolerances = None):
+        """Constructor. **bounds** - upper bounds of variables by their indices (None - not bounded),
+        **complemented** - flags of variables that are substituted by **bound - variable**,
+        **pricing** - rule of choosing pivot column (name or object from _pricing_ module, Dantzig's rule by default),
+        **stats** - **SolverStats** that counts pivots and sizes of numbers (None - instrumentation is off),
+        **tolerances** - comparisons with zero (see **Tolerances**, exact for fractions and default tolerances for floats)"""
         self.__previous_table = previous_table
 
         if self.__previous_table:
-            self.__row_variables_names = self.__previous_table.row_variables()
-            self.__column_variables_names = self.__previous_table.column_variables()
+            self.__variables = self.__previous_table.variables()
+            self.__variable_index = self.__previous_table.variable_index()
+            self.__basis = self.__previous_table.basis().copy()
+            self.__bounds = self.__previous_table.bounds()
+            self.__complemented = self.__previous_table.complemented().copy()
+            self.__pricing = self.__previous_table.pricing().copy()
+            self.__stats = self.__previous_table.stats()
 
-            row_number, column_number = self.__previous_table.row_number(), self.__previous_table.column_number()
-
-            self.__table = [[None for _ in range(column_number)] for _ in range(row_number)]
+            self.__table = self.__previous_table.backend().copy()
 
             self.__fractional = self.__previous_table.is_fractional()
 
             self.__iteration_number = self.__previous_table.iteration_number() + 1
         else:
-            self.__table = table
-
-            for free_value, row in zip(free_member, self.__table):
-                row.append(free_value)
+            if isinstance(table, SparseMatrix):
+                rows = table.copy()
+                rows.append_column(free_member)
+                rows.append_row({})
+            else:
+                rows = [row + [free_value] for free_value, row in zip(free_member, table)]
+                rows.append([0 for _ in range(len(rows[0]))])
 
-            self.__table.append([None for _ in range(len(self.__table[0]))])
+            self.__table = create_backend(rows, fractional, backend, tolerances)
 
-            self.__variables = ["x{}".format(i + 1) for i in range(len(table[0]) + 1)]
+            self.__variables = ["x{}".format(i + 1) for i in range(len(variables_names) - 1)]
             self.__variables.append("b")
-            
-            self.__row_variables_names = variables_names[0:len(self.__table) - 1]
-            self.__column_variables_names = variables_names[len(self.__table) - 1 : -1]
+
+            self.__variable_index = {name: index for index, name in enumerate(self.__variables[:-1])}
+
+            row_number = len(rows) - 1
+            self.__basis = Basis(basis = [self.__variable_index[name] for name in variables_names[0:row_number]],
+                                 non_basis = [self.__variable_index[name] for name in variables_names[row_number:-1]],
+                                 variables_number = len(self.__variables) - 1)
+
+            self.__bounds = bounds
+            self.__complemented = list(complemented) if complemented is not None else [False for _ in range(len(self.__variables) - 1)]
+            self.__pricing = create_pricing(pricing)
+            self.__stats = stats
 
             self.__fractional = fractional
 
@@ -38,59 +63,147 @@ class SimplexTable:
 
         self.__pivot_element = None
 
+    def state(self):
+        """Returns dict of values that describe table (variables, basis, bounds, pivot element and values of cells) to save it, see **from_state**"""
+        return {
+            "variables": self.__variables,
+            "basis": self.__basis.basis(),
+            "non_basis": self.__basis.non_basis(),
+            "variables_number": self.__basis.variables_number(),
+            "bounds": self.__bounds,
+            "complemented": self.__complemented,
+            "pricing": self.__pricing.NAME,
+            "backend": self.__table.NAME,
+            "fractional": self.__fractional,
+            "iteration_number": self.__iteration_number,
+            "pivot": self.pivot_index(),
+            "rows": self.__table.to_lists(),
+        }
+
+    @staticmethod
+    def from_state(state, tolerances = None):
+        """Creates table by values of **state()** (weights of pricing rule are not saved, they start again)"""
+        table = SimplexTable.__new__(SimplexTable)
+        table.__previous_table = None
+        table.__variables = list(state["variables"])
+        table.__variable_index = {name: index for index, name in enumerate(state["variables"][:-1])}
+        table.__basis = Basis(state["basis"], state["non_basis"], state["variables_number"])
+        table.__bounds = state["bounds"]
+        table.__complemented = list(state["complemented"])
+        table.__pricing = create_pricing(state["pricing"])
+        table.__stats = None
+        table.__table = create_backend(state["rows"], state["fractional"], state["backend"], tolerances)
+        table.__fractional = state["fractional"]
+        table.__iteration_number = state["iteration_number"]
+        table.__pivot_element = list(state["pivot"]) if state["pivot"] is not None else None
+
+        return table
+
     def iteration_number(self):
         """Returns the number of iteration of simplex table"""
         return self.__iteration_number
 
     def size(self):
-        return [len(self.__table) + 1, len(self.__table[0]) + 1]
+        return [self.__table.row_number() + 1, self.__table.column_number() + 1]
+
+    def backend(self):
+        """Returns tableau backend that stores values of table"""
+        return self.__table
+
+    def basis(self):
+        """Returns bookkeeping of basis and non-basis variables indices"""
+        return self.__basis
+
+    def bounds(self):
+        """Returns upper bounds of variables by their indices or None if variables are not bounded"""
+        return self.__bounds
+
+    def complemented(self):
+        """Returns flags of variables that stay in table as **bound - variable**"""
+        return self.__complemented
+
+    def pricing(self):
+        """Returns rule of choosing pivot column (its weights are kept by every table separately)"""
+        return self.__pricing
+
+    def set_pricing(self, pricing):
+        """Sets rule of choosing pivot column for this table and tables made from it"""
+        self.__pricing = pricing
+
+    def stats(self):
+        """Returns **SolverStats** of solving or None"""
+        return self.__stats
+
+    def values(self):
+        """Returns values of table variables (basis - free member, non-basis - zero) by their indices"""
+        values = [0 for _ in range(self.__basis.variables_number())]
+
+        for variable, value in zip(self.__basis.basis(), self.free_member()):
+            values[variable] = value
+
+        return values
+
+    def variables(self):
+        """Returns names of all variables as list like ["x1", "x2", ..., "xN", "b"]"""
+        return self.__variables
+
+    def variable_index(self):
+        """Returns dict that maps name of variable (except _free member_) to its index"""
+        return self.__variable_index
 
     def is_fractional(self):
         """Returns **True** if table contains fractional values"""
         return self.__fractional
-    
+
     def column_variables(self):
         """Returns names of variables that stay in columns headers as list of strings"""
-        return self.__column_variables_names.copy()
+        return [self.__variables[variable] for variable in self.__basis.non_basis()]
 
     def row_variables(self):
         """Returns names of variables that stay in rows headers as list of strings"""
-        return self.__row_variables_names.copy()
+        return [self.__variables[variable] for variable in self.__basis.basis()]
 
     def p0(self):
         """Returns p0 value, that is minimized value of goal function"""
-        return -self.__table[-1][-1]
+        return -self.__table.value(-1, -1)
 
     def row_number(self):
         """Returns the number of rows in table (including vector P)"""
-        return len(self.__table)
+        return self.__table.row_number()
 
     def column_number(self):
         """Returns the number of columns in table (including free member)"""
-        return len(self.__table[0])
+        return self.__table.column_number()
 
     def free_member(self):
         """Returns vector of free members as list"""
-        return [row[-1] for row in self.__table[:-1]]    
+        return self.__table.free_member()
 
     def pivot_element(self):
         """Returns pivot element by **[row_var, col_var]** pair of variables names, like ["x1", "x2"]"""
-        return self.__pivot_element
+        if self.__pivot_element is None:
+            return
+
+        row_index, column_index = self.__pivot_element
+
+        # смена границы переменной без смены базиса
+        if row_index == -1:
+            return [None, self.__variables[self.__basis.non_basis()[column_index]]]
+
+        return [self.__variables[self.__basis.basis()[row_index]], self.__variables[self.__basis.non_basis()[column_index]]]
 
     def pivot_index(self):
+        """Returns pivot element by **[row_index, column_index]** pair of indices"""
         if self.__pivot_element is None:
             return
 
-        pivot_row_var, pivot_column_var = self.__pivot_element
-        pivot_row_var_index, pivot_column_var_index = self.__row_index_by_var(pivot_row_var), self.__column_index_by_var(pivot_column_var)
+        return list(self.__pivot_element)
 
-        return [pivot_row_var_index, pivot_column_var_index]
-    
     def has_pivot(self):
         return self.__pivot_element is not None
-    
+
     def p_vector(self):
-        return self.__table[-1]
+        return self.__table.p_vector()
 
     def is_possible_pivot(self, row_index, column_index):
         p_vector = self.p_vector()
@@ -98,31 +211,24 @@ class SimplexTable:
         if column_index == len(p_vector) - 1:
             return False
 
-        if p_vector[column_index] >= 0:
-            return False
+        if not self.is_primal_feasible():
+            return find_dual_pivot(self.__table, self.__basis, self.__bounds) == [row_index, column_index]
 
-        column = self.column(column_index)
-
-        row_indices = [index for index, value in enumerate(column) if value > 0]
+        if not self.__table.tolerances().is_improving(p_vector[column_index]):
+            return False
 
-        ratios = None
-        
-        if self.__fractional:
-            ratios = [Fraction(self.free_member()[index], column[index]) for index in row_indices]
-        else:
-            ratios = [self.free_member()[index]/column[index] for index in row_indices]
+        if self.__bounds is not None:
+            return bounded_ratio_test(self.__table, self.__basis, self.__bounds, column_index) == row_index
 
-        possible_row_index = row_indices[ratios.index(min(ratios))]
-        
-        return possible_row_index == row_index
+        return self.__table.ratio_test(column_index) == row_index
 
     def value_table(self):
-        return self.__table
+        return self.__table.to_lists()
 
     def set_pivot_element(self, i, j):
-        """Setting pivot element by **[row_var, col_var]** pair of variables names, like ["x1", "x2"]"""
-        self.__pivot_element = [self.__row_variables_names[i], self.__column_variables_names[j]]
-    
+        """Setting pivot element by **[row_index, column_index]** pair of indices"""
+        self.__pivot_element = [i, j]
+
     def unset_pivot_element(self):
         self.__pivot_element = None
 
@@ -133,82 +239,135 @@ class SimplexTable:
                 self.__previous_table.find_pivot_element()
 
         if self.__previous_table:
-            self.__push_table()
+            self.__apply_pivot(*self.__previous_table.pivot_index())
+
+            # предыдущая таблица больше не нужна, цепочка таблиц не должна удерживаться в памяти
+            self.__previous_table = None
         else:
             self.__calc_p_vector(func)
 
         return self.third_statement()
 
-    def __push_table(self):
-        prev_pivot_row_var, prev_pivot_column_var = self.__previous_table.pivot_element()
-        prev_pivot_row_index, prev_pivot_column_index = self.__row_index_by_var(prev_pivot_row_var), self.__column_index_by_var(prev_pivot_column_var)
+    def following_table(self):
+        """Returns new table made by pivot element of this table (tables are rebuilt by history, so the pivot is not counted in stats again)"""
+        table = SimplexTable(previous_table = self)
+        table.__stats = None
+        table.solve(None)
 
-        self.__row_variables_names[prev_pivot_row_index] = prev_pivot_column_var
-        self.__column_variables_names[prev_pivot_column_index] = prev_pivot_row_var
+        return table
 
-        prev_pivot_value = self.__previous_table.get_value_by_var(prev_pivot_row_var, prev_pivot_column_var)
+    def advance(self):
+        """Performs the next iteration in place of this table (no new table is created). Returns **True** if one more iteration is possible"""
+        self.find_pivot_element()
 
-        new_pivot_value = 1/prev_pivot_value
-        new_pivot_row_var, new_pivot_column_var = prev_pivot_column_var, prev_pivot_row_var
+        if self.__pivot_element is None:
+            return False
 
-        self.__set_value_by_var(new_pivot_row_var, new_pivot_column_var, new_pivot_value)
+        self.__apply_pivot(*self.__pivot_element)
 
-        new_pivot_row = []
-        for index, item in enumerate(self.__previous_table.row_by_var(prev_pivot_row_var)):
-            if index == self.__column_index_by_var(new_pivot_column_var):
-                new_pivot_row.append(new_pivot_value)
-            else:
-                new_pivot_row.append(item/prev_pivot_value)
+        self.__pivot_element = None
+        self.__iteration_number += 1
 
-        new_pivot_column = []
-        for index, item in enumerate(self.__previous_table.column_by_var(prev_pivot_column_var)):
-            if index == self.__row_index_by_var(new_pivot_row_var):
-                new_pivot_column.append(new_pivot_value)
-            else:
-                new_pivot_column.append(-1*item/prev_pivot_value)
+        return self.third_statement()
 
-        self.__set_row(self.__row_index_by_var(new_pivot_row_var), new_pivot_row)
-        self.__set_column(self.__column_index_by_var(new_pivot_column_var), new_pivot_column)
+    def __apply_pivot(self, prev_pivot_row_index, prev_pivot_column_index):
 
-        for index, row in enumerate(self.__table):
-            if all(value is not None for value in row):
-                continue
-            prev_row = self.__previous_table.row(index)
-            coeff = self.__previous_table.column_by_var(prev_pivot_column_var)[index]
-            for row_index, item in enumerate(row):
-                if item is None:
-                    self.__table[index][row_index] = prev_row[row_index] - coeff*new_pivot_row[row_index]
+        # переменная просто переходит на другую границу, базис не меняется
+        if prev_pivot_row_index == -1:
+            self.__complement(prev_pivot_column_index)
 
-    def get_value_by_var(self, row_var, col_var):
-        """Returns the value of cell at coords **[row_var, col_var]**"""
-        i, j = self.__row_variables_names.index(row_var), self.__column_variables_names.index(col_var)
-        return self.__table[i][j]
+            if self.__stats is not None:
+                self.__stats.count("bound_flips")
+            return
+
+        leaving = self.__basis.basis()[prev_pivot_row_index]
+        free_value = self.__table.value(prev_pivot_row_index, -1)
+
+        # двойственный шаг: переменная выше верхней границы сначала заменяется на дополнение
+        if self.__bounds is not None and self.__bounds[leaving] is not None and free_value > self.__bounds[leaving]:
+            self.__table.complement_row(prev_pivot_row_index, self.__bounds[leaving])
+            self.__complemented[leaving] = not self.__complemented[leaving]
+            free_value = self.__table.value(prev_pivot_row_index, -1)
+
+        # при отрицательном ведущем элементе выходящая переменная достигает верхней границы (кроме двойственного шага)
+        to_upper = self.__bounds is not None and free_value >= 0 and self.__table.value(prev_pivot_row_index, prev_pivot_column_index) < 0
+
+        # веса правила выбора столбца пересчитываются только на шагах прямого симплекс-метода
+        if free_value >= 0:
+            self.__pricing.update(self.__table, self.__basis, prev_pivot_row_index, prev_pivot_column_index)
+
+        self.__basis.exchange(prev_pivot_row_index, prev_pivot_column_index)
+        self.__table.pivot(prev_pivot_row_index, prev_pivot_column_index)
+
+        if to_upper:
+            self.__complement(prev_pivot_column_index)
+
+        if self.__stats is not None:
+            self.__stats.count("pivots")
+            self.__stats.observe_table(self.__table)
+
+    def __complement(self, column_index):
+        """Substitutes non-basis variable at **column_index** by **bound - variable**"""
+        variable = self.__basis.non_basis()[column_index]
+
+        self.__table.complement_column(column_index, self.__bounds[variable])
+        self.__complemented[variable] = not self.__complemented[variable]
+
+    def add_row(self, coefficients, free_value):
+        """Adds constraint **sum(coefficients[k]*xk) <= free_value** (**coefficients** by indices of table variables).
+        New slack variable becomes basis variable of the new row, the row is expressed through non-basis variables"""
+        row = [coefficients[variable] if variable < len(coefficients) else 0 for variable in self.__basis.non_basis()]
+        row.append(free_value)
+
+        for row_index, variable in enumerate(self.__basis.basis()):
+            coeff = coefficients[variable] if variable < len(coefficients) else 0
+
+            if coeff != 0:
+                row = [item - coeff*table_item for item, table_item in zip(row, self.__table.row(row_index))]
+
+        self.__table.append_row(row)
+
+        slack = len(self.__variables) - 1
+
+        self.__variables = self.__variables[:-1] + ["x{}".format(slack + 1), "b"]
+        self.__variable_index = dict(self.__variable_index)
+        self.__variable_index[self.__variables[slack]] = slack
+
+        self.__basis = Basis(basis = self.__basis.basis() + [slack], non_basis = self.__basis.non_basis(), variables_number = slack + 1)
+        self.__complemented.append(False)
+
+        if self.__bounds is not None:
+            self.__bounds = self.__bounds + [None]
 
-    def __set_value_by_var(self, row_var, col_var, value):
-        """Sets the **value** for cell at coords **[row_var, col_var]**"""
-        if self.__fractional:
-            value = Fraction(value)
+        return slack
 
-        i, j = self.__row_variables_names.index(row_var), self.__column_variables_names.index(col_var)
-        self.__table[i][j] = value
+    def shift_free_member(self, values):
+        """Adds **values** to the free member column (the last value is added to the P vector)"""
+        self.__table.shift_free_member(values)
+
+    def is_primal_feasible(self):
+        """Returns **True** if all basis variables are within their bounds"""
+        return infeasible_row(self.__table, self.__basis, self.__bounds) is None
+
+    def get_value_by_var(self, row_var, col_var):
+        """Returns the value of cell at coords **[row_var, col_var]**"""
+        i, j = self.__row_index_by_var(row_var), self.__column_index_by_var(col_var)
+        return self.__table.value(i, j)
 
     def __calc_p_vector(self, func):
         """Methods that calculates the P vector"""
-        for index, column_char in enumerate(self.__column_variables_names):
-            s = func[self.__variables.index(column_char)]
-            for row_char in self.__row_variables_names:
-                s += -func[self.__variables.index(row_char)]*self.get_value_by_var(row_char, column_char)
-            self.__table[-1][index] = s
-
-        p0 = sum(-func[self.__variables.index(row_char)]*value for value, row_char in zip(self.free_member(), self.__row_variables_names))
+        basis_costs = [func[variable] for variable in self.__basis.basis()]
+        non_basis_costs = [func[variable] for variable in self.__basis.non_basis()]
 
-        self.__table[-1][-1] = p0
+        self.__table.set_objective(basis_costs, non_basis_costs)
 
     def first_statement(self):
         """For all **i > 0**: **P[i] >= 0** => **P[0] - minimal value of goal function**"""
         p_vector = self.p_vector()
+        tolerances = self.__table.tolerances()
+
         for item in p_vector[:-1]:
-            if item < 0:
+            if tolerances.is_improving(item):
                 return False
 
         return True
@@ -216,102 +375,82 @@ class SimplexTable:
     def second_statement(self):
         """If *EXIST* the number **S** that: **P[S] < 0 and column[S][i] <= 0 (for all i=1,2,...,m)** => goal function is *unlimited*"""
         p_vector = self.p_vector()
-        indices = [index for index, value in enumerate(p_vector[:-1]) if value < 0]
+        tolerances = self.__table.tolerances()
+        indices = [index for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value)]
 
         for index in indices:
-            if all(value <= 0 for value in self.column(index)):
+            if not any(tolerances.is_pivot(value) for value in self.column(index)[:-1]):
                 return True
 
         return False
 
     def third_statement(self):
-        """If *EXIST* the number **S** that **P[S] < 0 and *EXIST* the number *R* that column[S][R] > 0 => possible to do one more iteration"""
+        """If *EXIST* the number **S** that **P[S] < 0 and *EXIST* the number *R* that column[S][R] > 0 => possible to do one more iteration.
+        If some basis variable is out of its bounds, iteration of dual simplex method is checked instead"""
+        if not self.is_primal_feasible():
+            return find_dual_pivot(self.__table, self.__basis, self.__bounds) is not None
+
+        if self.__bounds is not None:
+            return find_bounded_pivot(self.__table, self.__basis, self.__bounds) is not None
+
         p_vector = self.p_vector()
-        indices = [index for index, value in enumerate(p_vector[:-1]) if value < 0]
+        tolerances = self.__table.tolerances()
+        indices = [index for index, value in enumerate(p_vector[:-1]) if tolerances.is_improving(value)]
         for index in indices:
-            if any(value <= 0 for value in self.column(index)):
+            if any(tolerances.is_pivot(value) for value in self.column(index)[:-1]):
                 return True
 
         return False
 
     def column_by_var(self, var):
         """Returns column by name of varible"""
-        if var not in self.__column_variables_names:
+        column_index = self.__column_index_by_var(var)
+        if column_index == -1:
             return -1
-        column_index = self.__column_variables_names.index(var)
         return self.column(column_index)
 
     def row_by_var(self, var):
         """Returns row by name of varible"""
-        if var not in self.__row_variables_names:
+        row_index = self.__row_index_by_var(var)
+        if row_index == -1:
             return -1
-        row_index = self.__row_variables_names.index(var)
         return self.row(row_index)
 
     def column(self, index):
         """Returns the column by **index**"""
-        if index < 0 or index >= len(self.__table[0]):
+        if index < 0 or index >= self.__table.column_number():
             return -1
-        return [row[index] for row in self.__table]
+        return self.__table.column(index)
 
     def row(self, index):
         """Returns the row by **index**"""
-        if index < 0 or index >= len(self.__table):
+        if index < 0 or index >= self.__table.row_number():
             return -1
-        return self.__table[index]
+        return self.__table.row(index)
 
     def __column_index_by_var(self, var):
         """Returns the column index by **var**"""
-        if var not in self.__column_variables_names:
+        if var not in self.__variable_index:
             return -1
 
-        return self.__column_variables_names.index(var)
+        return self.__basis.column_of(self.__variable_index[var])
 
     def __row_index_by_var(self, var):
         """Returns the row index by **var**"""
-        if var not in self.__row_variables_names:
+        if var not in self.__variable_index:
             return -1
 
-        return self.__row_variables_names.index(var)
-
-    def __set_column(self, index, new_col):
-        """Set the new column at **index** in table"""
-        for col_val, row in zip(new_col, self.__table):
-            row[index] = col_val
-
-    def __set_row(self, index, new_row):
-        """Set the new row at **index** in table"""
-        self.__table[index] = new_row
+        return self.__basis.row_of(self.__variable_index[var])
 
     def find_pivot_element(self):
         """Method that performs finding a pivot element in table"""
         if self.__pivot_element is not None:
             return
 
-        p_vector = self.p_vector()
-
-        col_indices = [index for index, value in enumerate(p_vector[:-1]) if value < 0 and any(item > 0 for item in self.column(index))]
-        
-        if len(col_indices) == 0:
-            self.__pivot_element = None
-            return
-
-        col_index = p_vector.index(min([p_vector[index] for index in col_indices]))
-        
-        column = self.column(col_index)[:-1]
-
-        row_indices = [index for index, value in enumerate(column) if value > 0]
-
-        if len(row_indices) == 0:
-            self.__pivot_element = None
-            return
-
-        ratios = None
-        if self.__fractional:
-            ratios = [Fraction(self.free_member()[index], column[index]) for index in row_indices]
+        if not self.is_primal_feasible():
+            self.__pivot_element = find_dual_pivot(self.__table, self.__basis, self.__bounds)
         else:
-            ratios = [self.free_member()[index]/column[index] for index in row_indices]
-
-        row_index = row_indices[ratios.index(min(ratios))]
+            self.__pivot_element = self.__pricing.find_pivot(self.__table, self.__basis, self.__bounds)
 
-        self.__pivot_element = [self.__row_variables_names[row_index], self.__column_variables_names[col_index]]
+            if self.__stats is not None and self.__pivot_element is not None and self.__pivot_element[0] != -1:
+                self.__stats.observe_ratio_test(self.__table, *self.__pivot_element)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from src.simplex.pricing import BlandPricing, create_pricing
+
+# число итераций подряд без изменения целевой функции, после которого метод считается застрявшим
+STALLING_LIMIT = 50
+
+class StallingDetector:
+    """Watches iterations of auto-solving: value of goal function and bases visited since it changed the last time.
+    If basis repeats (cycling) or goal function does not change for **limit** iterations (stalling),
+    tables are switched to Bland's rule, which can not cycle. Original rule is restored as soon as goal function changes"""
+
+    def __init__(self, pricing = None, limit = STALLING_LIMIT):
+        """Constructor. **pricing** - rule of choosing pivot column that is used while there is progress"""
+        self.__pricing = pricing
+        self.__limit = limit
+
+        self.__p0 = None
+        self.__visited = set()
+        self.__degenerate_number = 0
+        self.__active = False
+        self.__switches_number = 0
+
+    def reset(self):
+        """Forgets previous iterations (the next table starts new series)"""
+        self.__p0 = None
+        self.__visited = set()
+        self.__degenerate_number = 0
+
+    def is_active(self):
+        """Returns **True** if Bland's rule is used now"""
+        return self.__active
+
+    def switches_number(self):
+        """Returns how many times Bland's rule was switched on"""
+        return self.__switches_number
+
+    def observe(self, table):
+        """Checks **table** made by the last iteration and switches its rule of choosing pivot column if needed"""
+        p0 = table.p0()
+        key = (tuple(table.basis().basis()), tuple(table.complemented()))
+
+        if p0 != self.__p0:
+            self.__p0 = p0
+            self.__visited = {key}
+            self.__degenerate_number = 0
+
+            if self.__active:
+                self.__active = False
+                table.set_pricing(create_pricing(self.__pricing))
+
+            return
+
+        self.__degenerate_number += 1
+
+        is_cycling = key in self.__visited
+        self.__visited.add(key)
+
+        if self.__active or not (is_cycling or self.__degenerate_number >= self.__limit):
+            return
+
+        self.__active = True
+        self.__switches_number += 1
+
+        table.set_pricing(BlandPricing())
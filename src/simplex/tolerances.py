@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# допуски режима float: значения меньше по модулю считаются нулём в соответствующих проверках
+PRIMAL_TOLERANCE = 1e-9
+DUAL_TOLERANCE = 1e-9
+PIVOT_TOLERANCE = 1e-9
+
+class Tolerances:
+    """Tolerances of comparisons with zero in tables: **primal** - for free members (feasibility and the end of artificial basis phase),
+    **dual** - for P vector (column improves goal function only if **P[j] < -dual**), **pivot** - the smallest pivot element.
+    If **harris** is **True**, ratio test is Harris two-pass one: the first pass finds the largest step with free members relaxed by **primal**,
+    the second pass takes the largest pivot element among rows that fit that step"""
+
+    def __init__(self, primal = PRIMAL_TOLERANCE, dual = DUAL_TOLERANCE, pivot = PIVOT_TOLERANCE, harris = True):
+        self.__primal = primal
+        self.__dual = dual
+        self.__pivot = pivot
+        self.__harris = harris
+
+    def primal(self):
+        return self.__primal
+
+    def dual(self):
+        return self.__dual
+
+    def pivot(self):
+        return self.__pivot
+
+    def is_harris(self):
+        return self.__harris
+
+    def is_improving(self, value):
+        """Returns **True** if column with value **value** of P vector decreases goal function"""
+        return value < -self.__dual
+
+    def is_pivot(self, value):
+        """Returns **True** if positive **value** is large enough for pivot element"""
+        return value > self.__pivot
+
+    def is_negative(self, value):
+        """Returns **True** if free member **value** is infeasible (below zero)"""
+        return value < -self.__primal
+
+    def is_zero(self, value):
+        return abs(value) <= self.__primal
+
+    def ratio_test(self, entries):
+        """Returns row index chosen by ratio test from **entries** - pairs **(row_index, a, b)** of pivot column values and free members"""
+        entries = [(row_index, a, b) for row_index, a, b in entries if self.is_pivot(a)]
+
+        if len(entries) == 0:
+            return None
+
+        if not self.__harris:
+            best_index, best_ratio = None, None
+
+            for row_index, a, b in entries:
+                ratio = b/a
+
+                if best_ratio is None or ratio < best_ratio:
+                    best_index, best_ratio = row_index, ratio
+
+            return best_index
+
+        bound = min((b + self.__primal)/a for _, a, b in entries)
+
+        best_index, best_value = None, None
+
+        for row_index, a, b in entries:
+            if b/a <= bound and (best_value is None or a > best_value):
+                best_index, best_value = row_index, a
+
+        return best_index
+
+# точная арифметика: сравнения с нулём без допусков и обычный тест отношений
+EXACT_TOLERANCES = Tolerances(0, 0, 0, harris = False)
+
+def create_tolerances(tolerances = None, fractional = False):
+    """Returns **tolerances** if given, else exact comparisons for fractions and default tolerances for floats"""
+    if tolerances is not None:
+        return tolerances
+
+    return EXACT_TOLERANCES if fractional else Tolerances()
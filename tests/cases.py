@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Small tasks with known optimum for tests: matrix with free member, goal function, basis point for simplex method and minimum"""
+import random
+from fractions import Fraction
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+
+try:
+    from scipy.optimize import linprog
+except ImportError:
+    linprog = None
+
+class Case:
+    def __init__(self, name, matrix, func, point, p0, solution):
+        self.name = name
+        self.matrix = matrix
+        self.func = func
+        self.point = point
+        self.p0 = p0
+        self.solution = solution
+
+    def copy_matrix(self):
+        """Methods change matrix and goal function given to them, so every test takes its own copy"""
+        return [row[:] for row in self.matrix]
+
+    def copy_func(self):
+        return list(self.func)
+
+CASES = [
+    Case("example",
+         [[1, 2, 5, -1, 4], [1, -1, -1, 2, 1]],
+         [2, -1, -3, -1],
+         [1, 1, 0, 0],
+         -5, [0, 3, 0, 2]),
+    Case("production",
+         [[1, 0, 1, 0, 0, 4], [0, 2, 0, 1, 0, 12], [3, 2, 0, 0, 1, 18]],
+         [-3, -5, 0, 0, 0],
+         [0, 0, 1, 1, 1],
+         -36, [2, 6, 2, 0, 0]),
+    # пример Била: правило Данцига без защиты от зацикливания здесь зацикливается
+    Case("beale",
+         [[Fraction(1, 4), -8, -1, 9, 1, 0, 0, 0], [Fraction(1, 2), -12, Fraction(-1, 2), 3, 0, 1, 0, 0], [0, 0, 1, 0, 0, 0, 1, 1]],
+         [Fraction(-3, 4), 20, Fraction(-1, 2), 6, 0, 0, 0],
+         [0, 0, 0, 0, 1, 1, 1],
+         Fraction(-5, 4), [1, 0, 1, 0, Fraction(3, 4), 0, 0]),
+    Case("diet",
+         [[2, 1, 1, -1, 0, 0, 8], [1, 2, 3, 0, -1, 0, 9], [1, 1, 0, 0, 0, 1, 5]],
+         [3, 4, 2, 0, 0, 0],
+         None,
+         13, [3, 0, 2, 0, 0, 2]),
+]
+
+UNBOUNDED_CASE = Case("unbounded", [[1, -1, 1, 1]], [-1, 0, 0], [0, 0, 1], None, None)
+
+INFEASIBLE_CASE = Case("infeasible", [[1, 1, -1]], [1, 1], None, None, None)
+
+def random_task(seed, rows = 4, columns = 8):
+    """Returns random task **A*x <= b** written with slack variables (the last **rows** columns), so slacks give feasible basis.
+    Variables of goal function are integers, free member is positive"""
+    generator = random.Random(seed)
+
+    matrix = []
+
+    for i in range(rows):
+        row = [generator.randint(-2, 6) for _ in range(columns)]
+        row += [1 if k == i else 0 for k in range(rows)]
+        row.append(generator.randint(1, 20))
+        matrix.append(row)
+
+    func = [generator.randint(-5, 3) for _ in range(columns)] + [0 for _ in range(rows)]
+    point = [0 for _ in range(columns)] + [1 for _ in range(rows)]
+
+    return matrix, func, point
+
+def sparse_task(seed, rows = 20, columns = 60):
+    """Returns random task like **random_task** with about 5% of nonzero values (every column has at least one positive value).
+    It is big enough to be stored sparse automatically"""
+    generator = random.Random(seed)
+
+    matrix = []
+
+    for i in range(rows):
+        row = [generator.randint(1, 5) if generator.random() < 0.05 else 0 for _ in range(columns)]
+        row += [1 if k == i else 0 for k in range(rows)]
+        row.append(generator.randint(1, 20))
+        matrix.append(row)
+
+    for j in range(columns):
+        if all(row[j] == 0 for row in matrix):
+            matrix[generator.randrange(rows)][j] = generator.randint(1, 5)
+
+    func = [generator.randint(-5, 3) for _ in range(columns)] + [0 for _ in range(rows)]
+    point = [0 for _ in range(columns)] + [1 for _ in range(rows)]
+
+    return matrix, func, point
+
+def create_method(method, matrix, func, point = None, **options):
+    """Returns **SimplexMethod** that starts from basis **point** or **ArtificialBasisMethod** (it does not need point),
+    **options** are passed to constructor"""
+    if method is SimplexMethod:
+        return SimplexMethod(matrix = matrix, func = func, point = point, **options)
+
+    return ArtificialBasisMethod(matrix = matrix, func = func, **options)
+
+def snapshot(table):
+    """Returns everything that is shown of table: variables of rows and columns, values and pivot element"""
+    return table.row_variables(), table.column_variables(), table.value_table(), table.pivot_element()
+
+def reference_solve(matrix, func, bounds = None):
+    """Returns **(status, p0)** found by scipy: _optimal_, _unbounded_ or _infeasible_ (None if scipy is not installed)"""
+    if linprog is None:
+        return None
+
+    result = linprog([float(value) for value in func],
+                     A_eq = [[float(value) for value in row[:-1]] for row in matrix],
+                     b_eq = [float(row[-1]) for row in matrix],
+                     bounds = bounds if bounds is not None else (0, None),
+                     method = "highs")
+
+    if result.status == 0:
+        return "optimal", result.fun
+
+    return {2: "infeasible", 3: "unbounded"}.get(result.status, "error"), None
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import unittest
+from fractions import Fraction
+from src.exceptions.exceptions import BackendError, InfeasibleTaskError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.backends.backend import backend_class
+from src.simplex.backends.numpy_backend import NumpyBackend
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import CASES, UNBOUNDED_CASE, INFEASIBLE_CASE
+
+FLOAT_BACKENDS = ["list", "sparse"] + (["numpy"] if NumpyBackend.is_available() else [])
+FRACTIONAL_BACKENDS = ["list", "sparse", "integer"]
+
+def solve(case, method, fractional, backend):
+    if method is SimplexMethod and case.point is not None:
+        solver = SimplexMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = fractional, point = list(case.point), backend = backend)
+    else:
+        solver = ArtificialBasisMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = fractional, backend = backend)
+
+    solver.auto_solve()
+
+    return solver
+
+class BackendsTest(unittest.TestCase):
+    def test_float_backends(self):
+        for backend in FLOAT_BACKENDS:
+            for method in [SimplexMethod, ArtificialBasisMethod]:
+                for case in CASES:
+                    with self.subTest(backend = backend, method = method.__name__, case = case.name):
+                        solver = solve(case, method, False, backend)
+
+                        self.assertAlmostEqual(solver.p0(), float(case.p0))
+
+                        for value, expected in zip(solver.solution(), case.solution):
+                            self.assertAlmostEqual(value, float(expected))
+
+    def test_fractional_backends_are_exact(self):
+        for backend in FRACTIONAL_BACKENDS:
+            for method in [SimplexMethod, ArtificialBasisMethod]:
+                for case in CASES:
+                    with self.subTest(backend = backend, method = method.__name__, case = case.name):
+                        solver = solve(case, method, True, backend)
+
+                        self.assertEqual(solver.p0(), case.p0)
+                        self.assertIsInstance(solver.p0(), Fraction)
+                        self.assertEqual(solver.solution(), case.solution)
+
+    def test_unbounded_task(self):
+        for backend in FLOAT_BACKENDS:
+            with self.subTest(backend = backend):
+                solver = solve(UNBOUNDED_CASE, SimplexMethod, False, backend)
+
+                self.assertFalse(solver.last_table().first_statement())
+
+    def test_infeasible_task(self):
+        for backend in FLOAT_BACKENDS:
+            with self.subTest(backend = backend):
+                with self.assertRaises(InfeasibleTaskError):
+                    solve(INFEASIBLE_CASE, ArtificialBasisMethod, False, backend)
+
+    def test_backend_must_fit_mode(self):
+        with self.assertRaises(BackendError):
+            backend_class(fractional = False, backend = "integer")
+
+        with self.assertRaises(BackendError):
+            backend_class(fractional = True, backend = "numpy")
+
+        with self.assertRaises(BackendError):
+            backend_class(backend = "unknown")
+
+if __name__ == "__main__":
+    unittest.main()
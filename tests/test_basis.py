@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.artificial_basis.artificial_basis_table import ArtificialBasisTable
+from src.simplex.basis import Basis
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import CASES, random_task
+
+def solved_methods(seed):
+    matrix, func, point = random_task(seed)
+
+    simplex_method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = point)
+    artificial_method = ArtificialBasisMethod(matrix = matrix, func = func, fractional = True)
+
+    for method in [simplex_method, artificial_method]:
+        method.auto_solve()
+        yield method
+
+class BasisTest(unittest.TestCase):
+    def check_positions(self, basis, rows, columns):
+        self.assertEqual(basis.basis(), rows)
+        self.assertEqual(basis.non_basis(), columns)
+
+        for variable in range(basis.variables_number()):
+            self.assertEqual(basis.row_of(variable), rows.index(variable) if variable in rows else -1)
+            self.assertEqual(basis.column_of(variable), columns.index(variable) if variable in columns else -1)
+            self.assertEqual(basis.is_basic(variable), variable in rows)
+
+    def test_exchange_and_delete(self):
+        """Positions are the same as positions in plain lists after random exchanges and deletions"""
+        for seed in range(20):
+            generator = random.Random(seed)
+            variables = list(range(12))
+            generator.shuffle(variables)
+
+            rows, columns = variables[:4], variables[4:]
+            basis = Basis(rows, columns, len(variables))
+
+            with self.subTest(seed = seed):
+                for _ in range(30):
+                    if generator.random() < 0.2 and len(columns) > 1:
+                        column_index = generator.randrange(len(columns))
+                        basis.delete_column(column_index)
+                        columns.pop(column_index)
+                    else:
+                        row_index, column_index = generator.randrange(len(rows)), generator.randrange(len(columns))
+                        basis.exchange(row_index, column_index)
+                        rows[row_index], columns[column_index] = columns[column_index], rows[row_index]
+
+                    self.check_positions(basis, rows, columns)
+
+    def test_copy(self):
+        basis = Basis([0, 1], [2, 3, 4], 5)
+        copy = basis.copy()
+        copy.exchange(0, 2)
+
+        self.check_positions(basis, [0, 1], [2, 3, 4])
+        self.check_positions(copy, [4, 1], [2, 3, 0])
+
+class TableVariablesTest(unittest.TestCase):
+    def test_names_and_cells(self):
+        """Names of rows and columns address the same cells as indices"""
+        for seed in range(10):
+            for method in solved_methods(seed):
+                for index in range(method.tables_number()):
+                    table = method.get_table(index)
+
+                    with self.subTest(seed = seed, method = method.method_name(), index = index):
+                        rows, columns = table.row_variables(), table.column_variables()
+                        values = table.value_table()
+
+                        self.assertEqual(len(set(rows + columns)), len(rows + columns))
+
+                        for i, row_var in enumerate(rows):
+                            for j, col_var in enumerate(columns):
+                                if col_var != "b":
+                                    self.assertEqual(table.get_value_by_var(row_var, col_var), values[i][j])
+
+                        if table.pivot_index() is not None and table.pivot_index()[0] != -1:
+                            i, j = table.pivot_index()
+                            self.assertEqual(table.pivot_element(), [rows[i], columns[j]])
+
+    def test_original_variables_stay(self):
+        """Only artificial variables leave table of artificial basis method"""
+        for seed in range(10):
+            matrix, func, _ = random_task(seed)
+            originals = {"x{}".format(k + 1) for k in range(len(func))}
+
+            method = ArtificialBasisMethod(matrix = matrix, func = func, fractional = True)
+            method.auto_solve()
+
+            tables = [method.get_table(index) for index in range(method.tables_number())]
+            tables = [table for table in tables if isinstance(table, ArtificialBasisTable)]
+
+            self.assertGreater(len(tables), 1)
+
+            for index, table in enumerate(tables):
+                with self.subTest(seed = seed, index = index):
+                    self.assertTrue(originals <= set(table.row_variables() + table.column_variables()))
+
+    def test_known_optima(self):
+        for case in CASES:
+            with self.subTest(case = case.name):
+                method = ArtificialBasisMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = True)
+                method.auto_solve()
+
+                self.assertEqual(method.p0(), case.p0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from src.exceptions.exceptions import InfeasibleTaskError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.simplex_method.batch_simplex_method import BatchSimplexMethod
+from src.simplex.backends.numpy_backend import NumpyBackend
+from tests.cases import random_task
+
+TASKS_NUMBER = 60
+
+def separate_solve(matrix, func, free_member):
+    """Returns **(status, p0)** of one task solved exactly, p0 is None if task is unbounded or infeasible"""
+    method = ArtificialBasisMethod(matrix = [row[:-1] + [value] for row, value in zip(matrix, free_member)], func = list(func), fractional = True)
+
+    try:
+        method.auto_solve()
+    except InfeasibleTaskError:
+        return "infeasible", None
+
+    if not method.simplex_method().last_table().first_statement():
+        return "unbounded", None
+
+    return "optimal", method.p0()
+
+class BatchSimplexTest(unittest.TestCase):
+    def setUp(self):
+        self.matrix, self.func, self.point = random_task(1)
+
+        generator = random.Random(1)
+        self.free_members = [[generator.randint(-3, 30) for _ in self.matrix] for _ in range(TASKS_NUMBER)]
+        self.funcs = [[generator.randint(-5, 3) for _ in range(8)] + [0, 0, 0, 0] for _ in range(TASKS_NUMBER)]
+
+    def check(self, batch, funcs, free_members, fractional):
+        for index in range(TASKS_NUMBER):
+            with self.subTest(index = index):
+                status, expected = separate_solve(self.matrix, funcs[index], free_members[index])
+                p0 = batch.p0(index)
+
+                self.assertEqual(batch.status(index), status)
+
+                if expected is None or p0 is None:
+                    self.assertEqual(p0, expected)
+                elif fractional:
+                    self.assertEqual(p0, expected)
+                else:
+                    self.assertAlmostEqual(p0, float(expected), places = 6)
+
+                if p0 is not None:
+                    solution = batch.solution(index)
+                    self.assertAlmostEqual(sum(cost*value for cost, value in zip(funcs[index], solution)), p0, places = 6)
+
+    def test_free_members(self):
+        for fractional in [False, True]:
+            batch = BatchSimplexMethod(matrix = self.matrix, func = self.func, free_members = self.free_members, fractional = fractional, point = self.point)
+            batch.auto_solve()
+
+            with self.subTest(fractional = fractional):
+                self.check(batch, [self.func for _ in range(TASKS_NUMBER)], self.free_members, fractional)
+
+    def test_goal_functions(self):
+        for fractional in [False, True]:
+            batch = BatchSimplexMethod(matrix = self.matrix, funcs = self.funcs, fractional = fractional, point = self.point)
+            batch.auto_solve()
+
+            with self.subTest(fractional = fractional):
+                self.check(batch, self.funcs, [[row[-1] for row in self.matrix] for _ in range(TASKS_NUMBER)], fractional)
+
+    def test_goal_functions_and_free_members(self):
+        batch = BatchSimplexMethod(matrix = self.matrix, funcs = self.funcs, free_members = self.free_members, point = self.point)
+        batch.auto_solve()
+
+        self.check(batch, self.funcs, self.free_members, False)
+
+    def test_unbounded_and_infeasible_tasks(self):
+        """Unbounded and infeasible tasks get their status and no solution"""
+        statuses = set()
+
+        for seed in range(20):
+            matrix, func, point = random_task(seed, rows = 2, columns = 3)
+
+            generator = random.Random(seed)
+            free_members = [[generator.randint(-3, 10) for _ in matrix] for _ in range(10)]
+
+            for fractional in [False, True]:
+                batch = BatchSimplexMethod(matrix = matrix, func = func, free_members = free_members, fractional = fractional, point = point)
+                batch.auto_solve()
+
+                for index, free_member in enumerate(free_members):
+                    with self.subTest(seed = seed, fractional = fractional, index = index):
+                        status, p0 = separate_solve(matrix, func, free_member)
+                        statuses.add(status)
+
+                        self.assertEqual(batch.status(index), status)
+
+                        if status == "optimal":
+                            self.assertAlmostEqual(float(batch.p0(index)), float(p0), places = 6)
+                        else:
+                            self.assertIsNone(batch.p0(index))
+                            self.assertIsNone(batch.solution(index))
+
+                        self.assertEqual(batch.error(index) is not None, status == "infeasible")
+
+        self.assertEqual(statuses, {"optimal", "unbounded", "infeasible"})
+
+    @unittest.skipUnless(NumpyBackend.is_available(), "numpy is not installed")
+    def test_tasks_are_batched(self):
+        batch = BatchSimplexMethod(matrix = self.matrix, func = self.func, free_members = self.free_members, point = self.point)
+        batch.auto_solve()
+
+        self.assertGreater(batch.batch_solves_number(), 0)
+        self.assertLess(batch.separate_solves_number(), TASKS_NUMBER)
+
+if __name__ == "__main__":
+    unittest.main()
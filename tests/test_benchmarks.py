@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import unittest
+from src.benchmarks.__main__ import compare, run
+from src.benchmarks.families import FAMILIES, OPTIMAL, klee_minty
+from tests.cases import reference_solve
+
+SIZES = [2, 4]
+
+class BenchmarkFamiliesTest(unittest.TestCase):
+    def test_same_seed_same_task(self):
+        for family, generator in FAMILIES.items():
+            with self.subTest(family = family):
+                first, second = generator(4, seed = 3), generator(4, seed = 3)
+
+                self.assertEqual(first.matrix, second.matrix)
+                self.assertEqual(first.func, second.func)
+                self.assertTrue(all(row[-1] >= 0 for row in first.matrix))
+
+    def test_expected_status(self):
+        for family, generator in FAMILIES.items():
+            for size in SIZES:
+                task = generator(size)
+
+                for method in ["simplex", "artificial"]:
+                    if method == "simplex" and task.point is None:
+                        continue
+
+                    for fractional in [False, True]:
+                        with self.subTest(family = family, size = size, method = method, fractional = fractional):
+                            record = run(task, method, fractional)
+
+                            self.assertEqual(record["status"], task.expected)
+
+                            if record["status"] == OPTIMAL:
+                                self.assertIn("main", record["stats"]["times"])
+                                self.assertIn("peak_memory", record)
+
+    def test_optimum_as_reference(self):
+        if reference_solve([[1, 1]], [1]) is None:
+            self.skipTest("scipy is not installed")
+
+        for family, generator in FAMILIES.items():
+            for size in SIZES:
+                task = generator(size)
+
+                if task.expected != OPTIMAL:
+                    continue
+
+                with self.subTest(family = family, size = size):
+                    status, p0 = reference_solve(task.matrix, task.func)
+
+                    self.assertEqual(status, OPTIMAL)
+                    self.assertAlmostEqual(run(task, "artificial", True)["p0"], p0, places = 6)
+
+    def test_klee_minty_visits_all_vertices(self):
+        for size in [3, 5]:
+            with self.subTest(size = size):
+                record = run(klee_minty(size), "simplex", True)
+
+                self.assertEqual(record["p0"], -5**size)
+                self.assertEqual(record["iterations"], 2**size - 1)
+
+    def test_compare(self):
+        baseline = [{"family": "dense", "size": 5, "method": "simplex", "mode": "float", "status": OPTIMAL, "time": 2.0}]
+        records = [dict(baseline[0], time = 1.0), {"family": "dense", "size": 10, "method": "simplex", "mode": "float", "status": OPTIMAL, "time": 1.0}]
+
+        lines = compare(records, baseline)
+
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("x0.50"))
+
+if __name__ == "__main__":
+    unittest.main()
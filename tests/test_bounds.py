@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from src.exceptions.exceptions import InfeasibleTaskError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.bounds import Bounds
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import random_task, reference_solve
+
+def random_bounds(seed, variables_number, structural_number = 8, shifted = False):
+    """Returns list of **(lower, upper)** pairs: structural variables get random upper bounds (and lower bounds if **shifted**)"""
+    generator = random.Random(seed)
+    bounds = []
+
+    for j in range(variables_number):
+        lower = generator.choice([0, 0, 1]) if shifted and j < structural_number else 0
+        upper = generator.choice([None, 1, 2, 3, 5]) if j < structural_number else None
+
+        bounds.append((lower, None if upper is None else lower + upper))
+
+    return bounds
+
+def is_within(solution, bounds):
+    return all(lower <= value and (upper is None or value <= upper) for value, (lower, upper) in zip(solution, bounds))
+
+class BoundsTest(unittest.TestCase):
+    def test_transform_and_restore(self):
+        bounds = Bounds.from_pairs([(1, 4), (0, None), (2, 3)])
+
+        matrix, func, constant = bounds.transform([[1, 2, 3, 10]], [1, 1, 1], [True, False, False])
+
+        # x1 = 1 + 3 - y1, x3 = 2 + y3
+        self.assertEqual(matrix, [[-1, 2, 3, 0]])
+        self.assertEqual(func, [-1, 1, 1])
+        self.assertEqual(constant, 6)
+        self.assertEqual(bounds.restore([1, 5, 0], [True, False, False]), [3, 5, 2])
+
+    def test_upper_bounds_exact(self):
+        for seed in range(30):
+            matrix, func, point = random_task(seed)
+            bounds = random_bounds(seed, len(func))
+
+            with self.subTest(seed = seed):
+                method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point), bounds = list(bounds))
+                method.auto_solve()
+
+                if not method.last_table().first_statement():
+                    continue
+
+                solution = method.solution()
+
+                self.assertTrue(is_within(solution, bounds))
+                self.assertEqual(method.p0(), sum(cost*value for cost, value in zip(func, solution)))
+
+    def test_same_optimum_as_reference(self):
+        if reference_solve([[1, 1]], [1]) is None:
+            self.skipTest("scipy is not installed")
+
+        for shifted in [False, True]:
+            for seed in range(30):
+                matrix, func, point = random_task(seed)
+                bounds = random_bounds(seed, len(func), shifted = shifted)
+                status, p0 = reference_solve(matrix, func, bounds)
+
+                with self.subTest(seed = seed, shifted = shifted):
+                    method = ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = list(func), bounds = list(bounds))
+
+                    try:
+                        method.auto_solve()
+                    except InfeasibleTaskError:
+                        self.assertEqual(status, "infeasible")
+                        continue
+
+                    is_optimal = method.simplex_method().last_table().first_statement()
+
+                    self.assertEqual(is_optimal, status == "optimal")
+
+                    if is_optimal:
+                        self.assertAlmostEqual(method.p0(), p0, places = 6)
+                        self.assertTrue(is_within([round(value, 9) for value in method.solution()], bounds))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import tempfile
+import unittest
+from fractions import Fraction
+from src.common.file_managment import load_task_from_file
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.__main__ import main
+from tests.cases import CASES, INFEASIBLE_CASE, UNBOUNDED_CASE
+
+def write_case(directory, case):
+    with open(os.path.join(directory, case.name + ".mat"), "w") as file:
+        file.write("\n".join(" ".join(str(item) for item in row) for row in case.matrix))
+
+    with open(os.path.join(directory, case.name + ".func"), "w") as file:
+        file.write(" ".join(str(item) for item in case.func))
+
+class CommandLineTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "output.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_main(self, *args):
+        self.assertEqual(main(list(args) + ["--output", self.output]), 0)
+
+        with open(self.output) as file:
+            return [json.loads(line) for line in file]
+
+    def test_directory_of_tasks(self):
+        for case in CASES:
+            write_case(self.directory.name, case)
+
+        records = self.run_main(self.directory.name, "--fractional")
+        by_name = {os.path.splitext(os.path.basename(record["problem"]))[0]: record for record in records}
+
+        self.assertEqual(sorted(by_name), sorted(case.name for case in CASES))
+
+        for case in CASES:
+            with self.subTest(case = case.name):
+                record = by_name[case.name]
+
+                self.assertEqual(record["status"], "optimal")
+                self.assertEqual(Fraction(record["p0"]), case.p0)
+                self.assertEqual([Fraction(value) for value in record["solution"]], case.solution)
+
+    def test_simplex_method_with_point(self):
+        case = CASES[0]
+        write_case(self.directory.name, case)
+
+        [record] = self.run_main(os.path.join(self.directory.name, case.name + ".mat"), "--method", "simplex", "--point", " ".join(str(item) for item in case.point), "--stats")
+
+        self.assertEqual(record["status"], "optimal")
+        self.assertAlmostEqual(record["p0"], float(case.p0))
+        self.assertIn("stats", record)
+
+    def test_infeasible_and_unbounded_tasks(self):
+        for case, status in [(INFEASIBLE_CASE, "infeasible"), (UNBOUNDED_CASE, "unbounded")]:
+            write_case(self.directory.name, case)
+
+            with self.subTest(case = case.name):
+                [record] = self.run_main(os.path.join(self.directory.name, case.name + ".mat"), "--fractional")
+
+                self.assertEqual(record["status"], status)
+                self.assertNotIn("error", record)
+                self.assertIsNone(record.get("p0"))
+
+    def test_error_is_written_as_record(self):
+        path = os.path.join(self.directory.name, "lonely.mat")
+
+        with open(path, "w") as file:
+            file.write("1 1 1")
+
+        [record] = self.run_main(path)
+
+        self.assertEqual(record["status"], "error")
+        self.assertIn("error", record)
+
+    def test_model_file(self):
+        path = os.path.join(self.directory.name, "model.lp")
+
+        with open(path, "w") as file:
+            file.write("Maximize\n obj: 3 x + 5 y\nSubject To\n c1: x <= 4\n c2: 2 y <= 12\n c3: 3 x + 2 y <= 18\nEnd\n")
+
+        [record] = self.run_main(path, "--fractional")
+
+        self.assertEqual(record["status"], "optimal")
+        self.assertEqual(record["p0"], 36)
+        self.assertEqual(record["solution"], [2, 6])
+        self.assertEqual(record["variables"], ["x", "y"])
+
+    def test_saved_tasks(self):
+        case = CASES[0]
+        write_case(self.directory.name, case)
+        save_directory = os.path.join(self.directory.name, "tasks")
+        os.mkdir(save_directory)
+
+        self.run_main(os.path.join(self.directory.name, case.name + ".mat"), "--fractional", "--save-tasks", save_directory)
+
+        method = ArtificialBasisMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = True)
+        method.auto_solve()
+
+        with open(os.path.join(save_directory, case.name + ".task"), "rb") as file:
+            task = load_task_from_file(file)
+
+            self.assertEqual(task.method_name(), "artificial")
+            self.assertEqual(task.p0(), case.p0)
+            self.assertEqual(task.tables_number(), method.tables_number())
+
+if __name__ == "__main__":
+    unittest.main()
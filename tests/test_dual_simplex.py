@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from src.exceptions.exceptions import InfeasibleTaskError, UnsolvedTaskError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import random_task, reference_solve
+
+def solve_again(matrix, func, fractional = True, bounds = None):
+    """Solves task from scratch, returns p0 or None if task is infeasible or unbounded"""
+    method = ArtificialBasisMethod(matrix = matrix, func = func, fractional = fractional, bounds = bounds)
+
+    try:
+        method.auto_solve()
+    except InfeasibleTaskError:
+        return None
+
+    if not method.simplex_method().last_table().first_statement():
+        return None
+
+    return method.p0()
+
+def with_constraint(matrix, func, row, less_equal):
+    """Returns task with new row and its slack variable (the last one), like **add_constraint** does"""
+    new_matrix = [old_row[:-1] + [0, old_row[-1]] for old_row in matrix]
+    new_matrix.append(list(row[:-1]) + [1 if less_equal else -1, row[-1]])
+
+    return new_matrix, list(func) + [0]
+
+def solved_task(seed, fractional = True, bounds = None):
+    matrix, func, point = random_task(seed)
+    method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = fractional, point = list(point), bounds = bounds)
+    method.auto_solve()
+
+    return method, matrix, func
+
+class AddConstraintTest(unittest.TestCase):
+    def test_task_must_be_solved(self):
+        matrix, func, point = random_task(0)
+        method = SimplexMethod(matrix = matrix, func = func, point = point)
+
+        with self.assertRaises(UnsolvedTaskError):
+            method.add_constraint([1 for _ in range(len(func))] + [1])
+
+    def test_same_optimum_as_new_task(self):
+        for less_equal in [True, False]:
+            for seed in range(30):
+                method, matrix, func = solved_task(seed)
+
+                if not method.last_table().first_statement():
+                    continue
+
+                generator = random.Random(seed)
+                row = [generator.randint(0, 3) for _ in range(len(func))] + [generator.randint(1, 15)]
+                new_matrix, new_func = with_constraint(matrix, func, row, less_equal)
+
+                with self.subTest(seed = seed, less_equal = less_equal):
+                    expected = solve_again(new_matrix, new_func)
+
+                    try:
+                        method.add_constraint(row, less_equal)
+                    except InfeasibleTaskError:
+                        self.assertIsNone(expected)
+                        continue
+
+                    self.assertEqual(method.p0(), expected)
+                    self.assertEqual(len(method.solution()), len(new_func))
+
+    def test_bounded_variables(self):
+        bounds = [(0, 3) for _ in range(8)] + [(0, None) for _ in range(4)]
+
+        for seed in range(20):
+            method, matrix, func = solved_task(seed, bounds = list(bounds))
+
+            generator = random.Random(seed)
+            row = [generator.randint(0, 3) for _ in range(len(func))] + [generator.randint(1, 15)]
+            new_matrix, new_func = with_constraint(matrix, func, row, True)
+
+            with self.subTest(seed = seed):
+                expected = solve_again(new_matrix, new_func, bounds = list(bounds) + [(0, None)])
+
+                try:
+                    method.add_constraint(row)
+                except InfeasibleTaskError:
+                    self.assertIsNone(expected)
+                    continue
+
+                self.assertEqual(method.p0(), expected)
+
+class TightenConstraintTest(unittest.TestCase):
+    def test_same_optimum_as_new_task(self):
+        for seed in range(30):
+            method, matrix, func = solved_task(seed)
+
+            if not method.last_table().first_statement():
+                continue
+
+            generator = random.Random(seed)
+            index = generator.randrange(len(matrix))
+            free_value = generator.randint(0, matrix[index][-1])
+
+            new_matrix = [row[:] for row in matrix]
+            new_matrix[index][-1] = free_value
+
+            with self.subTest(seed = seed):
+                method.tighten_constraint(index, free_value)
+
+                self.assertEqual(method.p0(), solve_again(new_matrix, list(func)))
+
+    def test_float_mode(self):
+        if reference_solve([[1, 1]], [1]) is None:
+            self.skipTest("scipy is not installed")
+
+        for seed in range(30):
+            method, matrix, func = solved_task(seed, fractional = False)
+
+            if not method.last_table().first_statement():
+                continue
+
+            new_matrix = [row[:] for row in matrix]
+            new_matrix[0][-1] = new_matrix[0][-1]/2
+
+            with self.subTest(seed = seed):
+                method.tighten_constraint(0, new_matrix[0][-1])
+                status, p0 = reference_solve(new_matrix, func)
+
+                self.assertEqual(status, "optimal")
+                self.assertAlmostEqual(method.p0(), p0, places = 6)
+
+if __name__ == "__main__":
+    unittest.main()
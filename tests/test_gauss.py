@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from fractions import Fraction
+from src.common.solver_stats import SolverStats
+from src.common.sparse_matrix import SparseMatrix
+from src.gauss.column_order import ColumnOrder
+from src.gauss.gauss import Gauss
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def random_matrix(seed, rows_number = 4, columns_number = 8, fractions = False):
+    generator = random.Random(seed)
+
+    def value():
+        numerator = generator.randint(-6, 6)
+        return Fraction(numerator, generator.randint(1, 5)) if fractions else numerator
+
+    return [[value() for _ in range(columns_number + 1)] for _ in range(rows_number)]
+
+def solve(matrix, fractional, sparse = False, point = None, stats = None):
+    gauss = Gauss(SparseMatrix.from_dense(matrix) if sparse else [row[:] for row in matrix], fractional = fractional, point = point, stats = stats)
+
+    return gauss, gauss.solve()
+
+class GaussTest(unittest.TestCase):
+    def check_solution(self, matrix, gauss, exact):
+        """Basis columns multiplied by free part and free member must give the other columns and free member of **matrix**"""
+        rows_number = len(matrix)
+        variables = gauss.variables()
+        basis = [int(name[1:]) - 1 for name in variables[:rows_number]]
+        non_basis = [int(name[1:]) - 1 for name in variables[rows_number:-1]]
+
+        free_part = gauss.free_part()
+
+        if isinstance(free_part, SparseMatrix):
+            free_part = free_part.to_dense()
+
+        columns = [(column, [row[k] for row in free_part]) for k, column in enumerate(non_basis)] + [(-1, gauss.free_member())]
+
+        for column, coefficients in columns:
+            for row in matrix:
+                value = sum(row[variable]*coefficient for variable, coefficient in zip(basis, coefficients))
+
+                if exact:
+                    self.assertEqual(value, row[column])
+                else:
+                    self.assertAlmostEqual(value, float(row[column]), places = 9)
+
+        self.assertEqual(sorted(basis + non_basis), list(range(len(matrix[0]) - 1)))
+
+class BareissTest(GaussTest):
+    def test_exact_solution(self):
+        for fractions in [False, True]:
+            for sparse in [False, True]:
+                for seed in range(30):
+                    matrix = random_matrix(seed, fractions = fractions)
+
+                    with self.subTest(seed = seed, fractions = fractions, sparse = sparse):
+                        gauss, is_solved = solve(matrix, True, sparse)
+
+                        self.assertTrue(is_solved)
+                        self.assertTrue(all(isinstance(value, Fraction) for value in gauss.free_member()))
+                        self.check_solution(matrix, gauss, True)
+
+    def test_singular_matrix(self):
+        gauss, is_solved = solve([[1, 2, 3], [2, 4, 6]], True)
+
+        self.assertFalse(is_solved)
+
+    def test_determinant_size(self):
+        stats = SolverStats()
+        solve([[1, 2, 5, -1, 4], [1, -1, -1, 2, 1]], True, stats = stats)
+
+        # определитель базиса [[1, 2], [1, -1]] равен -3
+        self.assertEqual(stats.to_dict()["values"]["gauss_determinant_bits"], 2)
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class LuTest(GaussTest):
+    def test_float_solution(self):
+        for sparse in [False, True]:
+            for seed in range(30):
+                matrix = random_matrix(seed)
+
+                with self.subTest(seed = seed, sparse = sparse):
+                    gauss, is_solved = solve(matrix, False, sparse)
+
+                    self.assertTrue(is_solved)
+                    self.check_solution(matrix, gauss, False)
+
+    def test_factors_of_basis(self):
+        for seed in range(30):
+            matrix = random_matrix(seed)
+            gauss, _ = solve(matrix, False)
+
+            basis = [int(name[1:]) - 1 for name in gauss.variables()[:len(matrix)]]
+            permutation, lower, upper = gauss.lu_factors()
+
+            with self.subTest(seed = seed):
+                # строки базисной матрицы, переставленные по **permutation**, равны L*U (единичная диагональ L не хранится)
+                product = (np.array(lower) + np.eye(len(matrix))) @ np.array(upper)
+                rows = np.array([[matrix[i][j] for j in basis] for i in permutation], dtype = np.float64)
+
+                self.assertTrue(np.allclose(product, rows))
+
+    def test_partial_pivoting(self):
+        matrix = [[1e-14, 1, 1], [1, 1, 2]]
+        gauss, is_solved = solve(matrix, False)
+
+        self.assertTrue(is_solved)
+        self.assertEqual(gauss.lu_factors()[0], [1, 0])
+
+        values = dict(zip(gauss.variables(), gauss.free_member()))
+
+        self.assertAlmostEqual(values["x1"], 1.0)
+        self.assertAlmostEqual(values["x2"], 1.0)
+
+    def test_sparse_matrix_is_not_factorized(self):
+        """Sparse matrix is eliminated by its rows, it is not expanded to dense array"""
+        gauss, is_solved = solve(random_matrix(0), False, sparse = True)
+
+        self.assertTrue(is_solved)
+        self.assertIsNone(gauss.lu_factors())
+        self.assertIsInstance(gauss.free_part(), SparseMatrix)
+
+    def test_singular_matrix(self):
+        gauss, is_solved = solve([[1, 2, 3], [2, 4, 6]], False)
+
+        self.assertFalse(is_solved)
+        self.assertIsNone(gauss.lu_factors())
+
+class ColumnOrderTest(GaussTest):
+    MODES = [(True, False), (True, True), (False, False), (False, True)]
+
+    def test_zero_columns_are_not_basis(self):
+        matrix = [[0, 1, 0, 2, 3], [0, 3, 0, 4, 5]]
+
+        for fractional, sparse in ColumnOrderTest.MODES:
+            with self.subTest(fractional = fractional, sparse = sparse):
+                gauss, is_solved = solve(matrix, fractional, sparse)
+
+                self.assertTrue(is_solved)
+                self.assertEqual(sorted(gauss.variables()[:2]), ["x2", "x4"])
+                self.check_solution(matrix, gauss, fractional)
+
+    def test_column_zeroed_by_elimination(self):
+        # после исключения x1 столбец x2 становится нулевым в оставшейся строке
+        matrix = [[1, 2, 0, 1], [2, 4, 1, 3]]
+
+        for fractional, sparse in ColumnOrderTest.MODES:
+            with self.subTest(fractional = fractional, sparse = sparse):
+                gauss, is_solved = solve(matrix, fractional, sparse)
+
+                self.assertTrue(is_solved)
+                self.assertEqual(gauss.variables(), ["x1", "x3", "x2", "b"])
+                self.check_solution(matrix, gauss, fractional)
+
+    def test_point_columns_go_first(self):
+        for fractional, sparse in ColumnOrderTest.MODES:
+            for seed in range(20):
+                matrix = random_matrix(seed)
+                point = [1 if j in (5, 1, 6, 3) else 0 for j in range(8)]
+
+                # вырожденный базис точки заменяется другими столбцами
+                if not solve([[row[j] for j in (1, 3, 5, 6)] + [row[-1]] for row in matrix], True)[1]:
+                    continue
+
+                with self.subTest(seed = seed, fractional = fractional, sparse = sparse):
+                    gauss, is_solved = solve(matrix, fractional, sparse, point = point)
+
+                    self.assertTrue(is_solved)
+                    self.assertEqual(gauss.variables()[:4], ["x2", "x4", "x6", "x7"])
+                    self.assertEqual(gauss.variables()[4:], ["x1", "x3", "x5", "x8", "b"])
+                    self.check_solution(matrix, gauss, fractional)
+
+    def test_moved_columns_stay_in_place(self):
+        """Zero column x6 that is already at the back is not moved again when x2 without pivot is moved after it"""
+        matrix = [[-1, -1, 3, 0, 3, 0, 9], [0, 0, 1, 1, 0, 0, 2]]
+
+        for fractional, sparse in ColumnOrderTest.MODES:
+            with self.subTest(fractional = fractional, sparse = sparse):
+                gauss, is_solved = solve(matrix, fractional, sparse)
+
+                self.assertTrue(is_solved)
+                self.assertEqual(gauss.variables(), ["x1", "x3", "x4", "x5", "x6", "x2", "b"])
+                self.check_solution(matrix, gauss, fractional)
+
+    def test_column_order(self):
+        """Columns read by logical index are the same as in plain list after random moves to the back"""
+        for seed in range(20):
+            generator = random.Random(seed)
+            columns = list(range(15))
+            generator.shuffle(columns)
+
+            order = ColumnOrder(columns, 15)
+
+            with self.subTest(seed = seed):
+                for _ in range(40):
+                    index = generator.randrange(len(columns))
+
+                    if generator.random() < 0.5:
+                        order.move_back(index)
+                    else:
+                        order.move_column_back(columns[index])
+
+                    columns.append(columns.pop(index))
+
+                    self.assertEqual(order.to_list(), columns)
+
+                    # чтение в произвольном порядке, как в обратном ходе и в проверке вырожденности
+                    for position in generator.sample(range(len(columns)), 5):
+                        self.assertEqual(order[position], columns[position])
+
+                self.assertTrue(all(order.is_moved(column) for column in columns[-1:]))
+
+if __name__ == "__main__":
+    unittest.main()
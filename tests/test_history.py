@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import unittest
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.history import TableHistory
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import create_method, random_task, snapshot
+
+POLICIES = [
+    (TableHistory.RING, 1, 0),
+    (TableHistory.RING, 3, 0),
+    (TableHistory.PIVOTS, 10, 0),
+    (TableHistory.PIVOTS, 10, 4),
+]
+
+def task(seed):
+    return random_task(seed, rows = 6, columns = 14)
+
+class TableHistoryTest(unittest.TestCase):
+    def test_rebuilt_tables_are_the_same(self):
+        for method in [SimplexMethod, ArtificialBasisMethod]:
+            for seed in range(10):
+                full = create_method(method, *task(seed), fractional = True)
+                full.auto_solve()
+                expected = [snapshot(full.get_table(index)) for index in range(full.tables_number())]
+
+                for policy, size, checkpoint in POLICIES:
+                    with self.subTest(method = method.__name__, seed = seed, policy = policy, size = size, checkpoint = checkpoint):
+                        history = TableHistory(policy, size, checkpoint)
+                        solver = create_method(method, *task(seed), fractional = True, history = history)
+                        solver.auto_solve()
+
+                        self.assertEqual(solver.p0(), full.p0())
+                        self.assertEqual(solver.tables_number(), full.tables_number())
+                        self.assertEqual([snapshot(solver.get_table(index)) for index in range(solver.tables_number())], expected)
+
+    def test_kept_tables(self):
+        for seed in range(10):
+            solver = create_method(SimplexMethod, *task(seed), fractional = True, history = TableHistory(TableHistory.RING, 3))
+            solver.auto_solve()
+
+            with self.subTest(seed = seed):
+                # первая таблица не получена поворотом и хранится всегда
+                self.assertLessEqual(solver.get_tables().kept_number(), 4)
+
+                solver = create_method(SimplexMethod, *task(seed), fractional = True, history = TableHistory(TableHistory.PIVOTS))
+                solver.auto_solve()
+
+                self.assertLessEqual(solver.get_tables().kept_number(), 2)
+
+    def test_back(self):
+        for seed in range(10):
+            full = create_method(SimplexMethod, *task(seed), fractional = True)
+            full.auto_solve()
+
+            if full.tables_number() < 3:
+                continue
+
+            solver = create_method(SimplexMethod, *task(seed), fractional = True, history = TableHistory(TableHistory.PIVOTS))
+            solver.auto_solve()
+
+            with self.subTest(seed = seed):
+                solver.back()
+                solver.back()
+
+                self.assertEqual(snapshot(solver.last_table()), snapshot(full.get_table(full.tables_number() - 3)))
+                self.assertTrue(solver.can_continue())
+
+                solver.next()
+                solver.next()
+
+                self.assertEqual(snapshot(solver.last_table()), snapshot(full.last_table()))
+
+    def test_changed_constraints(self):
+        for seed in range(10):
+            full = create_method(SimplexMethod, *task(seed), fractional = True)
+            full.auto_solve()
+
+            solver = create_method(SimplexMethod, *task(seed), fractional = True, history = TableHistory(TableHistory.PIVOTS))
+            solver.auto_solve()
+
+            if not full.last_table().first_statement():
+                continue
+
+            with self.subTest(seed = seed):
+                full.tighten_constraint(0, 1)
+                solver.tighten_constraint(0, 1)
+
+                self.assertEqual(solver.p0(), full.p0())
+                self.assertEqual([snapshot(solver.get_table(index)) for index in range(solver.tables_number())],
+                                 [snapshot(full.get_table(index)) for index in range(full.tables_number())])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import unittest
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import CASES, create_method, random_task
+
+class InPlaceTest(unittest.TestCase):
+    def test_same_result_as_new_tables(self):
+        for backend in ["list", "sparse", "integer"]:
+            for method in [SimplexMethod, ArtificialBasisMethod]:
+                for seed in range(20):
+                    matrix, func, point = random_task(seed)
+
+                    with self.subTest(backend = backend, method = method.__name__, seed = seed):
+                        tables = create_method(method, [row[:] for row in matrix], list(func), list(point), fractional = True, keep_history = True, backend = backend)
+                        tables.auto_solve()
+
+                        in_place = create_method(method, [row[:] for row in matrix], list(func), list(point), fractional = True, keep_history = False, backend = backend)
+                        in_place.auto_solve()
+
+                        self.assertEqual(in_place.p0(), tables.p0())
+                        self.assertEqual(in_place.solution(), tables.solution())
+                        self.assertEqual(in_place.current_iteration(), tables.current_iteration())
+                        self.assertEqual(in_place.last_table().value_table(), tables.last_table().value_table())
+                        self.assertEqual(in_place.last_table().row_variables(), tables.last_table().row_variables())
+
+    def test_only_last_table_is_kept(self):
+        for case in CASES:
+            if case.point is None:
+                continue
+
+            with self.subTest(case = case.name):
+                method = SimplexMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = True, point = list(case.point), keep_history = False)
+                method.auto_solve()
+
+                self.assertEqual(method.tables_number(), 1)
+                self.assertEqual(method.p0(), case.p0)
+
+                # назад вернуться нельзя, таблица не меняется
+                method.back()
+
+                self.assertEqual(method.tables_number(), 1)
+                self.assertEqual(method.p0(), case.p0)
+
+    def test_step_by_step(self):
+        case = CASES[1]
+
+        tables = SimplexMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = True, point = list(case.point))
+        in_place = SimplexMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = True, point = list(case.point), keep_history = False)
+
+        tables.next()
+        in_place.next()
+
+        while True:
+            self.assertEqual(in_place.last_table().value_table(), tables.last_table().value_table())
+
+            if not tables.can_continue():
+                break
+
+            tables.next()
+            in_place.next()
+
+        self.assertFalse(in_place.can_continue())
+
+if __name__ == "__main__":
+    unittest.main()
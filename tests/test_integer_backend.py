@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from fractions import Fraction
+from src.simplex.backends.integer_backend import IntegerBackend
+from src.simplex.backends.list_backend import ListBackend
+
+def random_rows(generator, rows_number, columns_number, fractions = False):
+    def value():
+        numerator = generator.randint(-9, 9)
+        return Fraction(numerator, generator.randint(1, 6)) if fractions else numerator
+
+    return [[value() for _ in range(columns_number)] for _ in range(rows_number)]
+
+def random_pivots(backend, generator, number):
+    """Makes **number** pivots at random nonzero elements (P row and free member column are never pivots)"""
+    for _ in range(number):
+        cells = [(i, j) for i in range(backend.row_number() - 1) for j in range(backend.column_number() - 1) if backend.value(i, j) != 0]
+
+        if not cells:
+            return
+
+        yield generator.choice(cells)
+
+class IntegerBackendTest(unittest.TestCase):
+    def test_same_tables_as_fractions(self):
+        for fractions in [False, True]:
+            for seed in range(30):
+                generator = random.Random(seed)
+                rows = random_rows(generator, 5, 7, fractions)
+
+                integer = IntegerBackend(rows)
+                exact = ListBackend(rows, fractional = True)
+
+                with self.subTest(seed = seed, fractions = fractions):
+                    for i, j in random_pivots(exact, generator, 8):
+                        integer.pivot(i, j)
+                        exact.pivot(i, j)
+
+                        self.assertEqual(integer.to_lists(), exact.to_lists())
+                        self.assertGreater(integer.denominator(), 0)
+
+    def test_denominator_is_basis_determinant(self):
+        # после поворотов без дробей знаменатель - модуль определителя базиса (с точностью до начального знаменателя)
+        rows = [[2, 1, 1, 0, 4], [1, 3, 0, 1, 5], [1, 1, 0, 0, 0]]
+        backend = IntegerBackend(rows)
+
+        backend.pivot(0, 0)
+        self.assertEqual(backend.denominator(), 2)
+
+        backend.pivot(1, 1)
+        self.assertEqual(backend.denominator(), 5)
+        self.assertEqual(backend.free_member(), [Fraction(7, 5), Fraction(6, 5)])
+
+    def test_copy_is_independent(self):
+        backend = IntegerBackend([[1, 2, 3], [4, 5, 6]])
+        copy = backend.copy()
+
+        copy.pivot(0, 0)
+
+        self.assertEqual(backend.to_lists(), [[1, 2, 3], [4, 5, 6]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import random
+import tempfile
+import unittest
+from fractions import Fraction
+from src.common.file_managment import dump_model_to_file, read_model_from_file
+from src.common.linear_program import EQUAL, LESS, LinearProgram, SENSES
+from src.common.lp_format import read_lp, write_lp
+from src.common.mps_format import read_mps, write_mps
+from src.exceptions.exceptions import InfeasibleTaskError, ModelFormatError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from tests.cases import linprog
+
+FORMATS = ["mps", "fixed_mps", "lp"]
+
+def random_program(seed):
+    """Returns random program with all kinds of rows and bounds, most of them are feasible.
+    Values are decimal fractions, so text formats keep them exactly"""
+    generator = random.Random(seed)
+    program = LinearProgram("model{}".format(seed), fractional = True)
+
+    program.set_maximize(generator.random() < 0.5)
+    program.set_objective_name("cost")
+    program.set_constant(Fraction(generator.randint(-5, 5)))
+    point = []
+
+    for j in range(generator.randint(2, 6)):
+        column = program.add_variable("x{}".format(j + 1))
+        program.set_cost(column, Fraction(generator.randint(-5, 5), generator.choice([1, 2, 4])))
+
+        kind = generator.choice(["default", "box", "free", "fixed", "negative", "upper"])
+        point.append(Fraction(generator.randint(0, 1)))
+
+        if kind == "box":
+            program.set_lower(column, Fraction(generator.randint(-3, 0)))
+            program.set_upper(column, Fraction(generator.randint(1, 6)))
+        elif kind == "free":
+            program.set_lower(column, None)
+        elif kind == "fixed":
+            program.set_lower(column, Fraction(1))
+            program.set_upper(column, Fraction(1))
+            point[-1] = Fraction(1)
+        elif kind == "negative":
+            program.set_lower(column, None)
+            program.set_upper(column, Fraction(0))
+            point[-1] = Fraction(-generator.randint(0, 1))
+        elif kind == "upper":
+            program.set_upper(column, Fraction(generator.randint(1, 4)))
+
+    for i in range(generator.randint(1, 4)):
+        sense = generator.choice(SENSES)
+        row = program.add_row("c{}".format(i + 1), sense)
+        activity = 0
+
+        for column in range(program.variables_number()):
+            if generator.random() < 0.6:
+                value = Fraction(generator.randint(-4, 6), generator.choice([1, 2, 5]))
+                program.set_coefficient(row, column, value)
+                activity += value*point[column]
+
+        # правая часть выбирается так, чтобы точка point была допустимой (кроме некоторых диапазонов)
+        if sense == EQUAL:
+            program.set_rhs(row, activity)
+        elif sense == LESS:
+            program.set_rhs(row, activity + generator.randint(0, 6))
+        else:
+            program.set_rhs(row, activity - generator.randint(0, 6))
+
+        if generator.random() < 0.3:
+            program.set_range(row, Fraction(generator.randint(1, 5)))
+
+    return program
+
+def describe(program):
+    """Returns contents of program that do not depend on order of variables (LP format writes them in order of appearance)"""
+    names = program.variable_names()
+
+    return (program.is_maximize(),
+            program.constant(),
+            {name: (cost, lower, upper) for name, cost, lower, upper in zip(names, program.costs(), program.lower(), program.upper())},
+            program.row_names(),
+            [{names[column]: value for column, value in row.items()} for row in program.rows()],
+            [program.row_bounds(row) for row in range(program.rows_number())])
+
+def write(program, model_format):
+    file = io.StringIO()
+
+    if model_format == "lp":
+        write_lp(file, program)
+    else:
+        write_mps(file, program, fixed = model_format == "fixed_mps")
+
+    return file.getvalue()
+
+def read(text, model_format, fractional = True):
+    if model_format == "lp":
+        return read_lp(io.StringIO(text), fractional)
+
+    return read_mps(io.StringIO(text), fractional, fixed = model_format == "fixed_mps")
+
+def solve(program):
+    """Returns **(status, objective, solution)** of program solved by artificial basis method"""
+    standard_form, matrix, func, bounds = program.to_task()
+    method = ArtificialBasisMethod(matrix = matrix, func = func, fractional = program.is_fractional(), bounds = bounds)
+
+    try:
+        method.auto_solve()
+    except InfeasibleTaskError:
+        return "infeasible", None, None
+
+    if not method.simplex_method().last_table().first_statement():
+        return "unbounded", None, None
+
+    return "optimal", standard_form.objective(method.p0()), standard_form.restore(method.solution())
+
+def reference_solve(program):
+    """Returns **(status, objective)** of program found by scipy"""
+    sign = -1 if program.is_maximize() else 1
+    costs = [sign*float(cost) for cost in program.costs()]
+    upper_rows, upper_values, equal_rows, equal_values = [], [], [], []
+
+    for index, row in enumerate(program.rows()):
+        values = [float(row.get(column, 0)) for column in range(program.variables_number())]
+        lower, upper = program.row_bounds(index)
+
+        if lower is not None and lower == upper:
+            equal_rows.append(values)
+            equal_values.append(float(lower))
+            continue
+
+        if upper is not None:
+            upper_rows.append(values)
+            upper_values.append(float(upper))
+
+        if lower is not None:
+            upper_rows.append([-value for value in values])
+            upper_values.append(-float(lower))
+
+    result = linprog(costs,
+                     A_ub = upper_rows or None, b_ub = upper_values or None,
+                     A_eq = equal_rows or None, b_eq = equal_values or None,
+                     bounds = [(None if lower is None else float(lower), None if upper is None else float(upper)) for lower, upper in zip(program.lower(), program.upper())],
+                     method = "highs")
+
+    if result.status == 0:
+        return "optimal", sign*result.fun + float(program.constant())
+
+    return {2: "infeasible", 3: "unbounded"}.get(result.status, "error"), None
+
+class ModelFilesTest(unittest.TestCase):
+    def test_round_trip(self):
+        for model_format in FORMATS:
+            for seed in range(30):
+                program = random_program(seed)
+
+                with self.subTest(model_format = model_format, seed = seed):
+                    read_program = read(write(program, model_format), model_format)
+
+                    self.assertEqual(describe(read_program), describe(program))
+
+                    if model_format != "lp":
+                        self.assertEqual(read_program.name(), program.name())
+
+    def test_float_mode(self):
+        for model_format in FORMATS:
+            program = random_program(0)
+            read_program = read(write(program, model_format), model_format, fractional = False)
+
+            with self.subTest(model_format = model_format):
+                self.assertFalse(read_program.is_fractional())
+                self.assertTrue(all(isinstance(cost, float) for cost in read_program.costs()))
+
+    def test_solution_of_read_program(self):
+        for seed in range(30):
+            program = random_program(seed)
+            expected = solve(program)
+
+            for model_format in FORMATS:
+                with self.subTest(seed = seed, model_format = model_format):
+                    self.assertEqual(solve(read(write(program, model_format), model_format))[:2], expected[:2])
+
+    def test_optimum_as_reference(self):
+        if linprog is None:
+            self.skipTest("scipy is not installed")
+
+        for seed in range(30):
+            program = random_program(seed)
+
+            with self.subTest(seed = seed):
+                status, objective, solution = solve(program)
+                reference_status, reference_objective = reference_solve(program)
+
+                self.assertEqual(status, reference_status)
+
+                if status == "optimal":
+                    self.assertAlmostEqual(float(objective), reference_objective, places = 6)
+
+                    costs = program.costs()
+                    self.assertEqual(sum(cost*value for cost, value in zip(costs, solution)) + program.constant(), objective)
+
+    def test_compressed_files(self):
+        program = random_program(1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ["model.mps.gz", "model.lp.gz"]:
+                with self.subTest(name = name):
+                    path = os.path.join(directory, name)
+                    dump_model_to_file(path, program)
+
+                    self.assertEqual(describe(read_model_from_file(path, fractional = True)), describe(program))
+
+    def test_format_errors(self):
+        files = {
+            "mps": "NAME test\nROWS\n N cost\n X c1\nENDATA\n",
+            "lp": "x + y\nMinimize\n obj: x + y\nSubject To\n c1: x >= 1\nEnd\n",
+        }
+
+        for model_format, text in files.items():
+            with self.subTest(model_format = model_format):
+                with self.assertRaises(ModelFormatError) as context:
+                    read(text, model_format)
+
+                self.assertIn("строке", context.exception.message)
+
+if __name__ == "__main__":
+    unittest.main()
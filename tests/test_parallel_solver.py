@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import unittest
+from src.simplex.parallel_solver import ParallelSolver, SharedMatrix, SolverResult, SolverTask, solve_task
+from tests.cases import CASES, INFEASIBLE_CASE, UNBOUNDED_CASE, random_task
+
+def random_tasks(number, fractional = False):
+    tasks = []
+
+    for seed in range(number):
+        matrix, func, point = random_task(seed)
+        tasks.append(SolverTask(matrix, func, method = SolverTask.SIMPLEX, fractional = fractional, point = point))
+
+    return tasks
+
+class SharedMatrixTest(unittest.TestCase):
+    def test_read_written_matrix(self):
+        matrix, _, _ = random_task(0)
+
+        for integer in [False, True]:
+            shared = SharedMatrix(matrix, integer = integer)
+
+            try:
+                with self.subTest(integer = integer):
+                    self.assertEqual(SharedMatrix.read(shared.descriptor()), matrix)
+            finally:
+                shared.release()
+
+    def test_only_integer_fractional_matrix_is_shared(self):
+        self.assertTrue(SharedMatrix.can_share([[1, 2, 3]], True))
+        self.assertFalse(SharedMatrix.can_share([[0.5, 2, 3]], True))
+        self.assertTrue(SharedMatrix.can_share([[0.5, 2, 3]], False))
+
+class ParallelSolverTest(unittest.TestCase):
+    def check_same_as_sequential(self, tasks, solver):
+        results = {result.index: result for result in solver.solve(tasks)}
+
+        self.assertEqual(sorted(results), list(range(len(tasks))))
+
+        for index, task in enumerate(tasks):
+            expected = solve_task(index, task)
+
+            with self.subTest(index = index):
+                self.assertEqual(results[index].status, expected.status)
+                self.assertEqual(results[index].error, expected.error)
+                self.assertEqual(results[index].p0, expected.p0)
+                self.assertEqual(results[index].basis, expected.basis)
+
+    def test_same_results_as_sequential(self):
+        for fractional in [False, True]:
+            with self.subTest(fractional = fractional):
+                self.check_same_as_sequential(random_tasks(12, fractional), ParallelSolver(max_workers = 2))
+
+    def test_shared_memory(self):
+        tasks = random_tasks(6, fractional = True)
+        matrix = tasks[0].matrix
+
+        # задачи с одной матрицей читают её из одного блока общей памяти
+        for task in tasks:
+            task.matrix = matrix
+
+        self.check_same_as_sequential(tasks, ParallelSolver(max_workers = 2, shared_memory_min_size = 0))
+
+    def test_known_optima_and_statuses(self):
+        tasks = [SolverTask(case.copy_matrix(), case.copy_func(), fractional = True) for case in CASES]
+        tasks.append(SolverTask(INFEASIBLE_CASE.copy_matrix(), INFEASIBLE_CASE.copy_func()))
+        tasks.append(SolverTask(UNBOUNDED_CASE.copy_matrix(), UNBOUNDED_CASE.copy_func()))
+        tasks.append(SolverTask(UNBOUNDED_CASE.copy_matrix(), UNBOUNDED_CASE.copy_func(), method = SolverTask.SIMPLEX, point = [0, 1, 0]))
+
+        results = {result.index: result for result in ParallelSolver(max_workers = 2).solve(tasks)}
+
+        for index, case in enumerate(CASES):
+            with self.subTest(case = case.name):
+                self.assertEqual(results[index].status, SolverResult.OPTIMAL)
+                self.assertIsNone(results[index].error)
+                self.assertEqual(results[index].p0, case.p0)
+                self.assertEqual(results[index].solution, case.solution)
+
+        infeasible, unbounded, failed = results[len(CASES)], results[len(CASES) + 1], results[len(CASES) + 2]
+
+        self.assertEqual(infeasible.status, SolverResult.INFEASIBLE)
+        self.assertIsNotNone(infeasible.error)
+        self.assertIsNone(infeasible.p0)
+
+        self.assertEqual(unbounded.status, SolverResult.UNBOUNDED)
+        self.assertIsNone(unbounded.error)
+        self.assertIsNone(unbounded.p0)
+        self.assertIsNone(unbounded.solution)
+
+        # базисное решение x2 = -1 недопустимо
+        self.assertEqual(failed.status, SolverResult.ERROR)
+        self.assertIsNotNone(failed.error)
+
+if __name__ == "__main__":
+    unittest.main()
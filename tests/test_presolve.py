@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from fractions import Fraction
+from src.exceptions.exceptions import BasisError, InfeasibleTaskError, PresolveError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.presolve import Presolve, SINGLETON_ROWS, DUPLICATE_ROWS, EMPTY_COLUMNS, DOMINATED_COLUMNS
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import random_task, reference_solve
+
+def redundant_task(seed):
+    """Returns random task with reductions for presolve: duplicate row (the last but one), singleton row, empty and dominated columns"""
+    generator = random.Random(seed)
+    matrix, func, _ = random_task(seed)
+
+    # пустой столбец с положительной стоимостью и столбец, кратный первому, с большей стоимостью
+    matrix = [row[:-1] + [0, 2*row[0], row[-1]] for row in matrix]
+    func = func + [generator.randint(1, 5), 2*func[0] + generator.randint(0, 3)]
+
+    multiplier = generator.randint(2, 3)
+    matrix.append([multiplier*value for value in matrix[0]])
+
+    singleton = [0 for _ in range(len(func))] + [generator.randint(0, 3)]
+    singleton[1] = 1
+    matrix.append(singleton)
+
+    return matrix, func
+
+def residuals(matrix, solution):
+    return [sum(value*x for value, x in zip(row[:-1], solution)) - row[-1] for row in matrix]
+
+def solve(matrix, func, fractional, presolve):
+    method = ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = fractional, presolve = presolve)
+
+    try:
+        method.auto_solve()
+    except InfeasibleTaskError:
+        return method, "infeasible"
+
+    return method, "optimal" if method.simplex_method().last_table().first_statement() else "unbounded"
+
+class PresolveTest(unittest.TestCase):
+    def test_reductions(self):
+        matrix, func = redundant_task(0)
+        presolve = Presolve(matrix, func, fractional = True)
+        presolve.reduce()
+
+        reductions = presolve.reductions()
+
+        self.assertGreaterEqual(reductions[SINGLETON_ROWS], 1)
+        self.assertGreaterEqual(reductions[DUPLICATE_ROWS], 1)
+        self.assertGreaterEqual(reductions[EMPTY_COLUMNS] + reductions[DOMINATED_COLUMNS], 2)
+        self.assertLess(presolve.report()["rows"][1], len(matrix))
+
+    def test_same_optimum_as_full_task(self):
+        for fractional in [False, True]:
+            for seed in range(30):
+                matrix, func = redundant_task(seed)
+
+                with self.subTest(seed = seed, fractional = fractional):
+                    # без предварительной обработки строки матрицы должны быть независимы
+                    full, status = solve(matrix[:-2] + matrix[-1:], func, True, False)
+                    reduced, reduced_status = solve(matrix, func, fractional, True)
+
+                    self.assertEqual(reduced_status, status)
+
+                    if status != "optimal":
+                        continue
+
+                    solution = reduced.solution()
+
+                    if fractional:
+                        self.assertEqual(reduced.p0(), full.p0())
+                        self.assertTrue(all(value == 0 for value in residuals(matrix, solution)))
+                    else:
+                        self.assertAlmostEqual(reduced.p0(), float(full.p0()), places = 6)
+                        self.assertTrue(all(abs(value) < 1e-6 for value in residuals(matrix, solution)))
+
+                    self.assertTrue(all(value >= -1e-9 for value in solution))
+
+    def test_optimum_as_reference(self):
+        if reference_solve([[1, 1]], [1]) is None:
+            self.skipTest("scipy is not installed")
+
+        for seed in range(30):
+            matrix, func = redundant_task(seed)
+            status, p0 = reference_solve(matrix, func)
+
+            with self.subTest(seed = seed):
+                method, method_status = solve(matrix, func, False, True)
+
+                self.assertEqual(method_status, status)
+
+                if status == "optimal":
+                    self.assertAlmostEqual(method.p0(), p0, places = 6)
+
+    def test_fractional_values_stay_exact(self):
+        # фиксация по строке-синглтону 3*x1 = 1 должна давать дробь, а не float
+        method = ArtificialBasisMethod(matrix = [[3, 0, 0, 1], [1, 1, 1, 2]], func = [0, 1, -1], fractional = True, presolve = True)
+        method.auto_solve()
+
+        self.assertEqual(method.p0(), Fraction(-5, 3))
+        self.assertEqual(method.solution(), [Fraction(1, 3), 0, Fraction(5, 3)])
+        self.assertTrue(all(isinstance(value, (int, Fraction)) for value in method.solution()))
+
+    def test_constraints_of_reduced_task_are_not_changed(self):
+        matrix = [[1, 3, 4, 0, 1, 1, 0, 1], [1, 4, 6, 4, 0, 0, 1, 2]]
+        method = SimplexMethod(matrix = matrix, func = [-4, -3, 2, 2, 1, 0, 0], fractional = True, point = [0, 0, 0, 0, 0, 1, 1], presolve = True)
+        method.auto_solve()
+
+        with self.assertRaises(PresolveError):
+            method.add_constraint([4, 4, -2, 3, -2, 3, 4, 4])
+
+        with self.assertRaises(PresolveError):
+            method.tighten_constraint(0, 0)
+
+    def test_warm_start_with_other_reductions(self):
+        matrix = [[0, 1, 6, 1, 0, 9], [2, 2, 3, 0, 1, 2]]
+        func = [2, -2, -2, -2, 1]
+
+        warm_start = ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = [3, -2, -1, 0, 0], fractional = True, presolve = True)
+        warm_start.auto_solve()
+
+        with self.assertRaises(BasisError):
+            SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, presolve = True, warm_start = warm_start).auto_solve()
+
+        # метод искусственного базиса решает задачу заново
+        method = ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, presolve = True, warm_start = warm_start)
+        method.auto_solve()
+
+        self.assertEqual(method.p0(), -18)
+        self.assertEqual(residuals(matrix, method.solution()), [0, 0])
+
+    def test_point_columns_are_not_fixed(self):
+        matrix = [[1, 0, -2, 3, 4, 1, 0, 10], [2, 3, -1, 2, 3, 0, 1, 10]]
+        func = [-1, -1, -1, -1, -1, -1, 0]
+        point = [0, 0, 0, 0, 0, 1, 1]
+
+        expected = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+        expected.auto_solve()
+
+        method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point), presolve = True)
+        method.auto_solve()
+
+        self.assertEqual(method.p0(), expected.p0())
+        self.assertEqual(method.p0(), Fraction(-40, 3))
+
+if __name__ == "__main__":
+    unittest.main()
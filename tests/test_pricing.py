@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import unittest
+from src.exceptions.exceptions import PricingError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.backends.numpy_backend import NumpyBackend
+from src.simplex.pricing import PRICING_RULES, DevexPricing, PricingRule, create_pricing
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import CASES, random_task
+
+BACKENDS = [(False, "list"), (False, "sparse"), (True, "list"), (True, "integer")] + ([(False, "numpy")] if NumpyBackend.is_available() else [])
+
+class PricingTest(unittest.TestCase):
+    def test_unknown_rule(self):
+        with self.assertRaises(PricingError):
+            create_pricing("largest_increase")
+
+    def test_rules_with_weights_are_copied(self):
+        pricing = DevexPricing()
+
+        self.assertIsNot(create_pricing(pricing), pricing)
+        self.assertIsInstance(create_pricing(pricing), DevexPricing)
+
+    def test_known_optima(self):
+        for pricing in sorted(PRICING_RULES):
+            for fractional, backend in BACKENDS:
+                for case in CASES:
+                    with self.subTest(pricing = pricing, fractional = fractional, backend = backend, case = case.name):
+                        method = ArtificialBasisMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = fractional, backend = backend, pricing = pricing)
+                        method.auto_solve()
+
+                        self.assertEqual(method.pricing_rule(), pricing)
+
+                        if fractional:
+                            self.assertEqual(method.p0(), case.p0)
+                        else:
+                            self.assertAlmostEqual(method.p0(), float(case.p0))
+
+    def test_same_optimum_as_dantzig(self):
+        for seed in range(20):
+            matrix, func, point = random_task(seed, rows = 6, columns = 14)
+
+            dantzig = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+            dantzig.auto_solve()
+
+            for pricing in sorted(PRICING_RULES):
+                for fractional, backend in BACKENDS:
+                    with self.subTest(seed = seed, pricing = pricing, fractional = fractional, backend = backend):
+                        method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = fractional, point = list(point), backend = backend, pricing = pricing)
+                        method.auto_solve()
+
+                        self.assertEqual(method.last_table().first_statement(), dantzig.last_table().first_statement())
+
+                        if not dantzig.last_table().first_statement():
+                            continue
+
+                        if fractional:
+                            self.assertEqual(method.p0(), dantzig.p0())
+                        else:
+                            self.assertAlmostEqual(method.p0(), float(dantzig.p0()))
+
+    def test_base_rule_is_dantzig(self):
+        """Base rule tries columns from the most negative value of P vector, so it makes the same pivots as Dantzig's rule"""
+        for seed in range(20):
+            matrix, func, point = random_task(seed, rows = 6, columns = 14)
+
+            dantzig = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+            dantzig.auto_solve()
+
+            method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point), pricing = PricingRule())
+            method.auto_solve()
+
+            with self.subTest(seed = seed):
+                self.assertEqual(method.tables_number(), dantzig.tables_number())
+                self.assertEqual(method.last_table().p0(), dantzig.last_table().p0())
+
+if __name__ == "__main__":
+    unittest.main()
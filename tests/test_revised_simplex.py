@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from src.common.sparse_matrix import SparseMatrix
+from src.simplex.revised_simplex.revised_simplex_method import RevisedSimplexMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import CASES, UNBOUNDED_CASE, random_task
+
+class RevisedSimplexTest(unittest.TestCase):
+    def test_known_optima(self):
+        for fractional in [False, True]:
+            for case in CASES:
+                if case.point is None:
+                    continue
+
+                with self.subTest(case = case.name, fractional = fractional):
+                    method = RevisedSimplexMethod(matrix = case.copy_matrix(), func = case.copy_func(), fractional = fractional, point = list(case.point))
+                    method.auto_solve()
+
+                    if fractional:
+                        self.assertEqual(method.p0(), case.p0)
+                        self.assertEqual(method.solution(), case.solution)
+                    else:
+                        self.assertAlmostEqual(method.p0(), float(case.p0))
+
+    def test_same_optimum_as_tableau_method(self):
+        for seed in range(30):
+            matrix, func, point = random_task(seed)
+
+            simplex_method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+            simplex_method.auto_solve()
+
+            for sparse in [False, True]:
+                with self.subTest(seed = seed, sparse = sparse):
+                    task = SparseMatrix.from_dense(matrix) if sparse else [row[:] for row in matrix]
+                    method = RevisedSimplexMethod(matrix = task, func = list(func), fractional = True, point = list(point), refactor_frequency = 3)
+                    method.auto_solve()
+
+                    self.assertEqual(method.is_unlimited(), not simplex_method.last_table().first_statement())
+
+                    if not method.is_unlimited():
+                        self.assertEqual(method.p0(), simplex_method.p0())
+
+    def test_unbounded_task(self):
+        method = RevisedSimplexMethod(matrix = UNBOUNDED_CASE.copy_matrix(), func = UNBOUNDED_CASE.copy_func(), point = list(UNBOUNDED_CASE.point))
+        method.auto_solve()
+
+        self.assertTrue(method.is_unlimited())
+
+    def test_float_noise_is_ignored(self):
+        """Values about 1e-11 must not be taken as pivot elements or improving columns"""
+        generator = random.Random(0)
+
+        for seed in range(20):
+            matrix, func, point = random_task(seed)
+
+            exact = RevisedSimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+            exact.auto_solve()
+
+            noisy_matrix = [[value + generator.random()*1e-11 if index < len(row) - 1 else value for index, value in enumerate(row)] for row in matrix]
+            method = RevisedSimplexMethod(matrix = noisy_matrix, func = list(func), point = list(point))
+            method.auto_solve()
+
+            with self.subTest(seed = seed):
+                self.assertEqual(method.is_unlimited(), exact.is_unlimited())
+
+                if not exact.is_unlimited():
+                    self.assertAlmostEqual(method.p0(), float(exact.p0()), places = 6)
+
+if __name__ == "__main__":
+    unittest.main()
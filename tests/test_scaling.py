@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import math
+import random
+import unittest
+from src.exceptions.exceptions import ScalingError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.scaling import SCALING_METHODS, Scaling
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import random_task, reference_solve
+
+def badly_scaled_task(seed):
+    """Returns random task with rows and structural columns multiplied by powers of 10 (the same task in other units)"""
+    generator = random.Random(seed)
+    matrix, func, point = random_task(seed)
+
+    row_factors = [10**generator.randint(-3, 3) for _ in matrix]
+    column_factors = [10**generator.randint(-3, 3) for _ in range(8)] + [1, 1, 1, 1]
+
+    matrix = [[value*row_factor*(column_factors[j] if j < len(column_factors) else 1) for j, value in enumerate(row)] for row, row_factor in zip(matrix, row_factors)]
+    func = [cost*factor for cost, factor in zip(func, column_factors)]
+
+    return matrix, func, point
+
+class ScalingTest(unittest.TestCase):
+    def test_unknown_method(self):
+        with self.assertRaises(ScalingError):
+            Scaling("largest")
+
+    def test_factors_are_powers_of_two(self):
+        for method in SCALING_METHODS:
+            for seed in range(10):
+                matrix, func, _ = badly_scaled_task(seed)
+                scaling = Scaling(method)
+                scaling.scale(matrix, func)
+
+                with self.subTest(method = method, seed = seed):
+                    for factor in scaling.row_factors() + scaling.column_factors():
+                        self.assertEqual(math.log2(factor), round(math.log2(factor)))
+
+                    before, after = scaling.report()["spread"]
+                    self.assertLess(after, before)
+
+    def test_same_optimum_as_unscaled(self):
+        for method in SCALING_METHODS:
+            for seed in range(30):
+                matrix, func, point = badly_scaled_task(seed)
+
+                exact = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+                exact.auto_solve()
+
+                with self.subTest(method = method, seed = seed):
+                    scaled = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), point = list(point), scaling = method)
+                    scaled.auto_solve()
+
+                    self.assertEqual(scaled.last_table().first_statement(), exact.last_table().first_statement())
+
+                    if not exact.last_table().first_statement():
+                        continue
+
+                    self.assertTrue(math.isclose(scaled.p0(), float(exact.p0()), rel_tol = 1e-9, abs_tol = 1e-9))
+
+                    # оптимальных точек может быть несколько, поэтому решение проверяется подстановкой
+                    solution = scaled.solution()
+
+                    for row in matrix:
+                        self.assertTrue(math.isclose(sum(value*x for value, x in zip(row[:-1], solution)), row[-1], rel_tol = 1e-7, abs_tol = 1e-7))
+
+                    self.assertTrue(math.isclose(sum(cost*x for cost, x in zip(func, solution)), scaled.p0(), rel_tol = 1e-9, abs_tol = 1e-9))
+
+    def test_bounds_and_reference(self):
+        if reference_solve([[1, 1]], [1]) is None:
+            self.skipTest("scipy is not installed")
+
+        for seed in range(30):
+            matrix, func, _ = badly_scaled_task(seed)
+            bounds = [(0, 10) for _ in range(8)] + [(0, None) for _ in range(4)]
+            status, p0 = reference_solve(matrix, func, bounds)
+
+            with self.subTest(seed = seed):
+                method = ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = list(func), bounds = list(bounds), scaling = True)
+                method.auto_solve()
+
+                self.assertEqual(status, "optimal")
+                self.assertTrue(math.isclose(method.p0(), p0, rel_tol = 1e-7, abs_tol = 1e-7))
+
+    def test_exact_mode_is_not_scaled(self):
+        matrix, func, point = badly_scaled_task(0)
+        method = SimplexMethod(matrix = matrix, func = func, fractional = True, point = point, scaling = True)
+        method.auto_solve()
+
+        self.assertIsNone(method.scaling())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import unittest
+from fractions import Fraction
+from src.common.sparse_matrix import SparseMatrix, prepare_storage
+from src.gauss.gauss import Gauss
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import CASES, random_task, sparse_task, reference_solve
+
+class SparseMatrixTest(unittest.TestCase):
+    def test_dense_round_trip(self):
+        for case in CASES:
+            with self.subTest(case = case.name):
+                sparse = SparseMatrix.from_dense(case.matrix)
+
+                self.assertEqual(sparse.to_dense(), case.matrix)
+                self.assertEqual(sparse.nonzeros(), sum(1 for row in case.matrix for value in row if value != 0))
+
+    def test_zero_values_are_not_stored(self):
+        sparse = SparseMatrix.from_dense([[1, 0, 2], [0, 3, 0]])
+
+        sparse.set_value(0, 0, 0)
+        sparse.append_column([0, 4])
+
+        self.assertEqual(sparse.rows(), [{2: 2}, {1: 3, 3: 4}])
+        self.assertEqual(sparse.column(3), {1: 4})
+        self.assertEqual(sparse.to_dense(), [[0, 0, 2, 0], [0, 3, 0, 4]])
+
+    def test_storage_is_chosen_by_density(self):
+        matrix, _, _ = random_task(0)
+        self.assertIsInstance(prepare_storage(matrix), list)
+
+        matrix, _, _ = sparse_task(0)
+        self.assertIsInstance(prepare_storage(matrix), SparseMatrix)
+        self.assertIsInstance(prepare_storage(matrix, sparse = False), list)
+
+class SparseGaussTest(unittest.TestCase):
+    def test_same_basis_as_dense(self):
+        for seed in range(5):
+            matrix, _, _ = sparse_task(seed)
+
+            with self.subTest(seed = seed):
+                dense = Gauss([row[:] for row in matrix], fractional = True)
+                sparse = Gauss(SparseMatrix.from_dense(matrix), fractional = True)
+
+                self.assertTrue(dense.solve())
+                self.assertTrue(sparse.solve())
+                self.assertEqual(sparse.variables(), dense.variables())
+                self.assertEqual(sparse.free_member(), dense.free_member())
+
+class SparseSimplexTest(unittest.TestCase):
+    def test_same_optimum_as_dense(self):
+        for seed in range(5):
+            matrix, func, point = sparse_task(seed)
+
+            with self.subTest(seed = seed):
+                dense = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point), backend = "list")
+                dense.auto_solve()
+
+                sparse = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+                sparse.auto_solve()
+
+                self.assertIsInstance(sparse.matrix(), SparseMatrix)
+                self.assertEqual(sparse.p0(), dense.p0())
+                self.assertIsInstance(sparse.p0(), Fraction)
+
+    def test_optimum_as_reference(self):
+        if reference_solve([[1, 1]], [1]) is None:
+            self.skipTest("scipy is not installed")
+
+        for seed in range(5):
+            matrix, func, _ = sparse_task(seed)
+            status, p0 = reference_solve(matrix, func)
+
+            with self.subTest(seed = seed):
+                method = ArtificialBasisMethod(matrix = SparseMatrix.from_dense(matrix), func = list(func))
+                method.auto_solve()
+
+                self.assertEqual(status, "optimal")
+                self.assertAlmostEqual(method.p0(), p0, places = 6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import unittest
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.revised_simplex.revised_simplex_method import RevisedSimplexMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import CASES
+
+BEALE_CASE = [case for case in CASES if case.name == "beale"][0]
+
+class StallingTest(unittest.TestCase):
+    def test_cycling_is_broken(self):
+        for backend in ["list", "sparse", "integer"]:
+            for stalling_limit in [1, 50, 10**9]:
+                with self.subTest(backend = backend, stalling_limit = stalling_limit):
+                    method = SimplexMethod(matrix = BEALE_CASE.copy_matrix(), func = BEALE_CASE.copy_func(), fractional = True, point = list(BEALE_CASE.point), backend = backend, stalling_limit = stalling_limit)
+                    method.auto_solve()
+
+                    # повтор базиса замечается и без длинной серии вырожденных итераций
+                    self.assertEqual(method.stalling().switches_number(), 1)
+                    self.assertEqual(method.p0(), BEALE_CASE.p0)
+                    self.assertEqual(method.solution(), BEALE_CASE.solution)
+
+    def test_original_rule_is_restored(self):
+        method = SimplexMethod(matrix = BEALE_CASE.copy_matrix(), func = BEALE_CASE.copy_func(), fractional = True, point = list(BEALE_CASE.point), pricing = "devex")
+        method.auto_solve()
+
+        self.assertEqual(method.p0(), BEALE_CASE.p0)
+        self.assertFalse(method.stalling().is_active())
+        self.assertEqual(method.pricing_rule(), "devex")
+
+    def test_artificial_basis_method(self):
+        method = ArtificialBasisMethod(matrix = BEALE_CASE.copy_matrix(), func = BEALE_CASE.copy_func(), fractional = True)
+        method.auto_solve()
+
+        self.assertEqual(method.p0(), BEALE_CASE.p0)
+
+    def test_revised_simplex_method(self):
+        for stalling_limit in [1, 50, 10**9]:
+            with self.subTest(stalling_limit = stalling_limit):
+                method = RevisedSimplexMethod(matrix = BEALE_CASE.copy_matrix(), func = BEALE_CASE.copy_func(), fractional = True, point = list(BEALE_CASE.point), stalling_limit = stalling_limit)
+                method.auto_solve()
+
+                self.assertEqual(method.p0(), BEALE_CASE.p0)
+                self.assertEqual(method.solution(), BEALE_CASE.solution)
+
+if __name__ == "__main__":
+    unittest.main()
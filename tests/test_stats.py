@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import tempfile
+import unittest
+from src.common.solver_stats import SolverStats
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.history import TableHistory
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import create_method, random_task
+
+HISTORIES = [
+    ("full", True, None),
+    ("in place", False, None),
+    ("ring", True, TableHistory(TableHistory.RING, 2)),
+    ("pivots", True, TableHistory(TableHistory.PIVOTS)),
+]
+
+def solve(method, seed, stats, keep_history = True, history = None):
+    matrix, func, point = random_task(seed, rows = 6, columns = 14)
+
+    solver = create_method(method, matrix, func, point, fractional = True, stats = stats, keep_history = keep_history, history = history)
+    solver.auto_solve()
+
+    return solver
+
+class SolverStatsTest(unittest.TestCase):
+    def test_phases_and_counters(self):
+        for seed in range(10):
+            with self.subTest(seed = seed):
+                stats = SolverStats()
+                solver = solve(SimplexMethod, seed, stats)
+
+                self.assertEqual(sorted(stats.times()), ["gauss", "main"])
+                self.assertEqual(stats.counters()["pivots"], solver.current_iteration())
+                self.assertEqual(stats.values()["main_iterations"], solver.current_iteration())
+
+                stats = SolverStats()
+                solve(ArtificialBasisMethod, seed, stats)
+                values = stats.values()
+
+                self.assertEqual(sorted(stats.times()), ["artificial", "gauss", "main"])
+                self.assertEqual(stats.counters()["pivots"], values["artificial_iterations"] + values["main_iterations"])
+                self.assertGreater(stats.numerator_bits(), 0)
+
+    def test_counters_do_not_depend_on_history(self):
+        for method in [SimplexMethod, ArtificialBasisMethod]:
+            for seed in range(10):
+                expected = SolverStats()
+                solve(method, seed, expected)
+
+                for name, keep_history, history in HISTORIES:
+                    with self.subTest(method = method.__name__, seed = seed, history = name):
+                        stats = SolverStats()
+                        solver = solve(method, seed, stats, keep_history, history.empty_copy() if history is not None else None)
+
+                        self.assertEqual(stats.counters(), expected.counters())
+
+                        # таблицы, восстановленные историей для просмотра, не считаются повторно
+                        for index in range(solver.tables_number()):
+                            solver.get_table(index)
+
+                        self.assertEqual(stats.counters(), expected.counters())
+
+    def test_saved_report(self):
+        stats = SolverStats()
+        solve(ArtificialBasisMethod, 0, stats)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stats.json")
+            stats.save(path)
+
+            with open(path) as file:
+                report = json.load(file)
+
+        self.assertEqual(report["counters"], stats.counters())
+        self.assertEqual(report["values"], stats.values())
+        self.assertEqual(sorted(report["times"]), sorted(stats.times()))
+
+if __name__ == "__main__":
+    unittest.main()
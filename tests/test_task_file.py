@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import unittest
+from src.common.file_managment import load_task_from_file
+from src.common.task_file import dump_task, load_task
+from src.exceptions.exceptions import TaskFileError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.history import TableHistory
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import create_method, random_task, snapshot
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "simplex")
+
+def task(seed, fractional = True):
+    """Returns random task, its values are floats if it is not **fractional**"""
+    matrix, func, point = random_task(seed)
+
+    if not fractional:
+        matrix = [[float(value) for value in row] for row in matrix]
+        func = [float(value) for value in func]
+
+    return matrix, func, point
+
+class TaskFileTest(unittest.TestCase):
+    def assert_same_task(self, task, method):
+        self.assertEqual(task.method_name(), method.method_name())
+        self.assertEqual(task.tables_number(), method.tables_number())
+        self.assertEqual(task.current_iteration(), method.current_iteration())
+        self.assertEqual(task.p0(), method.p0())
+        self.assertEqual(task.solution(), method.solution())
+        self.assertEqual(task.pricing_rule(), method.pricing_rule())
+
+        for index in range(method.tables_number()):
+            self.assertEqual(snapshot(task.get_table(index)), snapshot(method.get_table(index)))
+
+    def test_round_trip(self):
+        for method_class in [SimplexMethod, ArtificialBasisMethod]:
+            for fractional in [True, False]:
+                for compressed in [False, True]:
+                    for seed in range(5):
+                        with self.subTest(method = method_class.__name__, fractional = fractional, compressed = compressed, seed = seed):
+                            method = create_method(method_class, *task(seed, fractional), fractional = fractional)
+                            method.auto_solve()
+
+                            file = io.BytesIO()
+                            dump_task(file, method, compressed)
+                            file.seek(0)
+
+                            self.assert_same_task(load_task(file), method)
+
+    def test_written_while_solving(self):
+        """File written table by table during solving is the same as file written after it"""
+        for method_class in [SimplexMethod, ArtificialBasisMethod]:
+            for seed in range(5):
+                with self.subTest(method = method_class.__name__, seed = seed):
+                    task_file = io.BytesIO()
+                    method = create_method(method_class, *task(seed), fractional = True, task_file = task_file)
+                    method.auto_solve()
+
+                    file = io.BytesIO()
+                    dump_task(file, method)
+
+                    self.assertEqual(task_file.getvalue(), file.getvalue())
+
+    def test_written_without_history(self):
+        """Tables that are not kept in memory are still written to file"""
+        for method_class in [SimplexMethod, ArtificialBasisMethod]:
+            for mode in ["in_place", TableHistory.RING, TableHistory.PIVOTS]:
+                for seed in range(5):
+                    with self.subTest(method = method_class.__name__, mode = mode, seed = seed):
+                        options = {"keep_history": False} if mode == "in_place" else {"history": TableHistory(mode, size = 2)}
+                        method = create_method(method_class, *task(seed), fractional = True)
+                        method.auto_solve()
+
+                        task_file = io.BytesIO()
+                        create_method(method_class, *task(seed), fractional = True, task_file = task_file, **options).auto_solve()
+                        task_file.seek(0)
+
+                        self.assert_same_task(load_task(task_file), method)
+
+    def test_examples(self):
+        for name, method_name, tables_number in [("task.task", "artificial", 5), ("task_2.task", "simplex", None)]:
+            with self.subTest(name = name):
+                with open(os.path.join(EXAMPLES, name), "rb") as file:
+                    task = load_task_from_file(file)
+
+                    self.assertEqual(task.method_name(), method_name)
+                    self.assertEqual(task.p0(), -5)
+                    self.assertTrue(task.last_table().first_statement())
+
+                    if tables_number is not None:
+                        self.assertEqual(task.tables_number(), tables_number)
+
+    def test_not_task_file(self):
+        with self.assertRaises(TaskFileError):
+            load_task(io.BytesIO(b"not a task file at all"))
+
+        self.assertIsNone(load_task_from_file(io.BytesIO(b"")))
+
+if __name__ == "__main__":
+    unittest.main()
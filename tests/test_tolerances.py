@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from fractions import Fraction
+from src.exceptions.exceptions import InfeasibleTaskError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.backends.numpy_backend import NumpyBackend
+from src.simplex.revised_simplex.revised_simplex_method import RevisedSimplexMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from src.simplex.tolerances import EXACT_TOLERANCES, Tolerances, create_tolerances
+from tests.cases import random_task
+
+FLOAT_BACKENDS = ["list", "sparse"] + (["numpy"] if NumpyBackend.is_available() else [])
+
+def noisy_task(seed):
+    """Returns random task with noise about 1e-11 in matrix values and exact optimum of the task without noise"""
+    matrix, func, point = random_task(seed)
+
+    exact = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+    exact.auto_solve()
+
+    generator = random.Random(seed)
+    noisy = [[value + generator.uniform(-1e-11, 1e-11) if value != 0 else value for value in row[:-1]] + row[-1:] for row in matrix]
+
+    return noisy, func, point, exact.p0() if exact.last_table().first_statement() else None
+
+class TolerancesTest(unittest.TestCase):
+    def test_default_tolerances(self):
+        self.assertIs(create_tolerances(fractional = True), EXACT_TOLERANCES)
+        self.assertTrue(create_tolerances().is_harris())
+
+        tolerances = Tolerances(primal = 1e-6)
+        self.assertIs(create_tolerances(tolerances, fractional = True), tolerances)
+
+    def test_comparisons(self):
+        tolerances = Tolerances()
+
+        self.assertFalse(tolerances.is_improving(-1e-12))
+        self.assertTrue(tolerances.is_improving(-1e-6))
+        self.assertFalse(tolerances.is_pivot(1e-12))
+        self.assertFalse(tolerances.is_negative(-1e-12))
+        self.assertTrue(tolerances.is_zero(1e-12))
+
+        self.assertTrue(EXACT_TOLERANCES.is_improving(Fraction(-1, 10**30)))
+
+    def test_harris_ratio_test(self):
+        # отношения 1 и 1 + 1e-12 почти равны: Harris выбирает больший ведущий элемент
+        entries = [(0, 1e-3, 1e-3), (1, 1.0, 1.0 + 1e-12)]
+
+        self.assertEqual(Tolerances().ratio_test(entries), 1)
+        self.assertEqual(Tolerances(harris = False).ratio_test(entries), 0)
+        self.assertIsNone(Tolerances().ratio_test([(0, 1e-12, 1.0), (1, -1.0, 1.0)]))
+
+    def test_noise_is_ignored(self):
+        for seed in range(20):
+            matrix, func, point, expected = noisy_task(seed)
+
+            for backend in FLOAT_BACKENDS:
+                with self.subTest(seed = seed, backend = backend):
+                    method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), point = list(point), backend = backend)
+                    method.auto_solve()
+
+                    self.assertEqual(method.last_table().first_statement(), expected is not None)
+
+                    if expected is not None:
+                        self.assertAlmostEqual(method.p0(), float(expected), places = 6)
+
+            with self.subTest(seed = seed, method = "revised"):
+                method = RevisedSimplexMethod(matrix = [row[:] for row in matrix], func = list(func), point = list(point))
+                method.auto_solve()
+
+                self.assertEqual(method.is_unlimited(), expected is None)
+
+                if expected is not None:
+                    self.assertAlmostEqual(method.p0(), float(expected), places = 6)
+
+    def test_given_tolerances_are_used(self):
+        # с огромным допуском двойственной допустимости ни один столбец не улучшает функцию: решение остаётся в начальной точке
+        tolerances = Tolerances(dual = 1e6)
+
+        for seed in range(10):
+            matrix, func, point = random_task(seed)
+
+            with self.subTest(seed = seed):
+                method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), point = list(point), tolerances = tolerances)
+                method.auto_solve()
+                self.assertEqual(method.current_iteration(), 0)
+
+                method = RevisedSimplexMethod(matrix = [row[:] for row in matrix], func = list(func), point = list(point), tolerances = tolerances)
+                method.auto_solve()
+                self.assertEqual(method.current_iteration(), 0)
+
+                # искусственные переменные тоже не выводятся из базиса
+                with self.assertRaises(InfeasibleTaskError):
+                    ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = list(func), tolerances = tolerances).auto_solve()
+
+if __name__ == "__main__":
+    unittest.main()
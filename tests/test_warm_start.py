@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from src.exceptions.exceptions import InfeasibleTaskError, UnsolvedTaskError
+from src.simplex.artificial_basis.artificial_basis_method import ArtificialBasisMethod
+from src.simplex.simplex_method.simplex_method import SimplexMethod
+from tests.cases import random_task
+
+def cold_solve(matrix, func):
+    """Returns p0 of task solved from scratch, None if it is unbounded and **InfeasibleTaskError** if it is infeasible"""
+    method = ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True)
+    method.auto_solve()
+
+    if not method.simplex_method().last_table().first_statement():
+        return None
+
+    return method.p0()
+
+def warm_solve(matrix, func, warm_start, method = SimplexMethod):
+    solver = method(matrix = [row[:] for row in matrix], func = list(func), fractional = True, warm_start = warm_start)
+    solver.auto_solve()
+
+    last_table = solver.last_table() if method is SimplexMethod else solver.simplex_method().last_table()
+
+    return solver.p0() if last_table.first_statement() else None
+
+def solved_task(seed):
+    matrix, func, point = random_task(seed)
+    method = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True, point = list(point))
+    method.auto_solve()
+
+    return method, matrix, func
+
+class WarmStartTest(unittest.TestCase):
+    def test_warm_start_must_be_solved(self):
+        matrix, func, point = random_task(0)
+        unsolved = SimplexMethod(matrix = [row[:] for row in matrix], func = list(func), point = list(point))
+
+        with self.assertRaises(UnsolvedTaskError):
+            SimplexMethod(matrix = matrix, func = func, warm_start = unsolved).auto_solve()
+
+    def test_changed_goal_function(self):
+        for method in [SimplexMethod, ArtificialBasisMethod]:
+            for seed in range(30):
+                warm_start, matrix, func = solved_task(seed)
+
+                generator = random.Random(seed)
+                new_func = [generator.randint(-5, 3) for _ in range(8)] + func[8:]
+
+                with self.subTest(seed = seed, method = method.__name__):
+                    self.assertEqual(warm_solve(matrix, new_func, warm_start, method), cold_solve(matrix, new_func))
+
+    def test_changed_free_member(self):
+        for method in [SimplexMethod, ArtificialBasisMethod]:
+            for seed in range(30):
+                warm_start, matrix, func = solved_task(seed)
+
+                if not warm_start.last_table().first_statement():
+                    continue
+
+                generator = random.Random(seed)
+                new_matrix = [row[:-1] + [generator.randint(-5, 20)] for row in matrix]
+
+                with self.subTest(seed = seed, method = method.__name__):
+                    try:
+                        expected = cold_solve(new_matrix, func)
+                    except InfeasibleTaskError:
+                        with self.assertRaises(InfeasibleTaskError):
+                            warm_solve(new_matrix, func, warm_start, method)
+                        continue
+
+                    self.assertEqual(warm_solve(new_matrix, func, warm_start, method), expected)
+
+    def test_infeasible_after_warm_start(self):
+        # x1 + x2 <= 4 и x1 + x2 >= 2, затем x1 + x2 >= 6
+        matrix = [[1, 1, 1, 0, 4], [1, 1, 0, -1, 2]]
+        func = [1, 2, 0, 0]
+
+        warm_start = ArtificialBasisMethod(matrix = [row[:] for row in matrix], func = list(func), fractional = True)
+        warm_start.auto_solve()
+        self.assertEqual(warm_start.p0(), 2)
+
+        matrix[1][-1] = 6
+
+        with self.assertRaises(InfeasibleTaskError):
+            SimplexMethod(matrix = matrix, func = func, fractional = True, warm_start = warm_start).auto_solve()
+
+    def test_basis_names(self):
+        for seed in range(10):
+            warm_start, matrix, func = solved_task(seed)
+
+            with self.subTest(seed = seed):
+                self.assertEqual(warm_solve(matrix, func, warm_start.last_table().row_variables()), cold_solve(matrix, func))
+
+if __name__ == "__main__":
+    unittest.main()